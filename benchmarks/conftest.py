@@ -0,0 +1,181 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from benchmarks.runner import BenchmarkReport
+from benchmarks.runner import BenchmarkRunner
+from project.app import create_app
+from project.components.object_storage.policy import get_policy_manager
+from project.components.project.dependencies import get_object_storage_manager
+from project.components.project.dependencies import get_project_provisioner
+from project.components.project.models import Project
+from project.config import get_settings
+from project.dependencies import get_db_engine
+from project.dependencies import get_s3_client
+from project.services.auth import get_auth_client
+from project.services.metadata import get_metadata_client
+
+pytest_plugins = [
+    'tests.fixtures.components.project',
+    'tests.fixtures.components.resource_request',
+    'tests.fixtures.components.workbench',
+    'tests.fixtures.app',
+    'tests.fixtures.db',
+    'tests.fixtures.fake',
+    'tests.fixtures.s3',
+]
+
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+SEED_CODE_PREFIX = 'bench'
+
+report = BenchmarkReport()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup('benchmark')
+    group.addoption('--benchmark-projects', type=int, default=10000, help='Number of seeded projects.')
+    group.addoption(
+        '--benchmark-resource-requests', type=int, default=10000, help='Number of seeded resource requests.'
+    )
+    group.addoption('--benchmark-iterations', type=int, default=200, help='Number of requests per benchmark.')
+    group.addoption('--benchmark-concurrency', type=int, default=1, help='Number of concurrent requests.')
+    group.addoption('--benchmark-baseline', type=Path, default=BASELINE_PATH, help='Path to stored baseline.')
+    group.addoption('--benchmark-save-baseline', action='store_true', help='Store results as the new baseline.')
+    group.addoption(
+        '--benchmark-tolerance', type=float, default=0.25, help='Allowed latency increase compared to the baseline.'
+    )
+
+
+def pytest_terminal_summary(config: pytest.Config) -> None:
+    if not report.results:
+        return
+
+    baseline_path = config.getoption('--benchmark-baseline')
+    baseline = report.load_baseline(baseline_path)
+
+    writer = config.get_terminal_writer()
+    writer.sep('=', 'benchmarks')
+    for line in report.format(baseline):
+        writer.line(line)
+
+    for regression in report.get_regressions(baseline, config.getoption('--benchmark-tolerance')):
+        writer.line(f'REGRESSION {regression}', red=True)
+
+    if config.getoption('--benchmark-save-baseline'):
+        report.save_baseline(baseline_path)
+        writer.line(f'baseline saved to {baseline_path}')
+
+
+@pytest.fixture(scope='session')
+def benchmark_scale(request) -> dict[str, int]:
+    return {
+        'projects': request.config.getoption('--benchmark-projects'),
+        'resource_requests': request.config.getoption('--benchmark-resource-requests'),
+    }
+
+
+@pytest.fixture(scope='session')
+async def seeded_database(db_engine, benchmark_scale) -> dict[str, int]:
+    """Insert projects and resource requests in bulk directly with SQL, so large volumes are seeded quickly."""
+
+    parameters = {'prefix': SEED_CODE_PREFIX} | benchmark_scale
+
+    async with db_engine.begin() as connection:
+        await connection.execute(
+            text(
+                'INSERT INTO project.projects '
+                '(id, code, name, description, tags, system_tags, is_discoverable, created_at, updated_at) '
+                "SELECT gen_random_uuid(), :prefix || i, 'Benchmark project ' || i, 'Project number ' || i, "
+                "ARRAY['tag' || i % 50, 'tag' || i % 7], ARRAY['system' || i % 5], i % 2 = 0, "
+                "now() - i * interval '1 second', now() "
+                'FROM generate_series(1, :projects) AS i'
+            ),
+            parameters,
+        )
+        await connection.execute(
+            text(
+                'INSERT INTO project.resource_requests '
+                '(id, project_id, user_id, username, email, requested_for, requested_at, updated_at) '
+                "SELECT gen_random_uuid(), p.id, 'user' || i, 'user' || i % 1000, "
+                "'user' || i % 1000 || '@example.com', 'guacamole', now() - i * interval '1 second', now() "
+                'FROM generate_series(1, :resource_requests) AS i '
+                'JOIN project.projects AS p ON p.code = :prefix || (i % :projects + 1)'
+            ),
+            parameters,
+        )
+        await connection.execute(text('ANALYZE project.projects, project.resource_requests'))
+
+    yield benchmark_scale
+
+    async with db_engine.begin() as connection:
+        await connection.execute(
+            text('DELETE FROM project.projects WHERE code LIKE :pattern'), {'pattern': f'{SEED_CODE_PREFIX}%'}
+        )
+
+
+@pytest.fixture(scope='session')
+async def seeded_project_ids(db_engine, seeded_database) -> list[str]:
+    async with db_engine.connect() as connection:
+        result = await connection.execute(
+            text('SELECT id FROM project.projects WHERE code LIKE :pattern ORDER BY random() LIMIT 10000'),
+            {'pattern': f'{SEED_CODE_PREFIX}%'},
+        )
+
+    return [str(id_) for id_ in result.scalars()]
+
+
+@pytest.fixture
+async def created_project_codes(settings, minio_container) -> list[str]:
+    """Collect codes of projects created by benchmark and remove their buckets and policies afterwards."""
+
+    codes = []
+    yield codes
+
+    s3_client = await get_s3_client(settings)
+    project_provisioner = get_project_provisioner(
+        get_object_storage_manager(s3_client, settings),
+        await get_policy_manager(settings),
+        get_auth_client(settings),
+        get_metadata_client(settings),
+    )
+    for code in codes:
+        await project_provisioner.rollback(Project(code=code))
+
+
+@pytest.fixture
+def benchmark_app(event_loop, settings, seeded_database) -> FastAPI:
+    """Application using its own database sessions, so requests can be sent concurrently."""
+
+    app = create_app()
+    app.dependency_overrides[get_settings] = lambda: settings
+    yield app
+
+
+@pytest.fixture
+async def benchmark_client(benchmark_app) -> AsyncClient:
+    async with AsyncClient(app=benchmark_app, base_url='https://project') as client:
+        yield client
+
+    await get_db_engine.dispose()
+
+
+@pytest.fixture
+def benchmark_runner(request) -> BenchmarkRunner:
+    return BenchmarkRunner(
+        iterations=request.config.getoption('--benchmark-iterations'),
+        concurrency=request.config.getoption('--benchmark-concurrency'),
+    )
+
+
+@pytest.fixture
+def benchmark_report() -> BenchmarkReport:
+    return report
@@ -0,0 +1,164 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import asyncio
+import json
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable
+from collections.abc import Callable
+from pathlib import Path
+
+from httpx import Response
+from pydantic import BaseModel
+
+SendRequest = Callable[[int], Awaitable[Response]]
+
+
+class BenchmarkResult(BaseModel):
+    """Measurements of a single benchmarked endpoint."""
+
+    name: str
+    iterations: int
+    concurrency: int
+    p50_ms: float
+    p99_ms: float
+    rps: float
+    allocated_kib: float
+
+
+class BenchmarkRunner:
+    """Send requests to the application and measure latency, throughput and memory allocations.
+
+    Latency and throughput are measured first with the requested concurrency. Allocations are measured separately on a
+    few sequential requests, since tracing memory slows down the application considerably.
+    """
+
+    def __init__(self, iterations: int, concurrency: int, warmup: int = 5, traced_iterations: int = 10) -> None:
+        self.iterations = iterations
+        self.concurrency = concurrency
+        self.warmup = warmup
+        self.traced_iterations = traced_iterations
+
+    async def _send(self, send: SendRequest, iteration: int) -> float:
+        start = time.perf_counter()
+        response = await send(iteration)
+        elapsed = time.perf_counter() - start
+
+        if response.status_code >= 400:
+            raise AssertionError(f'unexpected response {response.status_code}: {response.text}')
+
+        return elapsed
+
+    async def _measure_latencies(self, send: SendRequest, offset: int, iterations: int) -> tuple[list[float], float]:
+        queue = iter(range(offset, offset + iterations))
+        latencies = []
+
+        async def worker() -> None:
+            for iteration in queue:
+                latencies.append(await self._send(send, iteration))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        elapsed = time.perf_counter() - start
+
+        return latencies, elapsed
+
+    async def _measure_allocations(self, send: SendRequest, offset: int) -> float:
+        peaks = []
+
+        tracemalloc.start()
+        try:
+            for iteration in range(offset, offset + self.traced_iterations):
+                current, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                await self._send(send, iteration)
+                _, peak = tracemalloc.get_traced_memory()
+                peaks.append(peak - current)
+        finally:
+            tracemalloc.stop()
+
+        return statistics.median(peaks) / 1024
+
+    async def run(self, name: str, send: SendRequest, iterations: int | None = None) -> BenchmarkResult:
+        """Benchmark requests produced by send callable.
+
+        The callable receives the number of iteration, which is unique across warmup, measured and traced requests.
+        """
+
+        iterations = iterations or self.iterations
+
+        for iteration in range(self.warmup):
+            await self._send(send, iteration)
+
+        latencies, elapsed = await self._measure_latencies(send, self.warmup, iterations)
+        allocated_kib = await self._measure_allocations(send, self.warmup + iterations)
+
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+
+        return BenchmarkResult(
+            name=name,
+            iterations=iterations,
+            concurrency=self.concurrency,
+            p50_ms=round(percentiles[49] * 1000, 3),
+            p99_ms=round(percentiles[98] * 1000, 3),
+            rps=round(iterations / elapsed, 1),
+            allocated_kib=round(allocated_kib, 1),
+        )
+
+
+class BenchmarkReport:
+    """Collect benchmark results and compare them with the stored baseline."""
+
+    def __init__(self) -> None:
+        self.results: dict[str, BenchmarkResult] = {}
+
+    def add(self, result: BenchmarkResult) -> None:
+        self.results[result.name] = result
+
+    @staticmethod
+    def load_baseline(path: Path) -> dict[str, BenchmarkResult]:
+        if not path.is_file():
+            return {}
+
+        return {name: BenchmarkResult.parse_obj(result) for name, result in json.loads(path.read_text()).items()}
+
+    def save_baseline(self, path: Path) -> None:
+        baseline = self.load_baseline(path)
+        baseline.update(self.results)
+        content = {name: result.dict() for name, result in sorted(baseline.items())}
+
+        path.write_text(json.dumps(content, indent=4) + '\n')
+
+    def get_regressions(self, baseline: dict[str, BenchmarkResult], tolerance: float) -> list[str]:
+        """Return descriptions of latency measurements exceeding the baseline by more than tolerance."""
+
+        regressions = []
+        for name, result in self.results.items():
+            if name not in baseline:
+                continue
+
+            for metric in ('p50_ms', 'p99_ms'):
+                value = getattr(result, metric)
+                baseline_value = getattr(baseline[name], metric)
+                if value > baseline_value * (1 + tolerance):
+                    regressions.append(f'{name} {metric}: {value} > {baseline_value} (+{tolerance:.0%})')
+
+        return regressions
+
+    def format(self, baseline: dict[str, BenchmarkResult]) -> list[str]:
+        """Return lines of the table with results along with baseline values."""
+
+        lines = [f'{"benchmark":<48} {"p50 ms":>10} {"p99 ms":>10} {"rps":>10} {"KiB/req":>10} {"base p50":>10}']
+        for name, result in sorted(self.results.items()):
+            baseline_p50 = f'{baseline[name].p50_ms:.3f}' if name in baseline else '-'
+            lines.append(
+                f'{name:<48} {result.p50_ms:>10.3f} {result.p99_ms:>10.3f} {result.rps:>10.1f} '
+                f'{result.allocated_kib:>10.1f} {baseline_p50:>10}'
+            )
+
+        return lines
@@ -0,0 +1,75 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import pytest
+
+
+class TestProjectBenchmarks:
+    @pytest.mark.parametrize(
+        'name,params',
+        [
+            ('list_projects', {}),
+            ('list_projects_page_size_1000', {'page_size': 1000}),
+            ('list_projects_sorted_by_name', {'sort_by': 'name', 'sort_order': 'desc'}),
+            ('list_projects_search', {'q': 'project 12'}),
+            ('list_projects_tags_any', {'tags_any': 'tag1,tag2'}),
+            ('list_projects_fields', {'fields': 'id,code', 'page_size': 1000}),
+        ],
+    )
+    async def test_list_projects(self, name, params, benchmark_client, benchmark_runner, benchmark_report):
+        async def send(iteration):
+            return await benchmark_client.get('/v1/projects/', params=params)
+
+        benchmark_report.add(await benchmark_runner.run(name, send))
+
+    async def test_get_project(self, benchmark_client, benchmark_runner, benchmark_report, seeded_project_ids):
+        async def send(iteration):
+            project_id = seeded_project_ids[iteration % len(seeded_project_ids)]
+            return await benchmark_client.get(f'/v1/projects/{project_id}')
+
+        benchmark_report.add(await benchmark_runner.run('get_project', send))
+
+    async def test_get_project_cached(self, benchmark_client, benchmark_runner, benchmark_report, seeded_project_ids):
+        async def send(iteration):
+            return await benchmark_client.get(f'/v1/projects/{seeded_project_ids[0]}')
+
+        benchmark_report.add(await benchmark_runner.run('get_project_cached', send))
+
+    async def test_create_project(
+        self, benchmark_client, benchmark_runner, benchmark_report, settings, httpx_mock, created_project_codes, fake
+    ):
+        httpx_mock.add_response(method='POST', url=settings.AUTH_SERVICE + '/v1/user/group')
+        httpx_mock.add_response(method='POST', url=settings.AUTH_SERVICE + '/v1/admin/users/realm-roles')
+        httpx_mock.add_response(method='POST', url=settings.AUTH_SERVICE + '/v1/defaultroles')
+        httpx_mock.add_response(
+            method='POST', url=settings.AUTH_SERVICE + '/v1/admin/roles/users', json={'result': [{'name': 'admin'}]}
+        )
+        httpx_mock.add_response(method='POST', url=settings.METADATA_SERVICE + '/v1/items/batch/')
+        prefix = fake.pystr(min_chars=8, max_chars=8).lower()
+
+        async def send(iteration):
+            code = f'benchcreate{prefix}{iteration}'
+            response = await benchmark_client.post('/v1/projects/', json={'code': code, 'name': f'Project {iteration}'})
+            if response.status_code == 200:
+                created_project_codes.append(code)
+            return response
+
+        benchmark_report.add(
+            await benchmark_runner.run('create_project', send, max(benchmark_runner.iterations // 10, 2))
+        )
+
+    async def test_upload_project_logo(
+        self, benchmark_client, benchmark_runner, benchmark_report, seeded_project_ids, minio_container, fake
+    ):
+        payload = {'base64': fake.base64_image()}
+
+        async def send(iteration):
+            project_id = seeded_project_ids[iteration % len(seeded_project_ids)]
+            return await benchmark_client.post(f'/v1/projects/{project_id}/logo', json=payload)
+
+        benchmark_report.add(
+            await benchmark_runner.run('upload_project_logo', send, max(benchmark_runner.iterations // 10, 2))
+        )
@@ -0,0 +1,32 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import pytest
+
+
+class TestResourceRequestBenchmarks:
+    @pytest.mark.parametrize(
+        'name,params',
+        [
+            ('list_resource_requests', {}),
+            ('list_resource_requests_by_project_code', {'project_code': 'bench1'}),
+            ('list_resource_requests_by_username', {'username': 'user1'}),
+            ('list_resource_requests_sorted_by_project_name', {'sort_by': 'project.name'}),
+        ],
+    )
+    async def test_list_resource_requests(self, name, params, benchmark_client, benchmark_runner, benchmark_report):
+        async def send(iteration):
+            return await benchmark_client.get('/v1/resource-requests/', params=params)
+
+        benchmark_report.add(await benchmark_runner.run(name, send))
+
+    async def test_export_resource_requests(self, benchmark_client, benchmark_runner, benchmark_report):
+        async def send(iteration):
+            return await benchmark_client.get('/v1/resource-requests/export', params={'format': 'csv'})
+
+        benchmark_report.add(
+            await benchmark_runner.run('export_resource_requests', send, max(benchmark_runner.iterations // 50, 2))
+        )
@@ -0,0 +1,38 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+"""Add updated_at to resource requests and workbenches models.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 11:29:54.502000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = '0009'
+
+
+def upgrade():
+    op.add_column(
+        'resource_requests',
+        sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema='project',
+    )
+    op.add_column(
+        'workbenches',
+        sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema='project',
+    )
+
+
+def downgrade():
+    op.drop_column('workbenches', 'updated_at', schema='project')
+    op.drop_column('resource_requests', 'updated_at', schema='project')
@@ -0,0 +1,50 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+"""Add search vector to project model.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 11:45:08.345000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = '0010'
+
+
+def upgrade():
+    op.add_column(
+        'projects',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', code), 'A') || setweight(to_tsvector('simple', name), 'B') || "
+                "setweight(to_tsvector('simple', description), 'C')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+        schema='project',
+    )
+    op.create_index(
+        'ix_project_projects_search_vector',
+        'projects',
+        ['search_vector'],
+        unique=False,
+        schema='project',
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    op.drop_index('ix_project_projects_search_vector', table_name='projects', schema='project')
+    op.drop_column('projects', 'search_vector', schema='project')
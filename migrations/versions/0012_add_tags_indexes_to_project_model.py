@@ -0,0 +1,37 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+"""Add indexes on tags and system_tags in project model.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 11:48:43.796000
+"""
+
+from alembic import op
+
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = '0011'
+
+
+def upgrade():
+    op.create_index(
+        'ix_project_projects_tags', 'projects', ['tags'], unique=False, schema='project', postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_project_projects_system_tags',
+        'projects',
+        ['system_tags'],
+        unique=False,
+        schema='project',
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    op.drop_index('ix_project_projects_system_tags', table_name='projects', schema='project')
+    op.drop_index('ix_project_projects_tags', table_name='projects', schema='project')
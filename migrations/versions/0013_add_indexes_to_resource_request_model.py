@@ -0,0 +1,61 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+"""Add indexes for filtering and sorting resource requests.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18 11:50:43.547000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = '0012'
+
+
+def upgrade():
+    op.create_index(
+        'ix_project_resource_requests_project_id_requested_at',
+        'resource_requests',
+        ['project_id', 'requested_at'],
+        unique=False,
+        schema='project',
+    )
+    op.create_index(
+        'ix_project_resource_requests_requested_at',
+        'resource_requests',
+        ['requested_at'],
+        unique=False,
+        schema='project',
+    )
+    op.create_index(
+        'ix_project_resource_requests_lower_username',
+        'resource_requests',
+        [sa.text('lower(username)')],
+        unique=False,
+        schema='project',
+    )
+    op.create_index(
+        'ix_project_resource_requests_lower_email',
+        'resource_requests',
+        [sa.text('lower(email)')],
+        unique=False,
+        schema='project',
+    )
+    op.create_index(op.f('ix_project_projects_name'), 'projects', ['name'], unique=False, schema='project')
+
+
+def downgrade():
+    op.drop_index(op.f('ix_project_projects_name'), table_name='projects', schema='project')
+    op.drop_index('ix_project_resource_requests_lower_email', table_name='resource_requests', schema='project')
+    op.drop_index('ix_project_resource_requests_lower_username', table_name='resource_requests', schema='project')
+    op.drop_index('ix_project_resource_requests_requested_at', table_name='resource_requests', schema='project')
+    op.drop_index(
+        'ix_project_resource_requests_project_id_requested_at', table_name='resource_requests', schema='project'
+    )
@@ -0,0 +1,57 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+"""Add project_id index to workbenches and cascade deletes of projects.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18 11:52:02.471000
+"""
+
+from alembic import op
+
+revision = '0014'
+down_revision = '0013'
+branch_labels = None
+depends_on = '0013'
+
+
+def upgrade():
+    op.create_index(
+        'ix_project_workbenches_project_id_deployed_at',
+        'workbenches',
+        ['project_id', 'deployed_at'],
+        unique=False,
+        schema='project',
+    )
+
+    for table_name in ('resource_requests', 'workbenches'):
+        op.drop_constraint(f'{table_name}_project_id_fkey', table_name, type_='foreignkey', schema='project')
+        op.create_foreign_key(
+            f'{table_name}_project_id_fkey',
+            table_name,
+            'projects',
+            ['project_id'],
+            ['id'],
+            source_schema='project',
+            referent_schema='project',
+            ondelete='CASCADE',
+        )
+
+
+def downgrade():
+    for table_name in ('workbenches', 'resource_requests'):
+        op.drop_constraint(f'{table_name}_project_id_fkey', table_name, type_='foreignkey', schema='project')
+        op.create_foreign_key(
+            f'{table_name}_project_id_fkey',
+            table_name,
+            'projects',
+            ['project_id'],
+            ['id'],
+            source_schema='project',
+            referent_schema='project',
+        )
+
+    op.drop_index('ix_project_workbenches_project_id_deployed_at', table_name='workbenches', schema='project')
@@ -13,11 +13,15 @@ from fastapi.requests import Request
 from fastapi.responses import JSONResponse
 from opentelemetry import trace
 from opentelemetry.exporter.jaeger.thrift import JaegerExporter
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.resources import SERVICE_NAME
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased
+from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
 from pydantic import ValidationError
 
 from project.components.exceptions import ServiceException
@@ -25,10 +29,17 @@ from project.components.exceptions import ServiceValidationError
 from project.components.exceptions import UnhandledException
 from project.components.health import health_router
 from project.components.project import project_router
+from project.components.project.dependencies import get_project_cache
 from project.components.resource_request import resource_request_router
 from project.components.workbench import workbench_router
 from project.config import Settings
 from project.config import get_settings
+from project.dependencies import get_db_engine
+from project.dependencies import get_s3_client
+from project.dependencies import http_client_registry
+from project.logger import logger
+from project.metrics import MetricsMiddleware
+from project.metrics import metrics_router
 
 
 def create_app() -> FastAPI:
@@ -47,6 +58,7 @@ def create_app() -> FastAPI:
     setup_logging(settings)
     setup_routers(app)
     setup_middlewares(app, settings)
+    setup_metrics(app, settings)
     setup_dependencies(app, settings)
     setup_exception_handlers(app)
     setup_tracing(app, settings)
@@ -81,15 +93,44 @@ def setup_middlewares(app: FastAPI, settings: Settings) -> None:
     )
 
 
+def setup_metrics(app: FastAPI, settings: Settings) -> None:
+    """Expose Prometheus metrics and record them for every request."""
+
+    if not settings.METRICS_ENABLED:
+        return
+
+    app.include_router(metrics_router, prefix='/v1')
+    app.add_middleware(MetricsMiddleware)
+
+
 def setup_dependencies(app: FastAPI, settings: Settings) -> None:
     """Perform dependencies setup/teardown at the application startup/shutdown events."""
 
     app.add_event_handler('startup', partial(startup_event, settings))
+    app.add_event_handler('shutdown', shutdown_event)
 
 
 async def startup_event(settings: Settings) -> None:
     """Initialise dependencies at the application startup event."""
 
+    await get_db_engine(settings)
+
+    try:
+        await get_db_engine.warm_up(settings.RDS_POOL_WARM_UP_SIZE)
+    except Exception:
+        logger.exception('Unable to open database connections in advance.')
+
+    await get_s3_client(settings)
+
+
+async def shutdown_event() -> None:
+    """Release dependencies at the application shutdown event."""
+
+    await get_db_engine.dispose()
+    await get_s3_client.close()
+    await http_client_registry.close()
+    await get_project_cache.close()
+
 
 def setup_exception_handlers(app: FastAPI) -> None:
     """Configure the application exception handlers."""
@@ -121,13 +162,21 @@ def setup_tracing(app: FastAPI, settings: Settings) -> None:
     if not settings.OPEN_TELEMETRY_ENABLED:
         return
 
-    tracer_provider = TracerProvider(resource=Resource.create({SERVICE_NAME: settings.APP_NAME}))
+    tracer_provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: settings.APP_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.OPEN_TELEMETRY_SAMPLE_RATE)),
+    )
     trace.set_tracer_provider(tracer_provider)
 
     FastAPIInstrumentor.instrument_app(app)
 
-    jaeger_exporter = JaegerExporter(
-        agent_host_name=settings.OPEN_TELEMETRY_HOST, agent_port=settings.OPEN_TELEMETRY_PORT
-    )
+    tracer_provider.add_span_processor(BatchSpanProcessor(create_span_exporter(settings)))
+
+
+def create_span_exporter(settings: Settings) -> SpanExporter:
+    """Create span exporter for the configured tracing backend."""
+
+    if settings.OPEN_TELEMETRY_EXPORTER == 'otlp':
+        return OTLPSpanExporter(endpoint=settings.OPEN_TELEMETRY_OTLP_ENDPOINT)
 
-    tracer_provider.add_span_processor(BatchSpanProcessor(jaeger_exporter))
+    return JaegerExporter(agent_host_name=settings.OPEN_TELEMETRY_HOST, agent_port=settings.OPEN_TELEMETRY_PORT)
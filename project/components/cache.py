@@ -0,0 +1,122 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import time
+from abc import ABCMeta
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Any
+
+from redis import asyncio as redis
+
+
+class CacheBackend(metaclass=ABCMeta):
+    """Base class for cache backends."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """Return cached value or None when key is missing or expired."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """Store value for the key."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove values for the keys."""
+
+        raise NotImplementedError
+
+    async def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Return cached values in the order of keys, None is returned for missing or expired keys."""
+
+        return [await self.get(key) for key in keys]
+
+    async def set_many(self, mapping: Mapping[str, Any]) -> None:
+        """Store values for all keys in the mapping."""
+
+        for key, value in mapping.items():
+            await self.set(key, value)
+
+    async def close(self) -> None:
+        """Release resources used by backend."""
+
+        return None
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local cache backend with LRU eviction and time to live for entries."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.entries.pop(key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend shared between service instances, values are expected to be strings."""
+
+    def __init__(self, url: str, ttl: int) -> None:
+        self.ttl = ttl
+        self.client = redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> str | None:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        await self.client.set(key, value, ex=self.ttl)
+
+    async def delete(self, *keys: str) -> None:
+        await self.client.delete(*keys)
+
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        if not keys:
+            return []
+
+        return await self.client.mget(keys)
+
+    async def set_many(self, mapping: Mapping[str, str]) -> None:
+        if not mapping:
+            return
+
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for key, value in mapping.items():
+                pipeline.set(key, value, ex=self.ttl)
+            await pipeline.execute()
+
+    async def close(self) -> None:
+        await self.client.close()
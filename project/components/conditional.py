@@ -0,0 +1,108 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import hashlib
+from collections.abc import Callable
+from collections.abc import Iterable
+from datetime import datetime
+from datetime import timezone
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request
+from fastapi import Response
+
+from project.components.pagination import Page
+
+
+def as_utc(value: datetime) -> datetime:
+    """Return datetime in UTC, naive datetime is considered to be in UTC already."""
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value.astimezone(timezone.utc)
+
+
+def get_etag(*parts: Any) -> str:
+    """Return weak entity tag calculated from the parts which define the resource representation."""
+
+    digest = hashlib.sha1('|'.join(map(str, parts)).encode(), usedforsecurity=False).hexdigest()
+
+    return f'W/"{digest}"'
+
+
+def get_fields_etag(etag: str, fields: Iterable[str] | None) -> str:
+    """Return entity tag of the representation narrowed to the specified fields."""
+
+    if not fields:
+        return etag
+
+    return get_etag(etag, *fields)
+
+
+def get_entry_version(entry: Any) -> tuple[Any, ...]:
+    """Return parts which change along with the entry representation."""
+
+    return entry.id, entry.updated_at
+
+
+def get_page_etag(page: Page, get_version: Callable[[Any], Iterable[Any]] = get_entry_version) -> str:
+    """Return weak entity tag for the page calculated from its metadata and the versions of its entries."""
+
+    parts = [page.count, page.pagination.page, page.pagination.page_size, page.next_cursor]
+    for entry in page.entries:
+        parts.extend(get_version(entry))
+
+    return get_etag(*parts)
+
+
+class ConditionalRequest:
+    """Evaluate conditional request headers against validators of the requested resource.
+
+    Used as FastAPI dependency, validators are added to the response headers.
+    """
+
+    def __init__(self, request: Request, response: Response) -> None:
+        self.request = request
+        self.response = response
+
+    def _etag_matches(self, etag: str) -> bool:
+        if_none_match = self.request.headers['if-none-match'].strip()
+        if if_none_match == '*':
+            return True
+
+        opaque_tag = etag.removeprefix('W/')
+        return any(tag.strip().removeprefix('W/') == opaque_tag for tag in if_none_match.split(','))
+
+    def _not_modified_since(self, last_modified: datetime) -> bool:
+        try:
+            modified_since = parsedate_to_datetime(self.request.headers['if-modified-since'])
+        except (TypeError, ValueError):
+            return False
+
+        return as_utc(last_modified).replace(microsecond=0) <= as_utc(modified_since)
+
+    def evaluate(self, etag: str, last_modified: datetime | None = None) -> Response | None:
+        """Return Not Modified response when the representation held by client is still valid."""
+
+        headers = {'ETag': etag}
+        if last_modified is not None:
+            headers['Last-Modified'] = format_datetime(as_utc(last_modified), usegmt=True)
+        self.response.headers.update(headers)
+
+        if 'if-none-match' in self.request.headers:
+            is_not_modified = self._etag_matches(etag)
+        elif 'if-modified-since' in self.request.headers and last_modified is not None:
+            is_not_modified = self._not_modified_since(last_modified)
+        else:
+            is_not_modified = False
+
+        if is_not_modified:
+            return Response(status_code=304, headers=headers)
+
+        return None
@@ -4,32 +4,53 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import json
+from collections.abc import AsyncIterator
+from collections.abc import Collection
+from collections.abc import Sequence
 from typing import Any
 from uuid import UUID
 
+from pydantic import parse_obj_as
+from sqlalchemy import and_
+from sqlalchemy import asc
 from sqlalchemy import delete
+from sqlalchemy import desc
 from sqlalchemy import func
 from sqlalchemy import insert
+from sqlalchemy import or_
+from sqlalchemy import tuple_
 from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.engine import Result
 from sqlalchemy.engine import ScalarResult
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql import Executable
+from sqlalchemy.sql import FromClause
+from sqlalchemy.sql import Insert
 from sqlalchemy.sql import Select
+from sqlalchemy.sql import Update
 
 from project.components.db_model import DBModel
 from project.components.exceptions import AlreadyExists
 from project.components.exceptions import NotFound
 from project.components.exceptions import ServiceException
+from project.components.exceptions import ServiceValidationError
 from project.components.exceptions import UnhandledException
+from project.components.explain import Explain
 from project.components.filtering import Filtering
+from project.components.pagination import Cursor
 from project.components.pagination import Page
 from project.components.pagination import Pagination
+from project.components.pagination import PaginationTotal
 from project.components.schemas import BaseSchema
 from project.components.sorting import Sorting
+from project.components.sorting import SortingOrder
 
 
 class CRUD:
@@ -41,6 +62,8 @@ class CRUD:
         '23503': NotFound(),  # missing foreign key
         '23505': AlreadyExists(),  # duplicated entry
     }
+    required_columns: tuple[str, ...] = ('id', 'updated_at')
+    field_columns: dict[str, tuple[str, ...]] = {}
 
     def __init__(self, db_session: AsyncSession) -> None:
         self.session = db_session
@@ -66,6 +89,11 @@ class CRUD:
         """Create base select."""
         return select(self.model)
 
+    @property
+    def from_clause(self) -> FromClause:
+        """Return selectable the filtering is applied to when entries are counted."""
+        return self.model.__table__
+
     async def execute(self, statement: Executable, **kwds: Any) -> CursorResult | Result:
         """Execute a statement and return buffered result."""
 
@@ -76,18 +104,58 @@ class CRUD:
 
         return await self.session.scalars(statement, **kwds)
 
-    async def _create_one(self, statement: Executable) -> UUID | str:
-        """Execute a statement to create one entry."""
+    def _raise_db_error(self, e: Exception) -> None:
+        """Raise service exception corresponding to the database error."""
+
+        if isinstance(e, DBAPIError):
+            pg_code = e.orig.pgcode
+            if pg_code in self.db_error_codes:
+                raise self.db_error_codes.get(pg_code)
+        raise UnhandledException()
+
+    def _apply_fields(self, statement: Select, fields: Collection[str] | None, *columns: str | None) -> Select:
+        """Return statement loading only model columns required to represent specified response fields.
+
+        Columns used by the service itself and additionally specified ones are always loaded.
+        """
+
+        if not fields:
+            return statement
+
+        names = {*self.required_columns, *filter(None, columns)}
+        for field in fields:
+            names.update(self.field_columns.get(field, (field,)))
+
+        table_columns = self.model.__table__.columns
+        model_columns = [getattr(self.model, name) for name in sorted(names) if name in table_columns]
+
+        return statement.options(load_only(*model_columns))
+
+    def _select_returning(self, statement: Insert | Update) -> Select:
+        """Return select which loads entries from the rows returned by insert or update statement.
+
+        Entries are hydrated from the same statement, so no additional select is required after the write.
+        """
+
+        statement = statement.returning(*self.model.__table__.columns)
+
+        return select(self.model).from_statement(statement).execution_options(populate_existing=True)
+
+    async def _create_one(self, statement: Insert) -> DBModel:
+        """Execute a statement to create one entry and return it."""
 
         try:
-            result = await self.execute(statement)
-            return result.inserted_primary_key.id
+            return await self._retrieve_one(self._select_returning(statement))
+        except Exception as e:
+            self._raise_db_error(e)
+
+    async def _create_many(self, statement: Insert) -> list[DBModel]:
+        """Execute a statement to create multiple entries and return them."""
+
+        try:
+            return await self._retrieve_many(self._select_returning(statement))
         except Exception as e:
-            if isinstance(e, DBAPIError):
-                pg_code = e.orig.pgcode
-                if pg_code in self.db_error_codes:
-                    raise self.db_error_codes.get(pg_code)
-            raise UnhandledException()
+            self._raise_db_error(e)
 
     async def _retrieve_one(self, statement: Executable) -> DBModel:
         """Execute a statement to retrieve one entry."""
@@ -100,21 +168,54 @@ class CRUD:
 
         return instance
 
-    async def _retrieve_many(self, statement: Executable) -> list[DBModel]:
-        """Execute a statement to retrieve multiple entries."""
+    async def _retrieve_many(self, statement: Executable, chunk_size: int | None = None) -> list[DBModel]:
+        """Execute a statement to retrieve multiple entries.
 
-        result = await self.scalars(statement)
-        instances = result.all()
+        When chunk size is specified rows are fetched through server side cursor in batches of that size, so the driver
+        never buffers the whole result at once.
+        """
+
+        if not chunk_size:
+            result = await self.scalars(statement)
+            return result.all()
+
+        result = await self.session.stream_scalars(statement.execution_options(yield_per=chunk_size))
+        instances = []
+        async for partition in result.partitions(chunk_size):
+            instances.extend(partition)
 
         return instances
 
-    async def _update_one(self, statement: Executable) -> None:
-        """Execute a statement to update one entry."""
+    async def _retrieve_many_with_total(
+        self, statement: Select, chunk_size: int | None = None
+    ) -> tuple[list[DBModel], int | None]:
+        """Execute a statement to retrieve multiple entries along with the total number of matching rows.
+
+        The total is calculated by window function within the same query, so it is unknown when no rows are returned.
+        """
+
+        statement = statement.add_columns(func.count().over())
+        if chunk_size:
+            result = await self.session.stream(statement.execution_options(yield_per=chunk_size))
+            rows = []
+            async for partition in result.partitions(chunk_size):
+                rows.extend(partition)
+        else:
+            result = await self.execute(statement)
+            rows = result.all()
 
-        result = await self.execute(statement)
+        if not rows:
+            return [], None
 
-        if result.rowcount == 0:
-            raise NotFound()
+        instances = [row[0] for row in rows]
+        total = rows[0][1]
+
+        return instances, total
+
+    async def _update_one(self, statement: Update) -> DBModel:
+        """Execute a statement to update one entry and return it."""
+
+        return await self._retrieve_one(self._select_returning(statement))
 
     async def _delete_one(self, statement: Executable) -> None:
         """Execute a statement to delete one entry."""
@@ -129,16 +230,27 @@ class CRUD:
 
         values = entry_create.dict()
         statement = insert(self.model).values(**(values | kwds))
-        entry_id = await self._create_one(statement)
-
-        entry = await self.retrieve_by_id(entry_id)
+        entry = await self._create_one(statement)
 
         return entry
 
-    async def retrieve_by_id(self, id_: UUID) -> DBModel:
+    async def create_many(self, entries_create: Sequence[BaseSchema], **kwds: Any) -> list[DBModel]:
+        """Create multiple entries with a single multi-row insert.
+
+        Entries conflicting with existing ones on unique constraints are skipped, so only created entries are returned.
+        """
+
+        values = [entry_create.dict() | kwds for entry_create in entries_create]
+        statement = postgresql.insert(self.model).values(values).on_conflict_do_nothing()
+        entries = await self._create_many(statement)
+
+        return entries
+
+    async def retrieve_by_id(self, id_: UUID, fields: Collection[str] | None = None) -> DBModel:
         """Get an existing entry by id (primary key)."""
 
         statement = self.select_query.where(self.model.id == id_)
+        statement = self._apply_fields(statement, fields)
         entry = await self._retrieve_one(statement)
 
         return entry
@@ -151,33 +263,162 @@ class CRUD:
 
         return entries
 
+    def _apply_cursor(self, statement: Select, cursor: Cursor, sorting: Sorting | None = None) -> Select:
+        """Return statement narrowed to entries located after the cursor position.
+
+        Entries are expected to be ordered by sorting field with id as a tiebreaker, so the position is defined by the
+        (key, id) pair and can be resolved by index seek instead of scanning all preceding rows.
+        """
+
+        order = sorting.order if sorting is not None else SortingOrder.ASC
+        field = sorting.field if sorting else None
+        if cursor.field != field or cursor.order != order:
+            raise ServiceValidationError(
+                errors=[{'msg': 'cursor does not match sorting parameters', 'loc': ['cursor']}]
+            )
+
+        id_column = self.model.id
+        is_ascending = order is SortingOrder.ASC
+
+        if not sorting:
+            return statement.where(id_column > cursor.id if is_ascending else id_column < cursor.id)
+
+        column = sorting.get_column(self.model)
+        key = None if cursor.key is None else parse_obj_as(column.type.python_type, cursor.key)
+
+        if key is None:
+            # NULLs are placed after all values in ascending order and before them in descending order.
+            after_id = id_column > cursor.id if is_ascending else id_column < cursor.id
+            condition = and_(column.is_(None), after_id)
+            if not is_ascending:
+                condition = or_(condition, column.is_not(None))
+            return statement.where(condition)
+
+        position = tuple_(column, id_column)
+        condition = position > (key, cursor.id) if is_ascending else position < (key, cursor.id)
+        if is_ascending and column.nullable:
+            condition = or_(condition, column.is_(None))
+
+        return statement.where(condition)
+
+    def _apply_ordering(
+        self, statement: Select, sorting: Sorting | None = None, ranking: ColumnElement | None = None
+    ) -> Select:
+        """Return statement ordered by sorting field or by descending ranking, with id as the last criteria."""
+
+        if sorting:
+            statement = sorting.apply(statement, self.model)
+        elif ranking is not None:
+            statement = statement.order_by(desc(ranking))
+
+        order_by_id = asc(self.model.id)
+        if sorting is not None and sorting.order is SortingOrder.DESC:
+            order_by_id = desc(self.model.id)
+
+        return statement.order_by(order_by_id)
+
+    async def count(self, filtering: Filtering | None = None) -> int:
+        """Get exact number of existing entries."""
+
+        statement = select(func.count()).select_from(self.from_clause)
+        if filtering:
+            statement = filtering.apply(statement, self.model)
+        count = await self._retrieve_one(statement)
+
+        return count
+
+    async def estimate_count(self, filtering: Filtering | None = None) -> int:
+        """Get number of existing entries estimated by the query planner without scanning the table."""
+
+        statement = select(self.model.id).select_from(self.from_clause)
+        if filtering:
+            statement = filtering.apply(statement, self.model)
+        result = await self.execute(Explain(statement))
+
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]['Plan']['Plan Rows'])
+
     async def paginate(
-        self, pagination: Pagination, sorting: Sorting | None = None, filtering: Filtering | None = None
+        self,
+        pagination: Pagination,
+        sorting: Sorting | None = None,
+        filtering: Filtering | None = None,
+        fields: Collection[str] | None = None,
     ) -> Page:
-        """Get all existing entries with pagination support."""
+        """Get all existing entries with pagination support.
 
-        count_statement = select(func.count()).select_from(self.model)
-        if filtering:
-            count_statement = filtering.apply(count_statement, self.model)
-        count = await self._retrieve_one(count_statement)
+        Entries are always ordered by id as the last criteria, which makes the order stable and allows continuing from
+        the returned cursor. When pagination contains a cursor it is used instead of the page offset.
 
-        entries_statement = self.select_query.limit(pagination.limit).offset(pagination.offset)
-        if sorting:
-            entries_statement = sorting.apply(entries_statement, self.model)
+        The exact total is fetched together with the page in a single query unless the cursor is used, since it narrows
+        the set of rows the window function is able to count.
+
+        When fields are specified only the columns required to represent them are loaded, along with the sorting column
+        used by the cursor.
+
+        Without sorting, entries are ordered by relevance when filtering defines a ranking. Such pages can only be
+        continued by page offset, so no cursor is returned for them.
+        """
+
+        ranking = None
+        if filtering and not sorting and not pagination.cursor:
+            ranking = filtering.get_ranking(self.model)
+
+        entries_statement = self.select_query.limit(pagination.limit)
+        entries_statement = self._apply_fields(entries_statement, fields, sorting.field if sorting else None)
+        if pagination.cursor:
+            entries_statement = self._apply_cursor(entries_statement, pagination.cursor, sorting)
+        else:
+            entries_statement = entries_statement.offset(pagination.offset)
         if filtering:
             entries_statement = filtering.apply(entries_statement, self.model)
-        entries = await self._retrieve_many(entries_statement)
+        entries_statement = self._apply_ordering(entries_statement, sorting, ranking)
 
-        return Page(pagination=pagination, count=count, entries=entries)
+        count = None
+        chunk_size = pagination.fetch_chunk_size
+        if pagination.total is PaginationTotal.EXACT and not pagination.cursor:
+            entries, count = await self._retrieve_many_with_total(entries_statement, chunk_size)
+            if count is None and pagination.offset == 0:
+                count = 0
+        else:
+            entries = await self._retrieve_many(entries_statement, chunk_size)
+
+        if pagination.total is PaginationTotal.EXACT and count is None:
+            count = await self.count(filtering)
+        elif pagination.total is PaginationTotal.ESTIMATE:
+            count = await self.estimate_count(filtering)
+
+        next_cursor = None
+        if len(entries) == pagination.limit and ranking is None:
+            next_cursor = Cursor.from_entry(entries[-1], sorting).encode()
+
+        return Page(pagination=pagination, count=count, entries=entries, next_cursor=next_cursor)
+
+    async def stream(
+        self, filtering: Filtering | None = None, chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[DBModel]]:
+        """Get all existing entries ordered by id in chunks.
+
+        Entries are fetched using server side cursor, so only one chunk of entries is held in memory at a time.
+        """
+
+        statement = self.select_query.order_by(self.model.id).execution_options(yield_per=chunk_size)
+        if filtering:
+            statement = filtering.apply(statement, self.model)
+
+        result = await self.session.stream_scalars(statement)
+        async for entries in result.partitions(chunk_size):
+            yield entries
 
     async def update(self, id_: UUID, entry_update: BaseSchema, **kwds: Any) -> DBModel:
         """Update an existing entry attributes."""
 
         values = entry_update.dict(exclude_unset=True, exclude_defaults=True)
         statement = update(self.model).where(self.model.id == id_).values(**(values | kwds))
-        await self._update_one(statement)
-
-        entry = await self.retrieve_by_id(id_)
+        entry = await self._update_one(statement)
 
         return entry
 
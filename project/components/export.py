@@ -0,0 +1,105 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import csv
+import io
+from collections.abc import AsyncIterator
+from datetime import date
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+
+from project.components.responses import encode_json
+from project.components.schemas import BaseSchema
+from project.components.schemas import get_dump_fields
+from project.components.types import StrEnum
+
+
+class ExportFormat(StrEnum):
+    """Available formats of exported entries."""
+
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+    @property
+    def media_type(self) -> str:
+        return {ExportFormat.NDJSON: 'application/x-ndjson', ExportFormat.CSV: 'text/csv'}[self]
+
+
+def get_csv_columns(schema: type[BaseSchema]) -> list[tuple[str, str | None]]:
+    """Return columns of the schema where fields of nested schemas are flattened into separate columns."""
+
+    columns = []
+    for name, nested_schema in get_dump_fields(schema):
+        if nested_schema is None:
+            columns.append((name, None))
+        else:
+            columns.extend((name, nested_name) for nested_name, _ in get_dump_fields(nested_schema))
+
+    return columns
+
+
+def to_csv_value(value: Any) -> Any:
+    """Convert value into representation suitable for CSV cell."""
+
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return encode_json(value).decode('utf-8')
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+
+    return value
+
+
+async def export_ndjson(chunks: AsyncIterator[list[Any]], schema: type[BaseSchema]) -> AsyncIterator[bytes]:
+    """Encode each entry as JSON on a separate line, one block of lines per chunk."""
+
+    async for entries in chunks:
+        yield b''.join(encode_json(schema.dump(entry)) + b'\n' for entry in entries)
+
+
+async def export_csv(chunks: AsyncIterator[list[Any]], schema: type[BaseSchema]) -> AsyncIterator[bytes]:
+    """Encode entries as CSV rows preceded by the header, one block of rows per chunk."""
+
+    columns = get_csv_columns(schema)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(name if nested_name is None else f'{name}.{nested_name}' for name, nested_name in columns)
+
+    async for entries in chunks:
+        for entry in entries:
+            values = schema.dump(entry)
+            writer.writerow(
+                to_csv_value(values[name] if nested_name is None else (values[name] or {}).get(nested_name))
+                for name, nested_name in columns
+            )
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def create_export_response(
+    chunks: AsyncIterator[list[Any]], schema: type[BaseSchema], export_format: ExportFormat, filename: str
+) -> StreamingResponse:
+    """Return response streaming entries in specified format while they are fetched chunk by chunk."""
+
+    if export_format is ExportFormat.CSV:
+        content = export_csv(chunks, schema)
+    else:
+        content = export_ndjson(chunks, schema)
+
+    headers = {'Content-Disposition': f'attachment; filename="{filename}.{export_format.value}"'}
+
+    return StreamingResponse(content, media_type=export_format.media_type, headers=headers)
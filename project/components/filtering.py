@@ -5,6 +5,7 @@
 # You may not use this file except in compliance with the License.
 
 from pydantic import BaseModel
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql import Select
 
 from project.components import DBModel
@@ -28,3 +29,8 @@ class Filtering(BaseModel):
         """Return statement with applied filtering."""
 
         raise NotImplementedError
+
+    def get_ranking(self, model: type[DBModel]) -> ColumnElement | None:
+        """Return expression ranking entries by relevance to the filtering, if it defines any."""
+
+        return None
@@ -4,7 +4,10 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import asyncio
 import hashlib
+from collections.abc import Awaitable
+from collections.abc import Callable
 from enum import Enum
 
 import httpx
@@ -16,8 +19,12 @@ from minio.helpers import url_replace
 from minio.signer import sign_v4_s3
 
 from project.components.object_storage.policy_templates import TEMPLATES_LIBRARY
+from project.components.object_storage.policy_templates import PolicyTemplate
+from project.components.object_storage.policy_templates import get_templates_library
 from project.config import Settings
 from project.config import get_settings
+from project.dependencies import http_client_registry
+from project.metrics import observe_upstream
 
 
 class Roles(Enum):
@@ -26,21 +33,81 @@ class Roles(Enum):
     COLLABORATOR = 'collaborator'
 
 
+class PolicyOperationError(Exception):
+    """Raised when operation fails for one or more policies."""
+
+    def __init__(self, operation: str, errors: dict[str, Exception]) -> None:
+        self.errors = errors
+        details = ', '.join(f'{policy_name}: {error}' for policy_name, error in errors.items())
+        super().__init__(f'Unable to {operation} policies ({details})')
+
+
 class PolicyManager:
     """Manager for project policies."""
 
-    def __init__(self, minio_policy_client: MinioPolicyClient, timeout: int) -> None:
+    def __init__(
+        self,
+        minio_policy_client: MinioPolicyClient,
+        timeout: int,
+        client: httpx.AsyncClient,
+        templates: dict[str, PolicyTemplate] | None = None,
+    ) -> None:
         self.minio_policy_client = minio_policy_client
         self.timeout = timeout
+        self.client = client
         self.roles = Roles
-        self.templates = TEMPLATES_LIBRARY
+        self.templates = templates or TEMPLATES_LIBRARY
 
-    async def create_policies_for_project(self, project_code: str) -> None:
-        """Add MinIO policies for respective project buckets users."""
-        for role in self.roles:
-            policy_content = self.templates[role.value](project_code)
-            await self.minio_policy_client.create_IAM_policy(project_code + '-' + role.value, policy_content)
+    def get_policy_name(self, project_code: str, role: Roles) -> str:
+        return project_code + '-' + role.value
+
+    def _build_signed_request(
+        self, method: str, path: str, policy_name: str, content: str = '', region: str = 'us-east-1'
+    ) -> tuple[str, dict[str, str], dict[str, str]]:
+        """Return url, query parameters and signed headers for the MinIO admin API request."""
+
+        # fetch the credential to generate headers
+        creds = self.minio_policy_client._provider.retrieve() if self.minio_policy_client._provider else None
+
+        # use native BaseURL class to follow the pattern
+        params = {'name': policy_name}
+        url = self.minio_policy_client._base_url.build(method, region, query_params=params)
+        url = url_replace(url, path=path)
+
+        headers = None
+        headers, date = self.minio_policy_client._build_headers(url.netloc, headers, content, creds)
+        # make the signiture of request
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        headers = sign_v4_s3(method, url, region, headers, creds, content_hash, date)
+
+        return url.scheme + '://' + url.netloc + url.path, params, headers
+
+    @observe_upstream('minio_admin')
+    async def create_IAM_policy(self, policy_name: str, content: str, region: str = 'us-east-1') -> str:
+        """
+        Summary:
+            The function will create the IAM policy in minio server using the shared client.
+
+        Parameter:
+            - policy_name(str): the policy name
+            - content(str): the string content of policy
+            - region(str): the region of service (default is us-east-1)
+        """
+        self.minio_policy_client.logger.info('Create policy: %s', policy_name)
+
+        url, params, headers = self._build_signed_request(
+            'PUT', '/minio/admin/v3/add-canned-policy', policy_name, content, region
+        )
+        response = await self.client.put(url, params=params, headers=headers, content=content)
 
+        if response.status_code != 200:
+            error_msg = f'Fail to create minio policy: {response.text}'
+            self.minio_policy_client.logger.error(error_msg)
+            raise Exception(error_msg)
+
+        return 'success'
+
+    @observe_upstream('minio_admin')
     async def remove_IAM_policy(self, policy_name: str, region: str = 'us-east-1') -> str:
         """
         Summary:
@@ -52,28 +119,10 @@ class PolicyManager:
         """
         self.minio_policy_client.logger.info('Remove policy: %s', policy_name)
 
-        # fetch the credential to generate headers
-        creds = self.minio_policy_client._provider.retrieve() if self.minio_policy_client._provider else None
-
-        # use native BaseURL class to follow the pattern
-        params = {'name': policy_name}
-        url = self.minio_policy_client._base_url.build('DELETE', region, query_params=params)
-        url = url_replace(url, path='/minio/admin/v3/remove-canned-policy')
-
-        headers = None
-        headers, date = self.minio_policy_client._build_headers(url.netloc, headers, '', creds)
-        # make the signiture of request
-        content_hash = hashlib.sha256(b'').hexdigest()
-        headers = sign_v4_s3('DELETE', url, region, headers, creds, content_hash, date)
-
-        # sending to minio server to remove IAM policy
-        str_endpoint = url.scheme + '://' + url.netloc
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.delete(
-                str_endpoint + url.path,
-                params=params,
-                headers=headers,
-            )
+        url, params, headers = self._build_signed_request(
+            'DELETE', '/minio/admin/v3/remove-canned-policy', policy_name, region=region
+        )
+        response = await self.client.delete(url, params=params, headers=headers)
 
         if response.status_code == 404:
             error_msg = f'Policy {policy_name} does not exist'
@@ -86,10 +135,46 @@ class PolicyManager:
 
         return 'success'
 
+    async def _run_for_roles(
+        self,
+        operation: str,
+        project_code: str,
+        action: Callable[[str, Roles], Awaitable[str]],
+        ignored_errors: tuple[type[Exception], ...] = (),
+    ) -> None:
+        """Run action for every role concurrently and raise aggregated errors once all of them are complete."""
+
+        policy_names = [self.get_policy_name(project_code, role) for role in self.roles]
+        results = await asyncio.gather(
+            *(action(policy_name, role) for policy_name, role in zip(policy_names, self.roles)), return_exceptions=True
+        )
+
+        errors = {
+            policy_name: result
+            for policy_name, result in zip(policy_names, results)
+            if isinstance(result, Exception) and not isinstance(result, ignored_errors)
+        }
+        if errors:
+            raise PolicyOperationError(operation, errors)
+
+    async def create_policies_for_project(self, project_code: str) -> None:
+        """Add MinIO policies for respective project buckets users."""
+
+        async def create(policy_name: str, role: Roles) -> str:
+            return await self.create_IAM_policy(policy_name, self.templates[role.value](project_code))
+
+        await self._run_for_roles('create', project_code, create)
+
     async def rollback_policies_for_project(self, project_code: str) -> None:
-        """Remove MinIO policies for respective project buckets users."""
-        for role in self.roles:
-            await self.remove_IAM_policy(project_code + '-' + role.value)
+        """Remove MinIO policies for respective project buckets users.
+
+        Policies that do not exist are skipped, so the rollback can be used after partially failed creation.
+        """
+
+        async def remove(policy_name: str, role: Roles) -> str:
+            return await self.remove_IAM_policy(policy_name)
+
+        await self._run_for_roles('remove', project_code, remove, ignored_errors=(NotFoundError,))
 
 
 async def get_policy_manager(settings: Settings = Depends(get_settings)) -> PolicyManager:
@@ -97,4 +182,6 @@ async def get_policy_manager(settings: Settings = Depends(get_settings)) -> Poli
     minio_client = await get_minio_policy_client(
         s3_endpoint, settings.S3_ACCESS_KEY, settings.S3_SECRET_KEY, https=settings.S3_HTTPS_ENABLED
     )
-    return PolicyManager(minio_client, settings.SERVICE_CLIENT_TIMEOUT)
+    client = http_client_registry.get('s3_admin', settings, settings.S3_ADMIN_MAX_CONNECTIONS)
+    templates = get_templates_library(tuple(settings.S3_BUCKET_ZONE_PREFIXES), settings.S3_POLICY_CACHE_SIZE)
+    return PolicyManager(minio_client, settings.SERVICE_CLIENT_TIMEOUT, client, templates)
@@ -4,89 +4,70 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import json
+from collections.abc import Sequence
+from functools import lru_cache
 
-def get_admin_policy(project_code: str) -> str:
-    """Create policy template for admin user."""
-    template = f'''
-    {{
-        "Version": "2012-10-17",
-        "Statement": [
-            {{
-            "Action": ["s3:GetBucketLocation", "s3:ListBucket"],
-            "Effect": "Allow",
-            "Resource": ["arn:aws:s3:::gr-{project_code}", "arn:aws:s3:::core-{project_code}"]
-            }},
-            {{
-            "Action": [
-                "s3:GetObject",
-                "s3:PutObject",
-                "s3:DeleteObject"
-            ],
-            "Effect": "Allow",
-            "Resource": ["arn:aws:s3:::gr-{project_code}/*", "arn:aws:s3:::core-{project_code}/*"]
-            }}
-        ]
-    }}
-    '''
-    return template
-
-
-def get_collaborator_policy(project_code: str) -> str:
-    """Create policy template for collaborator user."""
-    template = f'''
-    {{
-        "Version": "2012-10-17",
-        "Statement": [
-            {{
-            "Action": ["s3:GetBucketLocation", "s3:ListBucket"],
-            "Effect": "Allow",
-            "Resource": ["arn:aws:s3:::gr-{project_code}", "arn:aws:s3:::core-{project_code}"]
-            }},
-            {{
-            "Action": [
-                "s3:GetObject",
-                "s3:PutObject",
-                "s3:DeleteObject"
-            ],
-            "Effect": "Allow",
-            "Resource": ["arn:aws:s3:::gr-{project_code}/${{jwt:preferred_username}}/*",
-             "arn:aws:s3:::core-{project_code}/*"]
-            }}
-        ]
-    }}
-    '''
-    return template
-
-
-def get_contributor_policy(project_code: str) -> str:
-    """Create policy template for contributor user."""
-    template = f'''
-    {{
-        "Version": "2012-10-17",
-        "Statement": [
-            {{
-            "Action": ["s3:GetBucketLocation", "s3:ListBucket"],
-            "Effect": "Allow",
-            "Resource": ["arn:aws:s3:::gr-{project_code}", "arn:aws:s3:::core-{project_code}"]
-            }},
-            {{
-            "Action": [
-                "s3:GetObject",
-                "s3:PutObject",
-                "s3:DeleteObject"
-            ],
-            "Effect": "Allow",
-            "Resource": ["arn:aws:s3:::gr-{project_code}/${{jwt:preferred_username}}/*",
-             "arn:aws:s3:::core-{project_code}/${{jwt:preferred_username}}/*"]
-            }}
-        ]
-    }}
-    '''
-    return template
-
-
-TEMPLATES_LIBRARY = {
-    'admin': get_admin_policy,
-    'contributor': get_contributor_policy,
-    'collaborator': get_collaborator_policy,
+PROJECT_CODE_PLACEHOLDER = '<project_code>'
+
+ALL_OBJECTS = '*'
+USER_OBJECTS = '${jwt:preferred_username}/*'
+
+BUCKET_ACTIONS = ['s3:GetBucketLocation', 's3:ListBucket']
+OBJECT_ACTIONS = ['s3:GetObject', 's3:PutObject', 's3:DeleteObject']
+
+# Objects available for the role in the first (greenroom) zone and in the rest of the zones.
+ROLE_OBJECT_PATHS = {
+    'admin': (ALL_OBJECTS, ALL_OBJECTS),
+    'contributor': (USER_OBJECTS, USER_OBJECTS),
+    'collaborator': (USER_OBJECTS, ALL_OBJECTS),
 }
+
+
+class PolicyTemplate:
+    """Role policy document compiled once into minified JSON which is split around the project code."""
+
+    def __init__(self, zone_prefixes: Sequence[str], object_paths: Sequence[str], cache_size: int) -> None:
+        buckets = [f'arn:aws:s3:::{prefix}-{PROJECT_CODE_PLACEHOLDER}' for prefix in zone_prefixes]
+        document = {
+            'Version': '2012-10-17',
+            'Statement': [
+                {
+                    'Action': BUCKET_ACTIONS,
+                    'Effect': 'Allow',
+                    'Resource': buckets,
+                },
+                {
+                    'Action': OBJECT_ACTIONS,
+                    'Effect': 'Allow',
+                    'Resource': [f'{bucket}/{path}' for bucket, path in zip(buckets, object_paths)],
+                },
+            ],
+        }
+        self.parts = json.dumps(document, separators=(',', ':')).split(PROJECT_CODE_PLACEHOLDER)
+        self.render = lru_cache(maxsize=cache_size)(self._render)
+
+    def _render(self, project_code: str) -> str:
+        return project_code.join(self.parts)
+
+    def __call__(self, project_code: str) -> str:
+        """Return policy document for the project."""
+        return self.render(project_code)
+
+
+@lru_cache
+def get_templates_library(zone_prefixes: tuple[str, ...], cache_size: int = 1024) -> dict[str, PolicyTemplate]:
+    """Compile policy templates for all roles for the zone bucket prefixes.
+
+    The first zone is the greenroom zone, where contributors and collaborators have access only to their own objects.
+    """
+
+    templates = {}
+    for role, (greenroom_path, zone_path) in ROLE_OBJECT_PATHS.items():
+        object_paths = [greenroom_path] + [zone_path] * (len(zone_prefixes) - 1)
+        templates[role] = PolicyTemplate(zone_prefixes, object_paths, cache_size)
+
+    return templates
+
+
+TEMPLATES_LIBRARY = get_templates_library(('gr', 'core'))
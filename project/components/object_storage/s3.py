@@ -4,24 +4,46 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from contextlib import asynccontextmanager
 from typing import Any
 
+from aiobotocore.client import AioBaseClient
+from aiobotocore.session import ClientCreatorContext
+from aiobotocore.session import get_session
+from botocore.client import Config
 from common import get_boto3_admin_client
 from common import get_boto3_client
 from common.object_storage_adaptor.boto3_admin_client import Boto3AdminClient
 from common.object_storage_adaptor.boto3_client import Boto3Client
 
+from project.metrics import observe_upstream
+
+SIGNATURE_VERSION = 's3v4'
+
 
 class BucketNotFound(Exception):
     """Raised when specified bucket is not found."""
 
 
 class S3Client:
-    """Class that combines two boto3 clients from common package for better usability."""
+    """Class that combines two boto3 clients from common package for better usability.
+
+    When connected, each of the boto3 clients gets its own long-lived aiobotocore client with a connection pool, built
+    from the endpoint and credentials of that boto3 client, instead of opening a new client (and a new connection) for
+    every call. Bucket versioning and encryption are delegated to the common package as they are only set once per
+    bucket during project provisioning.
+    """
 
     boto_client: Boto3Client
     boto_admin_client: Boto3AdminClient
 
+    def __init__(self) -> None:
+        self.client: AioBaseClient | None = None
+        self.admin_client: AioBaseClient | None = None
+        self._exit_stack: AsyncExitStack | None = None
+
     @classmethod
     async def initialize(cls, endpoint: str, access_key: str, secret_key: str, https: bool = False) -> 'S3Client':
         """Create an instance of S3Client with initialized boto3 clients."""
@@ -36,34 +58,87 @@ class S3Client:
         )
         return s3_client
 
+    def _create_client(
+        self, boto_client: Boto3Client | Boto3AdminClient, max_pool_connections: int | None = None
+    ) -> ClientCreatorContext:
+        """Return context of aiobotocore client using the same endpoint and credentials as the boto_client."""
+        config = Config(signature_version=SIGNATURE_VERSION)
+        if max_pool_connections is not None:
+            config = config.merge(Config(max_pool_connections=max_pool_connections))
+
+        return get_session().create_client(
+            's3',
+            endpoint_url=boto_client.endpoint,
+            aws_access_key_id=boto_client.access_key,
+            aws_secret_access_key=boto_client.secret_key,
+            aws_session_token=getattr(boto_client, 'session_token', None),
+            config=config,
+        )
+
+    async def connect(self, max_pool_connections: int = 10) -> None:
+        """Open long-lived clients that keep connections to S3 alive between calls."""
+        if self._exit_stack is not None:
+            return
+
+        self._exit_stack = AsyncExitStack()
+        self.client = await self._exit_stack.enter_async_context(
+            self._create_client(self.boto_client, max_pool_connections)
+        )
+        self.admin_client = await self._exit_stack.enter_async_context(
+            self._create_client(self.boto_admin_client, max_pool_connections)
+        )
+
+    async def close(self) -> None:
+        """Close long-lived clients with all their connections."""
+        if self._exit_stack is None:
+            return
+
+        await self._exit_stack.aclose()
+        self._exit_stack = None
+        self.client = None
+        self.admin_client = None
+
+    @asynccontextmanager
+    async def _get_client(self, boto_client: Boto3Client | Boto3AdminClient) -> AsyncIterator[AioBaseClient]:
+        """Return long-lived client of the boto_client if connected or open a short-lived one."""
+        client = self.client if boto_client is self.boto_client else self.admin_client
+        if client is not None:
+            yield client
+            return
+
+        async with self._create_client(boto_client) as s3:
+            yield s3
+
+    @observe_upstream('s3')
     async def create_bucket(self, bucket: str) -> dict[str, Any]:
         """Create a bucket in S3."""
-        return await self.boto_admin_client.create_bucket(bucket)
+        async with self._get_client(self.boto_admin_client) as s3:
+            return await s3.create_bucket(Bucket=bucket)
 
+    @observe_upstream('s3')
     async def set_bucket_versioning(self, bucket: str) -> dict[str, Any]:
         """Set versioning for a bucket."""
         return await self.boto_admin_client.set_bucket_versioning(bucket)
 
+    @observe_upstream('s3')
     async def create_bucket_encryption(self, bucket: str) -> dict[str, Any]:
         """Create encryption for a bucket."""
         return await self.boto_admin_client.create_bucket_encryption(bucket)
 
+    @observe_upstream('s3')
     async def put_object(self, bucket: str, key: str, file: bytes) -> dict[str, Any]:
         """Upload a single file to S3."""
-        async with self.boto_client._session.client(
-            's3', endpoint_url=self.boto_client.endpoint, config=self.boto_client._config
-        ) as s3:
+        async with self._get_client(self.boto_client) as s3:
             try:
                 res = await s3.put_object(Bucket=bucket, Key=key, Body=file)
                 return res
             except s3.exceptions.NoSuchBucket:
                 raise BucketNotFound
 
+    @observe_upstream('s3')
     async def remove_bucket(self, bucket: str) -> dict[str, Any]:
         """Delete a bucket from S3."""
-        async with self.boto_admin_client._session.client(
-            's3', endpoint_url=self.boto_admin_client.endpoint, config=self.boto_admin_client._config
-        ) as s3:
+        async with self._get_client(self.boto_admin_client) as s3:
             try:
                 res = await s3.delete_bucket(Bucket=bucket)
                 return res
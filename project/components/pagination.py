@@ -5,34 +5,109 @@
 # You may not use this file except in compliance with the License.
 
 import math
+from base64 import urlsafe_b64decode
+from base64 import urlsafe_b64encode
+from functools import reduce
+from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel
 from pydantic import conint
+from starlette.datastructures import URL
 
 from project.components import DBModel
+from project.components.sorting import Sorting
+from project.components.sorting import SortingOrder
+from project.components.types import StrEnum
+
+
+class PaginationTotal(StrEnum):
+    """Available ways of calculating the total number of entries."""
+
+    EXACT = 'exact'
+    ESTIMATE = 'estimate'
+    NONE = 'none'
+
+
+class Cursor(BaseModel):
+    """Position of the last entry on a page used for keyset pagination."""
+
+    field: str | None = None
+    order: SortingOrder = SortingOrder.ASC
+    key: Any = None
+    id: UUID
+
+    @classmethod
+    def from_entry(cls, entry: DBModel, sorting: Sorting | None = None) -> 'Cursor':
+        """Create cursor pointing to the entry according to sorting."""
+
+        if not sorting:
+            order = sorting.order if sorting is not None else SortingOrder.ASC
+            return cls(order=order, id=entry.id)
+
+        key = reduce(getattr, sorting.field.split('.'), entry)
+
+        return cls(field=sorting.field, order=sorting.order, key=key, id=entry.id)
+
+    @classmethod
+    def decode(cls, value: str) -> 'Cursor':
+        """Restore cursor from opaque string representation."""
+
+        padding = '=' * (-len(value) % 4)
+
+        return cls.parse_raw(urlsafe_b64decode(value + padding))
+
+    def encode(self) -> str:
+        """Represent cursor as opaque url-safe string."""
+
+        return urlsafe_b64encode(self.json().encode()).decode().rstrip('=')
 
 
 class Pagination(BaseModel):
-    """Base pagination control parameters."""
+    """Base pagination control parameters.
+
+    The number of returned entries is capped by max page size, and the offset of the page and the total number of pages
+    are calculated using the capped size, so consecutive pages never skip entries. Entries of pages larger than chunk
+    size are fetched in batches of that size.
+    """
 
     page: conint(ge=0) = 0
     page_size: conint(ge=1) = 20
+    cursor: Cursor | None = None
+    total: PaginationTotal = PaginationTotal.EXACT
+    max_page_size: conint(ge=1) | None = None
+    chunk_size: conint(ge=1) | None = None
 
     @property
     def limit(self) -> int:
-        return self.page_size
+        if self.max_page_size is None:
+            return self.page_size
+
+        return min(self.page_size, self.max_page_size)
+
+    @property
+    def is_capped(self) -> bool:
+        return self.limit < self.page_size
+
+    @property
+    def fetch_chunk_size(self) -> int | None:
+        if self.chunk_size is None or self.limit <= self.chunk_size:
+            return None
+
+        return self.chunk_size
 
     @property
     def offset(self) -> int:
-        return self.page_size * self.page
+        return self.limit * self.page
 
 
 class Page(BaseModel):
     """Represent one page of the response."""
 
     pagination: Pagination
-    count: int
+    count: int | None
     entries: list[DBModel]
+    next_cursor: str | None = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -42,5 +117,19 @@ class Page(BaseModel):
         return self.pagination.page
 
     @property
-    def total_pages(self) -> int:
-        return math.ceil(self.count / self.pagination.page_size)
+    def total_pages(self) -> int | None:
+        if self.count is None:
+            return None
+
+        return math.ceil(self.count / self.pagination.limit)
+
+
+def get_next_page_link(url: URL, page: Page) -> str | None:
+    """Return value of Link header pointing to the next page continued from the page cursor."""
+
+    if not page.next_cursor:
+        return None
+
+    next_url = url.remove_query_params('page').include_query_params(cursor=page.next_cursor)
+
+    return f'<{next_url}>; rel="next"'
@@ -4,14 +4,18 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from typing import ClassVar
 from typing import Optional
 
 from fastapi import Query
 from pydantic import BaseModel
 from pydantic import create_model
+from pydantic import validator
 
 from project.components.filtering import Filtering
+from project.components.pagination import Cursor
 from project.components.pagination import Pagination
+from project.components.pagination import PaginationTotal
 from project.components.sorting import Sorting
 from project.components.sorting import SortingOrder
 from project.components.types import StrEnum
@@ -26,9 +30,28 @@ class PageParameters(QueryParameters):
 
     page: int = Query(default=0, ge=0)
     page_size: int = Query(default=20, ge=1)
-
-    def to_pagination(self) -> Pagination:
-        return Pagination(page=self.page, page_size=self.page_size)
+    cursor: str | None = Query(default=None)
+    total: PaginationTotal = Query(default=PaginationTotal.EXACT)
+
+    @validator('cursor')
+    def decode_cursor(cls, value: str | None) -> Cursor | None:
+        if not value:
+            return None
+
+        try:
+            return Cursor.decode(value)
+        except Exception:
+            raise ValueError('invalid cursor')
+
+    def to_pagination(self, max_page_size: int | None = None, chunk_size: int | None = None) -> Pagination:
+        return Pagination(
+            page=self.page,
+            page_size=self.page_size,
+            cursor=self.cursor,
+            total=self.total,
+            max_page_size=max_page_size,
+            chunk_size=chunk_size,
+        )
 
 
 class SortByFields(StrEnum):
@@ -61,3 +84,31 @@ class FilterParameters(QueryParameters):
 
     def to_filtering(self) -> Filtering:
         raise NotImplementedError
+
+
+class FieldsParameters(QueryParameters):
+    """Base query parameters for selecting response fields."""
+
+    fields: str | None = Query(default=None, description='Comma separated list of fields to include in response.')
+    available_fields: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def with_schema(cls, schema: type[BaseModel]) -> type['FieldsParameters']:
+        """Limit fields with the fields of response schema."""
+
+        return type(cls.__name__, (cls,), {'available_fields': frozenset(schema.__fields__)})
+
+    @validator('fields')
+    def split_fields(cls, value: str | None) -> list[str] | None:
+        if not value:
+            return None
+
+        fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+        unknown_fields = [field for field in fields if field not in cls.available_fields]
+        if unknown_fields:
+            raise ValueError(f'unknown fields {", ".join(unknown_fields)}')
+
+        return fields
+
+    def to_fields(self) -> list[str] | None:
+        return self.fields
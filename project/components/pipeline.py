@@ -0,0 +1,81 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import Any
+
+
+class StepSkipped(Exception):
+    """Raised when step is not started because another step of the pipeline has already failed."""
+
+
+class PipelineStep:
+    """Asynchronous action with names of the steps it depends on."""
+
+    def __init__(self, name: str, action: Callable[[], Awaitable[Any]], depends_on: Sequence[str] = ()) -> None:
+        self.name = name
+        self.action = action
+        self.depends_on = tuple(depends_on)
+
+
+class Pipeline:
+    """Run asynchronous steps concurrently, starting each step as soon as the steps it depends on are complete.
+
+    Results of the completed steps are available in ``results``, so a step can use results of its dependencies.
+    """
+
+    def __init__(self) -> None:
+        self.steps: dict[str, PipelineStep] = {}
+        self.results: dict[str, Any] = {}
+
+    def add_step(self, name: str, action: Callable[[], Awaitable[Any]], depends_on: Sequence[str] = ()) -> 'Pipeline':
+        """Add a new step which can depend only on already added steps."""
+
+        if name in self.steps:
+            raise ValueError(f'Step "{name}" is already added')
+
+        unknown = [dependency for dependency in depends_on if dependency not in self.steps]
+        if unknown:
+            raise ValueError(f'Step "{name}" depends on unknown steps {unknown}')
+
+        self.steps[name] = PipelineStep(name, action, depends_on)
+
+        return self
+
+    async def run(self) -> dict[str, Any]:
+        """Run all steps and return their results by step names.
+
+        Once any step fails, the steps that are not started yet are skipped, while already running ones are awaited, so
+        nothing keeps changing after the method returns and the caller can safely roll back. The first error is raised.
+        """
+
+        tasks: dict[str, asyncio.Task] = {}
+        errors: list[Exception] = []
+
+        async def run_step(step: PipelineStep) -> None:
+            for dependency in step.depends_on:
+                await tasks[dependency]
+
+            if errors:
+                raise StepSkipped(step.name)
+
+            try:
+                self.results[step.name] = await step.action()
+            except Exception as e:
+                errors.append(e)
+                raise
+
+        for name, step in self.steps.items():
+            tasks[name] = asyncio.create_task(run_step(step))
+
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        if errors:
+            raise errors[0]
+
+        return self.results
@@ -0,0 +1,147 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from project.components.cache import CacheBackend
+from project.components.project.models import Project
+from project.components.project.schemas import ProjectResponseSchema
+from project.metrics import CACHE_REQUESTS
+
+
+class ProjectCache:
+    """Read-through cache for projects available by both id and code.
+
+    Projects are stored by id in the process-local backend and optionally in the shared backend. Code is stored only as
+    a reference to the project id, so invalidation by id is enough even when project code is changed.
+
+    Invalidation removes the project from the shared backend and from the local backend of the current process only.
+    Local backends of other processes keep the project until it expires, so the local backend is expected to have a
+    short time to live (PROJECT_CACHE_LOCAL_TTL) when the shared backend is used. Without the shared backend and with
+    several workers, PROJECT_CACHE_TTL bounds how long other workers may return the previous version of a project.
+
+    Hits and misses are exported as Prometheus counters along with the instance attributes.
+    """
+
+    def __init__(self, local: CacheBackend, shared: CacheBackend | None = None) -> None:
+        self.local = local
+        self.shared = shared
+        self.hits = 0
+        self.misses = 0
+
+    def get_id_key(self, project_id: UUID | str) -> str:
+        return f'project:id:{project_id}'
+
+    def get_code_key(self, code: str) -> str:
+        return f'project:code:{code}'
+
+    async def _get_many(self, keys: Sequence[str], parse: Callable[[str], Any]) -> dict[str, Any]:
+        """Return values found in the local backend, falling back to the shared backend for the rest."""
+
+        values = dict(zip(keys, await self.local.get_many(keys)))
+
+        missing_keys = [key for key, value in values.items() if value is None]
+        if missing_keys and self.shared:
+            found = {
+                key: parse(value)
+                for key, value in zip(missing_keys, await self.shared.get_many(missing_keys))
+                if value is not None
+            }
+            if found:
+                await self.local.set_many(found)
+                values.update(found)
+
+        return {key: value for key, value in values.items() if value is not None}
+
+    async def get_many(self, ids_or_codes: Iterable[UUID | str]) -> dict[UUID | str, ProjectResponseSchema]:
+        """Return cached projects either by ids or by codes (depending on type), missing projects are omitted.
+
+        Codes are resolved to project ids with one batch lookup and projects are fetched with another one.
+        """
+
+        ids_or_codes = set(ids_or_codes)
+        code_keys = {self.get_code_key(code): code for code in ids_or_codes if not isinstance(code, UUID)}
+        project_ids = {code_keys[key]: value for key, value in (await self._get_many(list(code_keys), str)).items()}
+
+        id_keys = {self.get_id_key(id_or_code) for id_or_code in ids_or_codes if isinstance(id_or_code, UUID)}
+        id_keys.update(self.get_id_key(project_id) for project_id in project_ids.values())
+        projects = await self._get_many(list(id_keys), ProjectResponseSchema.parse_raw)
+
+        result = {}
+        for id_or_code in ids_or_codes:
+            if isinstance(id_or_code, UUID):
+                project = projects.get(self.get_id_key(id_or_code))
+            else:
+                project_id = project_ids.get(id_or_code)
+                project = projects.get(self.get_id_key(project_id)) if project_id else None
+                if project is not None and project.code != id_or_code:
+                    project = None
+
+            self._record_lookup(project is not None)
+            if project is not None:
+                result[id_or_code] = project
+
+        return result
+
+    async def get(self, id_or_code: UUID | str) -> ProjectResponseSchema | None:
+        """Return cached project either by id or by code (depending on type)."""
+
+        projects = await self.get_many([id_or_code])
+
+        return projects.get(id_or_code)
+
+    def _record_lookup(self, is_hit: bool) -> None:
+        if is_hit:
+            self.hits += 1
+            CACHE_REQUESTS.labels('project', 'hit').inc()
+        else:
+            self.misses += 1
+            CACHE_REQUESTS.labels('project', 'miss').inc()
+
+    async def set_many(self, projects: Iterable[Project]) -> list[ProjectResponseSchema]:
+        """Store projects in cache and return their response representations."""
+
+        projects = [ProjectResponseSchema.from_orm(project) for project in projects]
+        local_values = {}
+        shared_values = {}
+        for project in projects:
+            id_key = self.get_id_key(project.id)
+            code_key = self.get_code_key(project.code)
+            local_values.update({id_key: project, code_key: str(project.id)})
+            shared_values.update({id_key: project.json(), code_key: str(project.id)})
+
+        await self.local.set_many(local_values)
+        if self.shared:
+            await self.shared.set_many(shared_values)
+
+        return projects
+
+    async def set(self, project: Project) -> ProjectResponseSchema:
+        """Store project in cache and return its response representation."""
+
+        projects = await self.set_many([project])
+
+        return projects[0]
+
+    async def invalidate(self, project_id: UUID) -> None:
+        """Remove project from cache."""
+
+        key = self.get_id_key(project_id)
+
+        await self.local.delete(key)
+        if self.shared:
+            await self.shared.delete(key)
+
+    async def close(self) -> None:
+        """Release resources used by cache backends."""
+
+        await self.local.close()
+        if self.shared:
+            await self.shared.close()
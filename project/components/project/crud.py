@@ -4,11 +4,17 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from collections.abc import Collection
 from uuid import UUID
 
+from sqlalchemy import any_
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.future import select
 
 from project.components.crud import CRUD
+from project.components.filtering import Filtering
 from project.components.project.models import Project
 
 
@@ -16,6 +22,7 @@ class ProjectCRUD(CRUD):
     """CRUD for managing project database models."""
 
     model = Project
+    field_columns = {'image_url': ('logo_name',)}
 
     async def retrieve_by_code(self, code: str) -> Project:
         """Get an existing project by unique code."""
@@ -33,3 +40,33 @@ class ProjectCRUD(CRUD):
             return await self.retrieve_by_id(id_or_code)
 
         return await self.retrieve_by_code(id_or_code)
+
+    async def count_tags(self, field: str, filtering: Filtering | None = None) -> list[tuple[str, int]]:
+        """Get number of projects per each tag stored in the field, most frequent tags first."""
+
+        statement = select(func.unnest(getattr(self.model, field)).label('tag'))
+        if filtering:
+            statement = filtering.apply(statement, self.model)
+        tags = statement.subquery()
+
+        count = func.count().label('count')
+        statement = select(tags.c.tag, count).group_by(tags.c.tag).order_by(count.desc(), tags.c.tag)
+        result = await self.execute(statement)
+
+        return [tuple(row) for row in result.all()]
+
+    async def list_by_ids(self, ids: Collection[UUID]) -> list[Project]:
+        """Get existing projects by ids using single array parameter."""
+
+        values = literal(list(ids), ARRAY(self.model.id.type))
+        statement = select(self.model).where(self.model.id == any_(values))
+
+        return await self._retrieve_many(statement)
+
+    async def list_by_codes(self, codes: Collection[str]) -> list[Project]:
+        """Get existing projects by codes using single array parameter."""
+
+        values = literal(list(codes), ARRAY(self.model.code.type))
+        statement = select(self.model).where(self.model.code == any_(values))
+
+        return await self._retrieve_many(statement)
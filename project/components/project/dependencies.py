@@ -7,14 +7,24 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from project.components.cache import InMemoryCacheBackend
+from project.components.cache import RedisCacheBackend
+from project.components.object_storage.policy import PolicyManager
+from project.components.object_storage.policy import get_policy_manager
 from project.components.object_storage.s3 import S3Client
+from project.components.project.cache import ProjectCache
 from project.components.project.crud import ProjectCRUD
 from project.components.project.logo_uploader import LogoUploader
 from project.components.project.object_storage_manager import ObjectStorageManager
+from project.components.project.provisioner import ProjectProvisioner
 from project.config import Settings
 from project.config import get_settings
 from project.dependencies import get_db_session
 from project.dependencies import get_s3_client
+from project.services.auth import AuthClient
+from project.services.auth import get_auth_client
+from project.services.metadata import MetadataClient
+from project.services.metadata import get_metadata_client
 
 
 def get_project_crud(db_session: AsyncSession = Depends(get_db_session)) -> ProjectCRUD:
@@ -36,3 +46,47 @@ def get_object_storage_manager(
 ) -> ObjectStorageManager:
     """Returns an instance of ObjectStorageManager as a dependency."""
     return ObjectStorageManager(s3_client, settings)
+
+
+def get_project_provisioner(
+    object_storage_manager: ObjectStorageManager = Depends(get_object_storage_manager),
+    policy_manager: PolicyManager = Depends(get_policy_manager),
+    auth_client: AuthClient = Depends(get_auth_client),
+    metadata_client: MetadataClient = Depends(get_metadata_client),
+) -> ProjectProvisioner:
+    """Return an instance of ProjectProvisioner as a dependency."""
+
+    return ProjectProvisioner(object_storage_manager, policy_manager, auth_client, metadata_client)
+
+
+class GetProjectCache:
+    """Create a FastAPI callable dependency for single ProjectCache instance shared between requests."""
+
+    def __init__(self) -> None:
+        self.instance = None
+
+    def __call__(self, settings: Settings = Depends(get_settings)) -> ProjectCache:
+        """Return an instance of ProjectCache class."""
+
+        if not self.instance:
+            local_ttl = settings.PROJECT_CACHE_TTL
+            shared = None
+            if settings.PROJECT_CACHE_SHARED_BACKEND_URL:
+                local_ttl = min(settings.PROJECT_CACHE_LOCAL_TTL, settings.PROJECT_CACHE_TTL)
+                shared = RedisCacheBackend(settings.PROJECT_CACHE_SHARED_BACKEND_URL, settings.PROJECT_CACHE_TTL)
+            local = InMemoryCacheBackend(settings.PROJECT_CACHE_SIZE, local_ttl)
+            self.instance = ProjectCache(local, shared)
+
+        return self.instance
+
+    async def close(self) -> None:
+        """Release cache backends and drop the instance."""
+
+        if not self.instance:
+            return
+
+        await self.instance.close()
+        self.instance = None
+
+
+get_project_cache = GetProjectCache()
@@ -4,9 +4,13 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import re
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import func
+from sqlalchemy import literal_column
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql import Select
 
 from project.components.filtering import Filtering
@@ -22,8 +26,30 @@ class ProjectFiltering(Filtering):
     description: str | None = None
     created_at: tuple[datetime, datetime] | None = None
     tags: list[str] | None = None
+    tags_any: list[str] | None = None
+    system_tags: list[str] | None = None
+    system_tags_any: list[str] | None = None
     is_discoverable: bool | None = None
     ids: list[UUID] | None = None
+    search: str | None = None
+
+    def get_search_query(self) -> ColumnElement | None:
+        """Return full-text query matching entries which contain words starting with each of search terms."""
+
+        terms = re.findall(r'[^\W_]+', self.search or '')
+        if not terms:
+            return None
+
+        return func.to_tsquery(literal_column("'simple'"), ' & '.join(f'{term}:*' for term in terms))
+
+    def get_ranking(self, model: type[Project]) -> ColumnElement | None:
+        """Return full-text rank of the entries when search is specified."""
+
+        search_query = self.get_search_query()
+        if search_query is None:
+            return None
+
+        return func.ts_rank(model.search_vector, search_query)
 
     def apply(self, statement: Select, model: type[Project]) -> Select:
         """Return statement with applied filtering."""
@@ -43,8 +69,7 @@ class ProjectFiltering(Filtering):
         if self.created_at:
             statement = statement.where(model.created_at.between(*self.created_at))
 
-        if self.tags:
-            statement = statement.where(model.tags.contains(self.tags))
+        statement = self.apply_tags(statement, model)
 
         if self.is_discoverable is not None:
             statement = statement.where(model.is_discoverable == self.is_discoverable)
@@ -52,4 +77,25 @@ class ProjectFiltering(Filtering):
         if self.ids:
             statement = statement.where(model.id.in_(self.ids))
 
+        search_query = self.get_search_query()
+        if search_query is not None:
+            statement = statement.where(model.search_vector.op('@@')(search_query))
+
+        return statement
+
+    def apply_tags(self, statement: Select, model: type[Project]) -> Select:
+        """Return statement with applied filtering by tags and system tags."""
+
+        if self.tags:
+            statement = statement.where(model.tags.contains(self.tags))
+
+        if self.tags_any:
+            statement = statement.where(model.tags.overlap(self.tags_any))
+
+        if self.system_tags:
+            statement = statement.where(model.system_tags.contains(self.system_tags))
+
+        if self.system_tags_any:
+            statement = statement.where(model.system_tags.overlap(self.system_tags_any))
+
         return statement
@@ -5,6 +5,7 @@
 # You may not use this file except in compliance with the License.
 
 import asyncio
+import contextvars
 from functools import partial
 from io import BytesIO
 
@@ -13,6 +14,7 @@ from PIL import Image
 from project.components.object_storage.s3 import BucketNotFound
 from project.dependencies.s3 import S3Client
 from project.logger import logger
+from project.tracing import tracer
 
 
 class LogoUploader:
@@ -27,21 +29,23 @@ class LogoUploader:
 
         buffer = BytesIO()
 
-        try:
-            img = Image.open(BytesIO(image))
-            img = img.resize(resize_size, Image.Resampling.LANCZOS)
-            img.save(buffer, output_type)
-        except Exception:
-            logger.exception('Unable to convert image.')
-            raise
+        with tracer.start_as_current_span('logo convert', attributes={'image.size': len(image)}):
+            try:
+                img = Image.open(BytesIO(image))
+                img = img.resize(resize_size, Image.Resampling.LANCZOS)
+                img.save(buffer, output_type)
+            except Exception:
+                logger.exception('Unable to convert image.')
+                raise
 
         return buffer.getvalue()
 
     async def convert(self, image: bytes) -> bytes:
-        """Convert and resize image."""
+        """Convert and resize image in the executor keeping the current context for tracing."""
 
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, partial(self.convert_sync, image))
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, context.run, partial(self.convert_sync, image))
 
     async def upload(self, image: bytes, filename: str) -> None:
         """Upload image to S3 bucket."""
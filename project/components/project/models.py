@@ -10,9 +10,13 @@ from uuid import uuid4
 from sqlalchemy import BOOLEAN
 from sqlalchemy import VARCHAR
 from sqlalchemy import Column
+from sqlalchemy import Computed
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred
 from sqlalchemy.orm import relationship
 
 from project.components.db_model import DBModel
@@ -22,10 +26,15 @@ class Project(DBModel):
     """Project database model."""
 
     __tablename__ = 'projects'
+    __table_args__ = (
+        Index('ix_project_projects_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_project_projects_tags', 'tags', postgresql_using='gin'),
+        Index('ix_project_projects_system_tags', 'system_tags', postgresql_using='gin'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     code = Column(VARCHAR(length=32), unique=True, index=True, nullable=False)
-    name = Column(VARCHAR(length=256), nullable=False)
+    name = Column(VARCHAR(length=256), index=True, nullable=False)
     description = Column(VARCHAR(length=2048), nullable=False)
     logo_name = Column(VARCHAR(length=40), nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow, index=True, nullable=False)
@@ -33,6 +42,20 @@ class Project(DBModel):
     tags = Column(ARRAY(VARCHAR(256)), default=[], nullable=False)
     system_tags = Column(ARRAY(VARCHAR(256)), default=[], nullable=False)
     is_discoverable = Column(BOOLEAN(), default=True, nullable=False)
-
-    resource_requests = relationship('ResourceRequest', back_populates='project', cascade='all, delete-orphan')
-    workbenches = relationship('Workbench', back_populates='project', cascade='all, delete-orphan')
+    search_vector = deferred(
+        Column(
+            TSVECTOR(),
+            Computed(
+                "setweight(to_tsvector('simple', code), 'A') || setweight(to_tsvector('simple', name), 'B') || "
+                "setweight(to_tsvector('simple', description), 'C')",
+                persisted=True,
+            ),
+        )
+    )
+
+    resource_requests = relationship(
+        'ResourceRequest', back_populates='project', cascade='all, delete-orphan', passive_deletes=True
+    )
+    workbenches = relationship(
+        'Workbench', back_populates='project', cascade='all, delete-orphan', passive_deletes=True
+    )
@@ -4,52 +4,80 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Iterable
+
 from project.components.object_storage.s3 import BucketNotFound
 from project.components.object_storage.s3 import S3Client
 from project.config import Settings
 from project.logger import logger
 
 
+def raise_first_error(results: Iterable[object]) -> None:
+    """Raise the first exception from results returned by asyncio.gather with return_exceptions."""
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 class ObjectStorageManager:
     def __init__(self, s3_client: S3Client, settings: Settings) -> None:
         self.s3_client = s3_client
         self.settings = settings
+        self.semaphore = asyncio.Semaphore(settings.S3_BUCKET_OPERATIONS_CONCURRENCY)
+
+    def get_bucket_names(self, project_code: str) -> list[str]:
+        """Return names of all the zone buckets for the project."""
+        return [bucket_prefix + '-' + project_code for bucket_prefix in self.settings.S3_BUCKET_ZONE_PREFIXES]
+
+    async def _limited(self, operation: Awaitable[None]) -> None:
+        """Await operation once the number of concurrent bucket operations is below the limit."""
+        async with self.semaphore:
+            await operation
 
     async def create_bucket(self, bucket_name: str) -> None:
-        """Create a bucket and set versioning for it."""
+        """Create a bucket and then set versioning and encryption for it at the same time."""
         logger.info(f'Creating bucket {bucket_name}')
-        await self.s3_client.create_bucket(bucket_name)
+        await self._limited(self.s3_client.create_bucket(bucket_name))
+
+        operations = []
 
         if self.settings.S3_GATEWAY_ENABLED is False:
             logger.info(f'S3 Gateway is disabled, add versioning for {bucket_name}')
-            await self.s3_client.set_bucket_versioning(bucket_name)
+            operations.append(self._limited(self.s3_client.set_bucket_versioning(bucket_name)))
         else:
             logger.warning(f'S3 Gateway is enabled, versioning for {bucket_name} will not be enabled by API')
 
         if self.settings.S3_BUCKET_ENCRYPTION_ENABLED:
             logger.info(f'Bucket encryption enabled, encrypting {bucket_name}')
-            await self.s3_client.create_bucket_encryption(bucket_name)
+            operations.append(self._limited(self.s3_client.create_bucket_encryption(bucket_name)))
         else:
             logger.warning(f'Bucket encryption is not enabled, not encrypting {bucket_name}')
 
+        raise_first_error(await asyncio.gather(*operations, return_exceptions=True))
+
     async def create_buckets_for_project(self, project_code: str) -> None:
-        """Create all the required buckets for the project."""
+        """Create all the required buckets for the project concurrently.
+
+        All bucket operations are awaited before the first error is raised, so nothing is left in progress when the
+        caller starts to roll back.
+        """
         logger.info(f'Creating buckets for project {project_code}')
-        for bucket_prefix in self.settings.S3_BUCKET_ZONE_PREFIXES:
-            bucket_name = bucket_prefix + '-' + project_code
-            await self.create_bucket(bucket_name)
+        bucket_names = self.get_bucket_names(project_code)
+        raise_first_error(await asyncio.gather(*map(self.create_bucket, bucket_names), return_exceptions=True))
 
     async def remove_bucket(self, bucket_name: str) -> None:
         """Remove a bucket."""
         logger.info(f'Removing bucket {bucket_name}')
-        await self.s3_client.remove_bucket(bucket_name)
+        await self._limited(self.s3_client.remove_bucket(bucket_name))
 
     async def remove_buckets_for_project(self, project_code: str) -> None:
-        """Remove all the created buckets for the project."""
+        """Remove all the created buckets for the project concurrently.
+
+        Buckets that do not exist are skipped, while the rest of the buckets are still removed.
+        """
         logger.info(f'Removing all buckets for project {project_code}')
-        try:
-            for bucket_prefix in self.settings.S3_BUCKET_ZONE_PREFIXES:
-                bucket_name = bucket_prefix + '-' + project_code
-                await self.remove_bucket(bucket_name)
-        except BucketNotFound:
-            pass
+        bucket_names = self.get_bucket_names(project_code)
+        results = await asyncio.gather(*map(self.remove_bucket, bucket_names), return_exceptions=True)
+        raise_first_error(result for result in results if not isinstance(result, BucketNotFound))
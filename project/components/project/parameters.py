@@ -13,6 +13,7 @@ from pydantic import validator
 from project.components.parameters import FilterParameters
 from project.components.parameters import SortByFields
 from project.components.project.filtering import ProjectFiltering
+from project.components.types import StrEnum
 
 
 class ProjectSortByFields(SortByFields):
@@ -33,10 +34,14 @@ class ProjectFilterParameters(FilterParameters):
     created_at_start: datetime | None = Query(default=None)
     created_at_end: datetime | None = Query(default=None)
     tags_all: str | None = Query(default=None)
+    tags_any: str | None = Query(default=None)
+    system_tags_all: str | None = Query(default=None)
+    system_tags_any: str | None = Query(default=None)
     is_discoverable: bool | None = Query(default=None)
     ids: str | None = Query(default=None)
+    q: str | None = Query(default=None, description='Search projects by words in code, name or description.')
 
-    @validator('code_any', 'tags_all')
+    @validator('code_any', 'tags_all', 'tags_any', 'system_tags_all', 'system_tags_any')
     def list_split_list_parameters(cls, value: str | None) -> list[str] | None:
         if not value:
             return None
@@ -68,6 +73,17 @@ class ProjectFilterParameters(FilterParameters):
             description=self.description,
             created_at=created_at,
             tags=self.tags_all,
+            tags_any=self.tags_any,
+            system_tags=self.system_tags_all,
+            system_tags_any=self.system_tags_any,
             is_discoverable=self.is_discoverable,
             ids=self.ids,
+            search=self.q,
         )
+
+
+class ProjectTagField(StrEnum):
+    """Project fields holding tags which can be counted."""
+
+    TAGS = 'tags'
+    SYSTEM_TAGS = 'system_tags'
@@ -0,0 +1,118 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import asyncio
+from collections.abc import Sequence
+from functools import partial
+from uuid import UUID
+
+from project.components.object_storage.policy import PolicyManager
+from project.components.pipeline import Pipeline
+from project.components.project.models import Project
+from project.components.project.object_storage_manager import ObjectStorageManager
+from project.logger import logger
+from project.services.auth import AuthClient
+from project.services.metadata import MetadataClient
+
+
+class ProjectProvisioner:
+    """Provision resources related to the project in object storage, auth and metadata services."""
+
+    def __init__(
+        self,
+        object_storage_manager: ObjectStorageManager,
+        policy_manager: PolicyManager,
+        auth_client: AuthClient,
+        metadata_client: MetadataClient,
+    ) -> None:
+        self.object_storage_manager = object_storage_manager
+        self.policy_manager = policy_manager
+        self.auth_client = auth_client
+        self.metadata_client = metadata_client
+
+    def build_pipeline(self, project: Project) -> Pipeline:
+        """Declare provisioning steps and dependencies between them.
+
+        Buckets, policies and platform admins lookup are independent, so they run concurrently. Auth service entities
+        and name folders cannot be rolled back, so they are created one after another only once object storage resources
+        are in place, which keeps rollback of a failed provisioning limited to policies and buckets.
+        """
+
+        code = project.code
+        pipeline = Pipeline()
+
+        pipeline.add_step('buckets', partial(self.object_storage_manager.create_buckets_for_project, project_code=code))
+        pipeline.add_step('policies', partial(self.policy_manager.create_policies_for_project, project_code=code))
+        pipeline.add_step(
+            'user_groups',
+            partial(self.auth_client.create_user_groups, project_code=code, description=project.description),
+            depends_on=['buckets', 'policies'],
+        )
+        pipeline.add_step(
+            'user_roles', partial(self.auth_client.create_user_roles, project_code=code), depends_on=['user_groups']
+        )
+        pipeline.add_step(
+            'default_permissions',
+            partial(self.auth_client.create_default_permissions, project_code=code),
+            depends_on=['user_roles'],
+        )
+        pipeline.add_step('platform_admins', self.auth_client.get_platform_admins)
+
+        async def create_users_name_folders() -> None:
+            users = pipeline.results['platform_admins']
+            await self.metadata_client.create_users_name_folders(project_code=code, users=users)
+
+        pipeline.add_step(
+            'users_name_folders', create_users_name_folders, depends_on=['default_permissions', 'platform_admins']
+        )
+
+        return pipeline
+
+    async def provision(self, project: Project) -> None:
+        """Create all resources required for the project."""
+
+        logger.info(f'Provisioning resources for project "{project.code}".')
+        await self.build_pipeline(project).run()
+
+    async def rollback(self, project: Project) -> None:
+        """Remove object storage resources created for the project.
+
+        Policies and buckets are removed concurrently and failure of one does not prevent removal of another.
+        """
+
+        logger.info(f'Rolling back resources for project "{project.code}".')
+        results = await asyncio.gather(
+            self.policy_manager.rollback_policies_for_project(project_code=project.code),
+            self.object_storage_manager.remove_buckets_for_project(project_code=project.code),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f'Unable to roll back resources for project "{project.code}": {result!r}')
+
+    async def provision_many(self, projects: Sequence[Project], concurrency: int) -> dict[UUID, Exception]:
+        """Provision resources for multiple projects with bounded concurrency.
+
+        Resources of the projects that failed are rolled back. Errors are returned by project ids.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def provision(project: Project) -> Exception | None:
+            async with semaphore:
+                try:
+                    await self.provision(project)
+                except Exception as e:
+                    logger.exception(f'Unable to provision resources for project "{project.code}".')
+                    await self.rollback(project)
+                    return e
+
+            return None
+
+        errors = await asyncio.gather(*map(provision, projects))
+
+        return {project.id: error for project, error in zip(projects, errors, strict=True) if error is not None}
@@ -5,21 +5,53 @@
 # You may not use this file except in compliance with the License.
 
 from base64 import urlsafe_b64decode
+from collections.abc import Collection
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
 import magic
 from pydantic import HttpUrl
+from pydantic import conlist
 from pydantic import constr
 from pydantic import validator
 
 from project.components.schemas import BaseSchema
 from project.components.schemas import ListResponseSchema
 from project.components.schemas import ParentOptionalFields
+from project.components.types import StrEnum
 from project.config import get_settings
 
 
+@lru_cache(1)
+def get_image_url_prefix() -> str:
+    """Return prefix of project image urls computed once from settings."""
+
+    return get_settings().S3_PREFIX_FOR_PROJECT_IMAGE_URLS.rstrip('/')
+
+
+def get_image_url(logo_name: str | None) -> str | None:
+    """Return url of project image by logo name."""
+
+    if logo_name:
+        return f'{get_image_url_prefix()}/{logo_name}'
+
+    return None
+
+
+RESERVED_PROJECT_CODES = frozenset({'export', 'tags'})
+
+
+def check_code_is_not_reserved(value: str | None) -> str | None:
+    """Reject codes which would collide with static routes under /projects/."""
+
+    if value in RESERVED_PROJECT_CODES:
+        raise ValueError(f'project code "{value}" is reserved')
+
+    return value
+
+
 class ProjectSchema(BaseSchema):
     """General project schema."""
 
@@ -35,16 +67,21 @@ class ProjectSchema(BaseSchema):
 class ProjectCreateSchema(ProjectSchema):
     """Project schema used for creation."""
 
+    _is_not_reserved_code = validator('code', allow_reuse=True)(check_code_is_not_reserved)
+
 
 class ProjectUpdateSchema(ProjectSchema, metaclass=ParentOptionalFields):
     """Project schema used for update."""
 
+    _is_not_reserved_code = validator('code', allow_reuse=True)(check_code_is_not_reserved)
+
 
 class ProjectResponseSchema(ProjectSchema):
     """Default schema for single project in response."""
 
     id: UUID
     created_at: datetime
+    updated_at: datetime
     image_url: HttpUrl | None = None
 
     class Config:
@@ -52,11 +89,15 @@ class ProjectResponseSchema(ProjectSchema):
 
     @validator('image_url', always=True)
     def set_image_url(cls, _: Any, values: dict[str, Any]) -> str | None:
-        if logo_name := values['logo_name']:
-            prefix = get_settings().S3_PREFIX_FOR_PROJECT_IMAGE_URLS.rstrip('/')
-            return f'{prefix}/{logo_name}'
+        return get_image_url(values['logo_name'])
 
-        return None
+    @classmethod
+    def dump(cls, entry: Any, fields: Collection[str] | None = None) -> dict[str, Any]:
+        values = super().dump(entry, fields)
+        if 'image_url' in values:
+            values['image_url'] = get_image_url(entry.logo_name)
+
+        return values
 
 
 class ProjectListResponseSchema(ListResponseSchema):
@@ -65,6 +106,79 @@ class ProjectListResponseSchema(ListResponseSchema):
     result: list[ProjectResponseSchema]
 
 
+class ProjectBatchCreateSchema(BaseSchema):
+    """Schema used for creation of multiple projects at once."""
+
+    projects: conlist(ProjectCreateSchema, min_items=1, max_items=get_settings().PROJECT_BATCH_MAX_SIZE)
+
+    @validator('projects')
+    def has_unique_codes(cls, value: list[ProjectCreateSchema]) -> list[ProjectCreateSchema]:
+        codes = [project.code for project in value]
+        if len(set(codes)) != len(codes):
+            raise ValueError('project codes must be unique')
+
+        return value
+
+
+class ProjectBatchItemStatus(StrEnum):
+    """Available statuses of project creation in batch."""
+
+    CREATED = 'created'
+    FAILED = 'failed'
+
+
+class ProjectBatchItemResponseSchema(BaseSchema):
+    """Schema for result of single project creation in batch."""
+
+    code: str
+    status: ProjectBatchItemStatus
+    project: ProjectResponseSchema | None = None
+    error: dict[str, str] | None = None
+
+
+class ProjectBatchResponseSchema(BaseSchema):
+    """Default schema for results of multiple projects creation in response."""
+
+    result: list[ProjectBatchItemResponseSchema]
+
+
+class ProjectResolveSchema(BaseSchema):
+    """Schema used for resolving multiple projects by ids or codes at once."""
+
+    ids_or_codes: conlist(str, min_items=1, max_items=get_settings().PROJECT_RESOLVE_MAX_SIZE)
+
+    def get_parsed_ids_or_codes(self) -> dict[str, UUID | str]:
+        """Return input values mapped to project ids when they are valid UUIDs or to project codes otherwise."""
+
+        parsed = {}
+        for value in self.ids_or_codes:
+            try:
+                parsed[value] = UUID(value)
+            except ValueError:
+                parsed[value] = value
+
+        return parsed
+
+
+class ProjectResolveResponseSchema(BaseSchema):
+    """Default schema for projects resolved by ids or codes, missing projects are represented by null."""
+
+    result: dict[str, ProjectResponseSchema | None]
+
+
+class ProjectTagCountSchema(BaseSchema):
+    """Schema for number of projects having the tag."""
+
+    tag: str
+    count: int
+
+
+class ProjectTagCountListResponseSchema(BaseSchema):
+    """Default schema for numbers of projects per tag in response."""
+
+    result: list[ProjectTagCountSchema]
+
+
 class ProjectLogoUploadSchema(BaseSchema):
     """Project logo schema used for image upload."""
 
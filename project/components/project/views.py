@@ -4,67 +4,158 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from functools import partial
 from uuid import UUID
 
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Query
+from fastapi import Request
 from fastapi.responses import Response
-
+from fastapi.responses import StreamingResponse
+
+from project.components.conditional import ConditionalRequest
+from project.components.conditional import get_entry_version
+from project.components.conditional import get_etag
+from project.components.conditional import get_fields_etag
+from project.components.conditional import get_page_etag
+from project.components.exceptions import AlreadyExists
 from project.components.exceptions import UnhandledException
-from project.components.object_storage.policy import PolicyManager
-from project.components.object_storage.policy import get_policy_manager
+from project.components.export import ExportFormat
+from project.components.export import create_export_response
+from project.components.pagination import get_next_page_link
+from project.components.parameters import FieldsParameters
 from project.components.parameters import PageParameters
 from project.components.parameters import SortParameters
+from project.components.project.cache import ProjectCache
 from project.components.project.crud import ProjectCRUD
 from project.components.project.dependencies import get_logo_uploader
-from project.components.project.dependencies import get_object_storage_manager
+from project.components.project.dependencies import get_project_cache
 from project.components.project.dependencies import get_project_crud
+from project.components.project.dependencies import get_project_provisioner
 from project.components.project.logo_uploader import LogoUploader
-from project.components.project.object_storage_manager import ObjectStorageManager
 from project.components.project.parameters import ProjectFilterParameters
 from project.components.project.parameters import ProjectSortByFields
+from project.components.project.parameters import ProjectTagField
+from project.components.project.provisioner import ProjectProvisioner
+from project.components.project.schemas import ProjectBatchCreateSchema
+from project.components.project.schemas import ProjectBatchItemResponseSchema
+from project.components.project.schemas import ProjectBatchItemStatus
+from project.components.project.schemas import ProjectBatchResponseSchema
 from project.components.project.schemas import ProjectCreateSchema
 from project.components.project.schemas import ProjectListResponseSchema
 from project.components.project.schemas import ProjectLogoUploadSchema
+from project.components.project.schemas import ProjectResolveResponseSchema
+from project.components.project.schemas import ProjectResolveSchema
 from project.components.project.schemas import ProjectResponseSchema
+from project.components.project.schemas import ProjectTagCountListResponseSchema
+from project.components.project.schemas import ProjectTagCountSchema
 from project.components.project.schemas import ProjectUpdateSchema
-from project.services.auth import AuthClient
-from project.services.auth import get_auth_client
-from project.services.metadata import MetadataClient
-from project.services.metadata import get_metadata_client
+from project.components.responses import FastJSONResponse
+from project.config import Settings
+from project.config import get_settings
+from project.dependencies import add_after_commit_callback
 
 router = APIRouter(prefix='/projects', tags=['Projects'])
 
 
 @router.get('/', summary='List all projects.', response_model=ProjectListResponseSchema)
 async def list_projects(
+    request: Request,
     filter_parameters: ProjectFilterParameters = Depends(),
     sort_parameters: SortParameters.with_sort_by_fields(ProjectSortByFields) = Depends(),
     page_parameters: PageParameters = Depends(),
+    fields_parameters: FieldsParameters.with_schema(ProjectResponseSchema) = Depends(),
     project_crud: ProjectCRUD = Depends(get_project_crud),
+    conditional_request: ConditionalRequest = Depends(),
+    settings: Settings = Depends(get_settings),
 ) -> ProjectListResponseSchema:
     """List all projects."""
 
     filtering = filter_parameters.to_filtering()
     sorting = sort_parameters.to_sorting()
-    pagination = page_parameters.to_pagination()
+    pagination = page_parameters.to_pagination(settings.PAGE_SIZE_MAX, settings.PAGE_FETCH_CHUNK_SIZE)
+    fields = fields_parameters.to_fields()
 
     async with project_crud:
-        page = await project_crud.paginate(pagination, sorting, filtering)
+        page = await project_crud.paginate(pagination, sorting, filtering, fields)
 
-    response = ProjectListResponseSchema.from_page(page)
+    etag = get_fields_etag(get_page_etag(page), fields)
+    if not_modified := conditional_request.evaluate(etag):
+        return not_modified
 
-    return response
+    if link := get_next_page_link(request.url, page):
+        conditional_request.response.headers['Link'] = link
+
+    content = ProjectListResponseSchema.dump_page(page, fields)
+
+    return FastJSONResponse(content, headers=conditional_request.response.headers)
+
+
+@router.get('/export', summary='Export all projects.', response_class=StreamingResponse)
+async def export_projects(
+    filter_parameters: ProjectFilterParameters = Depends(),
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias='format'),
+    project_crud: ProjectCRUD = Depends(get_project_crud),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """Export all projects matching filters as NDJSON or CSV.
+
+    Projects are streamed while they are fetched from the database, so the whole table is never held in memory.
+    """
+
+    filtering = filter_parameters.to_filtering()
+    chunks = project_crud.stream(filtering, settings.EXPORT_CHUNK_SIZE)
+
+    return create_export_response(chunks, ProjectResponseSchema, export_format, 'projects')
+
+
+@router.get('/tags', summary='Count projects per tag.', response_model=ProjectTagCountListResponseSchema)
+async def count_project_tags(
+    filter_parameters: ProjectFilterParameters = Depends(),
+    field: ProjectTagField = Query(default=ProjectTagField.TAGS),
+    project_crud: ProjectCRUD = Depends(get_project_crud),
+) -> ProjectTagCountListResponseSchema:
+    """Count projects matching filters per each tag, most frequent tags first."""
+
+    filtering = filter_parameters.to_filtering()
+
+    async with project_crud:
+        tag_counts = await project_crud.count_tags(field.value, filtering)
+
+    return ProjectTagCountListResponseSchema(
+        result=[ProjectTagCountSchema(tag=tag, count=count) for tag, count in tag_counts]
+    )
 
 
 @router.get('/{project_id}', summary='Get a project by id or code.', response_model=ProjectResponseSchema)
 async def get_project(
-    project_id: UUID | str, project_crud: ProjectCRUD = Depends(get_project_crud)
+    project_id: UUID | str,
+    fields_parameters: FieldsParameters.with_schema(ProjectResponseSchema) = Depends(),
+    project_crud: ProjectCRUD = Depends(get_project_crud),
+    project_cache: ProjectCache = Depends(get_project_cache),
+    conditional_request: ConditionalRequest = Depends(),
 ) -> ProjectResponseSchema:
-    """Get a project by id or code."""
+    """Get a project by id or code.
 
-    async with project_crud:
-        project = await project_crud.retrieve_by_id_or_code(project_id)
+    The whole project is always retrieved to be cached, specified fields only narrow down the response.
+    """
+
+    fields = fields_parameters.to_fields()
+
+    project = await project_cache.get(project_id)
+    if project is None:
+        async with project_crud:
+            project = await project_crud.retrieve_by_id_or_code(project_id)
+        project = await project_cache.set(project)
+
+    etag = get_fields_etag(get_etag(*get_entry_version(project)), fields)
+    if not_modified := conditional_request.evaluate(etag, project.updated_at):
+        return not_modified
+
+    if fields:
+        content = ProjectResponseSchema.dump(project, fields)
+        return FastJSONResponse(content, headers=conditional_request.response.headers)
 
     return project
 
@@ -73,10 +164,7 @@ async def get_project(
 async def create_project(
     body: ProjectCreateSchema,
     project_crud: ProjectCRUD = Depends(get_project_crud),
-    object_storage_manager: ObjectStorageManager = Depends(get_object_storage_manager),
-    policy_manager: PolicyManager = Depends(get_policy_manager),
-    auth_client: AuthClient = Depends(get_auth_client),
-    metadata_client: MetadataClient = Depends(get_metadata_client),
+    project_provisioner: ProjectProvisioner = Depends(get_project_provisioner),
 ) -> ProjectResponseSchema:
     """Create a new project."""
 
@@ -84,41 +172,119 @@ async def create_project(
         project = await project_crud.create(body)
 
     try:
-        await object_storage_manager.create_buckets_for_project(project_code=project.code)
-        await policy_manager.create_policies_for_project(project_code=project.code)
-        await auth_client.create_user_groups(project_code=project.code, description=project.description)
-        await auth_client.create_user_roles(project_code=project.code)
-        await auth_client.create_default_permissions(project_code=project.code)
-        platform_admins = await auth_client.get_platform_admins()
-        await metadata_client.create_users_name_folders(project_code=project.code, users=platform_admins)
+        await project_provisioner.provision(project)
     except Exception:
-        await policy_manager.rollback_policies_for_project(project_code=project.code)
-        await object_storage_manager.remove_buckets_for_project(project_code=project.code)
+        await project_provisioner.rollback(project)
         await project_crud.delete(project.id)
         raise UnhandledException()
 
     return project
 
 
+@router.post('/batch', summary='Create multiple projects at once.', response_model=ProjectBatchResponseSchema)
+async def create_projects_batch(
+    body: ProjectBatchCreateSchema,
+    project_crud: ProjectCRUD = Depends(get_project_crud),
+    project_provisioner: ProjectProvisioner = Depends(get_project_provisioner),
+    settings: Settings = Depends(get_settings),
+) -> ProjectBatchResponseSchema:
+    """Create multiple projects and provision their resources.
+
+    Projects are inserted with a single statement, projects with already existing codes are reported as failed. Projects
+    which resources failed to be provisioned are removed and reported as failed as well.
+    """
+
+    async with project_crud:
+        projects = await project_crud.create_many(body.projects)
+
+    errors = await project_provisioner.provision_many(projects, settings.PROJECT_BATCH_PROVISIONING_CONCURRENCY)
+
+    async with project_crud:
+        for project_id in errors:
+            await project_crud.delete(project_id)
+
+    inserted_codes = {project.code for project in projects}
+    created = {project.code: project for project in projects if project.id not in errors}
+
+    result = []
+    for code in (project_create.code for project_create in body.projects):
+        if code in created:
+            item = ProjectBatchItemResponseSchema(
+                code=code, status=ProjectBatchItemStatus.CREATED, project=created[code]
+            )
+        else:
+            error = UnhandledException() if code in inserted_codes else AlreadyExists()
+            item = ProjectBatchItemResponseSchema(code=code, status=ProjectBatchItemStatus.FAILED, error=error.dict())
+        result.append(item)
+
+    return ProjectBatchResponseSchema(result=result)
+
+
+@router.post('/resolve', summary='Get multiple projects by ids or codes.', response_model=ProjectResolveResponseSchema)
+async def resolve_projects(
+    body: ProjectResolveSchema,
+    project_crud: ProjectCRUD = Depends(get_project_crud),
+    project_cache: ProjectCache = Depends(get_project_cache),
+) -> ProjectResolveResponseSchema:
+    """Get multiple projects by ids or codes at once, results are keyed by the values as they were received.
+
+    Projects are taken from the cache with batch lookups, the rest are fetched with one query for ids and one for codes.
+    """
+
+    parsed_ids_or_codes = body.get_parsed_ids_or_codes()
+    ids_or_codes = set(parsed_ids_or_codes.values())
+    resolved = await project_cache.get_many(ids_or_codes)
+
+    missing = ids_or_codes - resolved.keys()
+    missing_ids = {id_or_code for id_or_code in missing if isinstance(id_or_code, UUID)}
+    missing_codes = missing - missing_ids
+
+    projects = []
+    async with project_crud:
+        if missing_ids:
+            projects += await project_crud.list_by_ids(missing_ids)
+        if missing_codes:
+            projects += await project_crud.list_by_codes(missing_codes)
+
+    for project in await project_cache.set_many(projects):
+        resolved[project.id] = project
+        resolved[project.code] = project
+
+    return ProjectResolveResponseSchema(
+        result={value: resolved.get(id_or_code) for value, id_or_code in parsed_ids_or_codes.items()}
+    )
+
+
 @router.patch('/{project_id}', summary='Update a project.', response_model=ProjectResponseSchema)
 async def update_project(
-    project_id: UUID, body: ProjectUpdateSchema, project_crud: ProjectCRUD = Depends(get_project_crud)
+    project_id: UUID,
+    body: ProjectUpdateSchema,
+    project_crud: ProjectCRUD = Depends(get_project_crud),
+    project_cache: ProjectCache = Depends(get_project_cache),
 ) -> ProjectResponseSchema:
     """Update a project."""
 
     async with project_crud:
         project = await project_crud.update(project_id, body)
 
+    add_after_commit_callback(project_crud.session, partial(project_cache.invalidate, project_id))
+
     return project
 
 
 @router.delete('/{project_id}', summary='Delete a project.')
-async def delete_project(project_id: UUID, project_crud: ProjectCRUD = Depends(get_project_crud)) -> Response:
+async def delete_project(
+    project_id: UUID,
+    project_crud: ProjectCRUD = Depends(get_project_crud),
+    project_cache: ProjectCache = Depends(get_project_cache),
+) -> Response:
     """Delete a project."""
 
     async with project_crud:
         await project_crud.delete(project_id)
 
+    add_after_commit_callback(project_crud.session, partial(project_cache.invalidate, project_id))
+
     response = Response(status_code=204)
 
     return response
@@ -130,6 +296,7 @@ async def upload_project_logo(
     body: ProjectLogoUploadSchema,
     project_crud: ProjectCRUD = Depends(get_project_crud),
     logo_uploader: LogoUploader = Depends(get_logo_uploader),
+    project_cache: ProjectCache = Depends(get_project_cache),
 ) -> ProjectResponseSchema:
     """Upload a logo for a project."""
 
@@ -145,4 +312,6 @@ async def upload_project_logo(
         project_update = ProjectUpdateSchema(logo_name=logo_name)
         project = await project_crud.update(project_id, project_update)
 
+    add_after_commit_callback(project_crud.session, partial(project_cache.invalidate, project_id))
+
     return project
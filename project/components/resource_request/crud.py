@@ -5,8 +5,13 @@
 # You may not use this file except in compliance with the License.
 
 from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm import contains_eager
+from sqlalchemy.orm import join
+from sqlalchemy.sql import FromClause
+from sqlalchemy.sql import Insert
 from sqlalchemy.sql import Select
+from sqlalchemy.sql import Update
 
 from project.components.crud import CRUD
 from project.components.project.models import Project
@@ -22,3 +27,24 @@ class ResourceRequestCRUD(CRUD):
     def select_query(self) -> Select:
         """Return base select including join with Project model."""
         return select(self.model).join(Project).options(contains_eager(self.model.project))
+
+    @property
+    def from_clause(self) -> FromClause:
+        """Return join with Project model, so filtering by project fields is applied the same way as in select."""
+        return join(self.model, Project)
+
+    def _select_returning(self, statement: Insert | Update) -> Select:
+        """Return select which joins Project model to the rows returned by insert or update statement.
+
+        The statement is used as data-modifying CTE, so entries are still loaded along with project in one query.
+        """
+
+        returning = statement.returning(*self.model.__table__.columns).cte('returning')
+        resource_request = aliased(self.model, returning)
+
+        return (
+            select(resource_request)
+            .join(resource_request.project)
+            .options(contains_eager(resource_request.project))
+            .execution_options(populate_existing=True)
+        )
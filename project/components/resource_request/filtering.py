@@ -4,12 +4,28 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from sqlalchemy import func
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql import Select
 
 from project.components.filtering import Filtering
+from project.components.project.models import Project
 from project.components.resource_request.models import ResourceRequest
 
 
+def case_insensitive_match(column: InstrumentedAttribute, pattern: str) -> ColumnElement:
+    """Return case-insensitive match of the column with the pattern.
+
+    Patterns without wildcards are compared as lowercase values, so the comparison can use an index on lower(column).
+    """
+
+    if '%' in pattern or '_' in pattern:
+        return column.ilike(pattern)
+
+    return func.lower(column) == pattern.lower()
+
+
 class ResourceRequestFiltering(Filtering):
     """Resource Request filter params."""
 
@@ -18,11 +34,14 @@ class ResourceRequestFiltering(Filtering):
     project_code: str | None = None
 
     def apply(self, statement: Select, model: type[ResourceRequest]) -> Select:
-        """Apply filter to SQL query."""
+        """Apply filter to SQL query.
+
+        Statement is expected to be joined with Project model, so project code is compared within the join.
+        """
         if self.username:
-            statement = statement.where(model.username.ilike(self.username))
+            statement = statement.where(case_insensitive_match(model.username, self.username))
         if self.email:
-            statement = statement.where(model.email.ilike(self.email))
+            statement = statement.where(case_insensitive_match(model.email, self.email))
         if self.project_code:
-            statement = statement.filter(model.project.has(code=self.project_code))
+            statement = statement.where(Project.code == self.project_code)
         return statement
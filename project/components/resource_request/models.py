@@ -10,7 +10,9 @@ from uuid import uuid4
 from sqlalchemy import VARCHAR
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import UniqueConstraint
+from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID
@@ -30,10 +32,14 @@ class ResourceRequest(DBModel):
             'requested_for',
             name='user_id_project_id_requested_for',
         ),
+        Index('ix_project_resource_requests_project_id_requested_at', 'project_id', 'requested_at'),
+        Index('ix_project_resource_requests_requested_at', 'requested_at'),
+        Index('ix_project_resource_requests_lower_username', text('lower(username)')),
+        Index('ix_project_resource_requests_lower_email', text('lower(email)')),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
     user_id = Column(VARCHAR(length=256), nullable=False)
     username = Column(VARCHAR(length=256), nullable=False)
     email = Column(VARCHAR(length=256), nullable=False)
@@ -42,5 +48,6 @@ class ResourceRequest(DBModel):
     completed_at = Column(TIMESTAMP(timezone=True), nullable=True)
     message = Column(VARCHAR(length=100), nullable=True)
     vm_connections = Column(JSONB(), nullable=True)
+    updated_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     project = relationship('Project', back_populates='resource_requests')
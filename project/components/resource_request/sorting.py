@@ -4,7 +4,7 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
-from sqlalchemy.sql import Select
+from sqlalchemy.orm import InstrumentedAttribute
 
 from project.components.project.models import Project
 from project.components.resource_request.models import ResourceRequest
@@ -14,15 +14,13 @@ from project.components.sorting import Sorting
 class ResourceRequestSorting(Sorting):
     """Resource request sorting control parameters."""
 
-    def apply(self, statement: Select, model: ResourceRequest) -> Select:
-        """Return statement with applied ordering.
+    def get_column(self, model: type[ResourceRequest]) -> InstrumentedAttribute:
+        """Return model attribute the ordering is applied to.
 
         This is necessary to allow sorting by fields from the relationship model.
         """
         try:
             _, relationship_field = self.field.split('.', 1)
-            self.field = relationship_field
-            model = Project
+            return getattr(Project, relationship_field)
         except ValueError:
-            pass
-        return super().apply(statement, model)
+            return super().get_column(model)
@@ -4,15 +4,28 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Query
+from fastapi import Request
 from fastapi.responses import Response
-
+from fastapi.responses import StreamingResponse
+
+from project.components.conditional import ConditionalRequest
+from project.components.conditional import get_etag
+from project.components.conditional import get_fields_etag
+from project.components.conditional import get_page_etag
+from project.components.export import ExportFormat
+from project.components.export import create_export_response
+from project.components.pagination import get_next_page_link
+from project.components.parameters import FieldsParameters
 from project.components.parameters import PageParameters
 from project.components.resource_request.crud import ResourceRequestCRUD
 from project.components.resource_request.dependencies import get_resource_request_crud
+from project.components.resource_request.models import ResourceRequest
 from project.components.resource_request.parameters import ResourceRequestFilterParameters
 from project.components.resource_request.parameters import ResourceRequestSortByFields
 from project.components.resource_request.parameters import ResourceRequestSortParameters
@@ -20,28 +33,67 @@ from project.components.resource_request.schemas import ResourceRequestCreateSch
 from project.components.resource_request.schemas import ResourceRequestListResponseSchema
 from project.components.resource_request.schemas import ResourceRequestResponseSchema
 from project.components.resource_request.schemas import ResourceRequestUpdateSchema
+from project.components.responses import FastJSONResponse
+from project.config import Settings
+from project.config import get_settings
 
 router = APIRouter(prefix='/resource-requests', tags=['Resource Requests'])
 
 
+def get_resource_request_version(resource_request: ResourceRequest) -> tuple[Any, ...]:
+    """Return parts which change along with the resource request representation including embedded project."""
+
+    return resource_request.id, resource_request.updated_at, resource_request.project.updated_at
+
+
 @router.get('/', summary='List all resource requests.', response_model=ResourceRequestListResponseSchema)
 async def list_resource_requests(
+    request: Request,
     page_parameters: PageParameters = Depends(),
     sort_parameters: ResourceRequestSortParameters.with_sort_by_fields(ResourceRequestSortByFields) = Depends(),
     filter_params: ResourceRequestFilterParameters = Depends(),
+    fields_parameters: FieldsParameters.with_schema(ResourceRequestResponseSchema) = Depends(),
     resource_request_crud: ResourceRequestCRUD = Depends(get_resource_request_crud),
+    conditional_request: ConditionalRequest = Depends(),
+    settings: Settings = Depends(get_settings),
 ) -> ResourceRequestListResponseSchema:
     """List all resource requests."""
 
     sorting = sort_parameters.to_sorting()
-    pagination = page_parameters.to_pagination()
+    pagination = page_parameters.to_pagination(settings.PAGE_SIZE_MAX, settings.PAGE_FETCH_CHUNK_SIZE)
     filtering = filter_params.to_filtering()
+    fields = fields_parameters.to_fields()
 
-    page = await resource_request_crud.paginate(pagination, sorting, filtering)
+    page = await resource_request_crud.paginate(pagination, sorting, filtering, fields)
 
-    response = ResourceRequestListResponseSchema.from_page(page)
+    etag = get_fields_etag(get_page_etag(page, get_resource_request_version), fields)
+    if not_modified := conditional_request.evaluate(etag):
+        return not_modified
 
-    return response
+    if link := get_next_page_link(request.url, page):
+        conditional_request.response.headers['Link'] = link
+
+    content = ResourceRequestListResponseSchema.dump_page(page, fields)
+
+    return FastJSONResponse(content, headers=conditional_request.response.headers)
+
+
+@router.get('/export', summary='Export all resource requests.', response_class=StreamingResponse)
+async def export_resource_requests(
+    filter_params: ResourceRequestFilterParameters = Depends(),
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias='format'),
+    resource_request_crud: ResourceRequestCRUD = Depends(get_resource_request_crud),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """Export all resource requests matching filters as NDJSON or CSV.
+
+    Resource requests are streamed while they are fetched from the database, so the whole table is never held in memory.
+    """
+
+    filtering = filter_params.to_filtering()
+    chunks = resource_request_crud.stream(filtering, settings.EXPORT_CHUNK_SIZE)
+
+    return create_export_response(chunks, ResourceRequestResponseSchema, export_format, 'resource-requests')
 
 
 @router.get(
@@ -50,11 +102,26 @@ async def list_resource_requests(
     response_model=ResourceRequestResponseSchema,
 )
 async def get_resource_request(
-    resource_request_id: UUID, resource_request_crud: ResourceRequestCRUD = Depends(get_resource_request_crud)
+    resource_request_id: UUID,
+    fields_parameters: FieldsParameters.with_schema(ResourceRequestResponseSchema) = Depends(),
+    resource_request_crud: ResourceRequestCRUD = Depends(get_resource_request_crud),
+    conditional_request: ConditionalRequest = Depends(),
 ) -> ResourceRequestResponseSchema:
     """Get a resource request by id."""
 
-    resource_request = await resource_request_crud.retrieve_by_id(resource_request_id)
+    fields = fields_parameters.to_fields()
+
+    resource_request = await resource_request_crud.retrieve_by_id(resource_request_id, fields)
+
+    etag = get_fields_etag(get_etag(*get_resource_request_version(resource_request)), fields)
+    last_modified = max(resource_request.updated_at, resource_request.project.updated_at)
+    if not_modified := conditional_request.evaluate(etag, last_modified):
+        return not_modified
+
+    if fields:
+        content = ResourceRequestResponseSchema.dump(resource_request, fields)
+        return FastJSONResponse(content, headers=conditional_request.response.headers)
+
     return resource_request
 
 
@@ -0,0 +1,43 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from datetime import date
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def encode_default(value: Any) -> Any:
+    """Encode values which are not supported natively by orjson, such as UUID subclasses returned by asyncpg."""
+
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode content as JSON with orjson."""
+
+    return orjson.dumps(content, default=encode_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response which encodes content as is without conversion by jsonable_encoder.
+
+    Content is expected to contain only primitive types, UUIDs, datetimes and enums. It is encoded with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
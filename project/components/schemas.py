@@ -5,6 +5,8 @@
 # You may not use this file except in compliance with the License.
 
 import json
+from collections.abc import Collection
+from functools import lru_cache
 from typing import Any
 from typing import Optional
 from typing import get_type_hints
@@ -45,15 +47,68 @@ class BaseSchema(BaseModel):
     def to_payload(self) -> dict[str, str]:
         return json.loads(self.json())
 
+    @classmethod
+    def dump(cls, entry: Any, fields: Collection[str] | None = None) -> dict[str, Any]:
+        """Represent the entry as a dict of schema fields without model validation.
+
+        Attributes are read from the entry as they are, so it is expected to hold already valid values. When fields are
+        specified only these attributes are read, so columns which are not selected are never fetched.
+        """
+
+        values = {}
+        for name, schema in get_dump_fields(cls):
+            if fields is not None and name not in fields:
+                continue
+
+            value = getattr(entry, name, None)
+            if schema is not None and value is not None:
+                value = schema.dump(value)
+            values[name] = value
+
+        return values
+
+
+@lru_cache
+def get_dump_fields(schema: type[BaseSchema]) -> tuple[tuple[str, type[BaseSchema] | None], ...]:
+    """Return names of the schema fields along with schemas of nested fields."""
+
+    dump_fields = []
+    for name, field in schema.__fields__.items():
+        nested_schema = field.type_ if isinstance(field.type_, type) and issubclass(field.type_, BaseSchema) else None
+        dump_fields.append((name, nested_schema))
+
+    return tuple(dump_fields)
+
 
 class ListResponseSchema(BaseSchema):
     """Default schema for multiple base schemas in response."""
 
-    num_of_pages: int
+    num_of_pages: int | None
     page: int
-    total: int
+    total: int | None
+    next_cursor: str | None = None
     result: list[BaseSchema]
 
     @classmethod
     def from_page(cls, page: Page):
-        return cls(num_of_pages=page.total_pages, page=page.number, total=page.count, result=page.entries)
+        return cls(
+            num_of_pages=page.total_pages,
+            page=page.number,
+            total=page.count,
+            next_cursor=page.next_cursor,
+            result=page.entries,
+        )
+
+    @classmethod
+    def dump_page(cls, page: Page, fields: Collection[str] | None = None) -> dict[str, Any]:
+        """Represent page as a dict without model validation of the entries."""
+
+        schema = cls.__fields__['result'].type_
+
+        return {
+            'num_of_pages': page.total_pages,
+            'page': page.number,
+            'total': page.count,
+            'next_cursor': page.next_cursor,
+            'result': [schema.dump(entry, fields) for entry in page.entries],
+        }
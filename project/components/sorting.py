@@ -7,6 +7,7 @@
 from pydantic import BaseModel
 from sqlalchemy import asc
 from sqlalchemy import desc
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql import Select
 
 from project.components import DBModel
@@ -31,10 +32,15 @@ class Sorting(BaseModel):
 
         return self.field is not None
 
+    def get_column(self, model: type[DBModel]) -> InstrumentedAttribute:
+        """Return model attribute the ordering is applied to."""
+
+        return getattr(model, self.field)
+
     def apply(self, statement: Select, model: type[DBModel]) -> Select:
         """Return statement with applied ordering."""
 
-        field = getattr(model, self.field)
+        field = self.get_column(model)
 
         order_by = asc(field)
         if self.order is SortingOrder.DESC:
@@ -10,6 +10,7 @@ from uuid import uuid4
 from sqlalchemy import VARCHAR
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -21,11 +22,13 @@ class Workbench(DBModel):
     """Workbench database model."""
 
     __tablename__ = 'workbenches'
+    __table_args__ = (Index('ix_project_workbenches_project_id_deployed_at', 'project_id', 'deployed_at'),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
     resource = Column(VARCHAR(length=256), nullable=False)
     deployed_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow, nullable=False)
     deployed_by_user_id = Column(VARCHAR(length=256), nullable=False)
+    updated_at = Column(TIMESTAMP(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     project = relationship('Project', back_populates='workbenches')
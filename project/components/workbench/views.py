@@ -8,9 +8,18 @@ from uuid import UUID
 
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Request
 from fastapi.responses import Response
 
+from project.components.conditional import ConditionalRequest
+from project.components.conditional import get_entry_version
+from project.components.conditional import get_etag
+from project.components.conditional import get_fields_etag
+from project.components.conditional import get_page_etag
+from project.components.pagination import get_next_page_link
+from project.components.parameters import FieldsParameters
 from project.components.parameters import PageParameters
+from project.components.responses import FastJSONResponse
 from project.components.workbench.crud import WorkbenchCRUD
 from project.components.workbench.dependencies import get_workbench_crud
 from project.components.workbench.parameters import WorkbenchFilterParameters
@@ -18,34 +27,61 @@ from project.components.workbench.schemas import WorkbenchCreateSchema
 from project.components.workbench.schemas import WorkbenchListResponseSchema
 from project.components.workbench.schemas import WorkbenchResponseSchema
 from project.components.workbench.schemas import WorkbenchUpdateSchema
+from project.config import Settings
+from project.config import get_settings
 
 router = APIRouter(prefix='/workbenches', tags=['Workbenches'])
 
 
 @router.get('/', summary='List all workbenches.', response_model=WorkbenchListResponseSchema)
 async def list_workbenches(
+    request: Request,
     filter_parameters: WorkbenchFilterParameters = Depends(),
     page_parameters: PageParameters = Depends(),
+    fields_parameters: FieldsParameters.with_schema(WorkbenchResponseSchema) = Depends(),
     workbench_crud: WorkbenchCRUD = Depends(get_workbench_crud),
+    conditional_request: ConditionalRequest = Depends(),
+    settings: Settings = Depends(get_settings),
 ) -> WorkbenchListResponseSchema:
     """List all workbenches."""
     filtering = filter_parameters.to_filtering()
-    pagination = page_parameters.to_pagination()
+    pagination = page_parameters.to_pagination(settings.PAGE_SIZE_MAX, settings.PAGE_FETCH_CHUNK_SIZE)
+    fields = fields_parameters.to_fields()
 
-    page = await workbench_crud.paginate(pagination, filtering=filtering)
+    page = await workbench_crud.paginate(pagination, filtering=filtering, fields=fields)
 
-    response = WorkbenchListResponseSchema.from_page(page)
+    etag = get_fields_etag(get_page_etag(page), fields)
+    if not_modified := conditional_request.evaluate(etag):
+        return not_modified
 
-    return response
+    if link := get_next_page_link(request.url, page):
+        conditional_request.response.headers['Link'] = link
+
+    content = WorkbenchListResponseSchema.dump_page(page, fields)
+
+    return FastJSONResponse(content, headers=conditional_request.response.headers)
 
 
 @router.get('/{workbench_id}', summary='Get a workbench by id.', response_model=WorkbenchResponseSchema)
 async def get_workbench(
-    workbench_id: UUID | str, workbench_crud: WorkbenchCRUD = Depends(get_workbench_crud)
+    workbench_id: UUID | str,
+    fields_parameters: FieldsParameters.with_schema(WorkbenchResponseSchema) = Depends(),
+    workbench_crud: WorkbenchCRUD = Depends(get_workbench_crud),
+    conditional_request: ConditionalRequest = Depends(),
 ) -> WorkbenchResponseSchema:
     """Get a workbench by id."""
 
-    workbench = await workbench_crud.retrieve_by_id(workbench_id)
+    fields = fields_parameters.to_fields()
+
+    workbench = await workbench_crud.retrieve_by_id(workbench_id, fields)
+
+    etag = get_fields_etag(get_etag(*get_entry_version(workbench)), fields)
+    if not_modified := conditional_request.evaluate(etag, workbench.updated_at):
+        return not_modified
+
+    if fields:
+        content = WorkbenchResponseSchema.dump(workbench, fields)
+        return FastJSONResponse(content, headers=conditional_request.response.headers)
 
     return workbench
 
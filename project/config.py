@@ -7,6 +7,7 @@
 import logging
 from functools import lru_cache
 from typing import Any
+from typing import Literal
 
 from pydantic import BaseSettings
 from pydantic import Extra
@@ -32,6 +33,13 @@ class Settings(BaseSettings):
     RDS_DB_PASSWORD: str = Field('postgres-project-pilot', env={'RDS_DB_PASSWORD', 'OPSDB_UTILITY_PASSWORD'})
     RDS_DB_NAME: str = 'project'
     RDS_ECHO_SQL_QUERIES: bool = False
+    RDS_POOL_SIZE: int = 10
+    RDS_POOL_MAX_OVERFLOW: int = 20
+    RDS_POOL_TIMEOUT: int = 30
+    RDS_POOL_RECYCLE: int = 1800
+    RDS_POOL_PRE_PING: bool = True
+    RDS_POOL_WARM_UP_SIZE: int = 5
+    RDS_STATEMENT_CACHE_SIZE: int = 100
 
     S3_HOST: str = '127.0.0.1'
     S3_PORT: int = 9100
@@ -43,17 +51,43 @@ class Settings(BaseSettings):
     S3_BUCKET_ZONE_PREFIXES: list[str] = ['gr', 'core']
     S3_BUCKET_FOR_PROJECT_LOGOS: str = 'project-logos'
     S3_PREFIX_FOR_PROJECT_IMAGE_URLS: HttpUrl = 'http://127.0.0.1:9100/project-logos'
+    S3_MAX_POOL_CONNECTIONS: int = 50
+    S3_BUCKET_OPERATIONS_CONCURRENCY: int = 5
+    S3_POLICY_CACHE_SIZE: int = 1024
 
     OPEN_TELEMETRY_ENABLED: bool = False
     OPEN_TELEMETRY_HOST: str = '127.0.0.1'
     OPEN_TELEMETRY_PORT: int = 6831
+    OPEN_TELEMETRY_EXPORTER: Literal['jaeger', 'otlp'] = 'jaeger'
+    OPEN_TELEMETRY_OTLP_ENDPOINT: str = 'http://127.0.0.1:4317'
+    OPEN_TELEMETRY_SAMPLE_RATE: float = Field(1.0, ge=0, le=1)
+
+    METRICS_ENABLED: bool = True
 
     METADATA_SERVICE: HttpUrl = 'http://metadata.utility'
     AUTH_SERVICE: HttpUrl = 'http://auth.utility'
 
     ICON_SIZE_LIMIT: int = 2**24
 
+    PROJECT_BATCH_MAX_SIZE: int = 500
+    PROJECT_BATCH_PROVISIONING_CONCURRENCY: int = 10
+    PROJECT_RESOLVE_MAX_SIZE: int = 5000
+
+    PAGE_SIZE_MAX: int = 1000
+    PAGE_FETCH_CHUNK_SIZE: int = 250
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    PROJECT_CACHE_SIZE: int = 10000
+    PROJECT_CACHE_TTL: int = 60
+    PROJECT_CACHE_LOCAL_TTL: int = 5
+    PROJECT_CACHE_SHARED_BACKEND_URL: str | None = None
+
     SERVICE_CLIENT_TIMEOUT: int = 5
+    SERVICE_CLIENT_KEEPALIVE_EXPIRY: int = 30
+    SERVICE_CLIENT_HTTP2_ENABLED: bool = True
+    AUTH_SERVICE_MAX_CONNECTIONS: int = 20
+    METADATA_SERVICE_MAX_CONNECTIONS: int = 20
+    S3_ADMIN_MAX_CONNECTIONS: int = 10
 
     class Config:
         env_file = '.env'
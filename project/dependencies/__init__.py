@@ -4,12 +4,18 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from project.dependencies.db import add_after_commit_callback
 from project.dependencies.db import get_db_engine
 from project.dependencies.db import get_db_session
+from project.dependencies.db import run_after_commit_callbacks
+from project.dependencies.http import http_client_registry
 from project.dependencies.s3 import get_s3_client
 
 __all__ = [
+    'add_after_commit_callback',
     'get_db_engine',
     'get_db_session',
     'get_s3_client',
+    'http_client_registry',
+    'run_after_commit_callbacks',
 ]
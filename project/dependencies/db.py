@@ -4,13 +4,46 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from project.config import Settings
 from project.config import get_settings
+from project.metrics import MeteredQueuePool
+from project.metrics import instrument_db_engine
+from project.tracing import trace_db_engine
+
+
+def create_db_engine(settings: Settings) -> AsyncEngine:
+    """Create an instance of AsyncEngine class with connection pool configured from settings."""
+
+    options = {'poolclass': MeteredQueuePool} if settings.METRICS_ENABLED else {}
+    engine = create_async_engine(
+        settings.RDS_DB_URI,
+        echo=settings.RDS_ECHO_SQL_QUERIES,
+        pool_size=settings.RDS_POOL_SIZE,
+        max_overflow=settings.RDS_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.RDS_POOL_TIMEOUT,
+        pool_recycle=settings.RDS_POOL_RECYCLE,
+        pool_pre_ping=settings.RDS_POOL_PRE_PING,
+        connect_args={'prepared_statement_cache_size': settings.RDS_STATEMENT_CACHE_SIZE},
+        **options,
+    )
+
+    if settings.METRICS_ENABLED:
+        instrument_db_engine(engine.sync_engine)
+
+    if settings.OPEN_TELEMETRY_ENABLED:
+        trace_db_engine(engine.sync_engine)
+
+    return engine
 
 
 class GetDBEngine:
@@ -23,20 +56,62 @@ class GetDBEngine:
         """Return an instance of AsyncEngine class."""
 
         if not self.instance:
-            self.instance = create_async_engine(settings.RDS_DB_URI, echo=settings.RDS_ECHO_SQL_QUERIES)
+            self.instance = create_db_engine(settings)
         return self.instance
 
+    async def warm_up(self, size: int) -> None:
+        """Open pool connections in advance, so first requests do not wait for connections to be established."""
+
+        if not self.instance or size < 1:
+            return
+
+        size = min(size, self.instance.pool.size())
+        results = await asyncio.gather(*(self.instance.connect().start() for _ in range(size)), return_exceptions=True)
+
+        connections = [result for result in results if isinstance(result, AsyncConnection)]
+        await asyncio.gather(*(connection.close() for connection in connections))
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    async def dispose(self) -> None:
+        """Close all pool connections and drop the AsyncEngine instance."""
+
+        if not self.instance:
+            return
+
+        await self.instance.dispose()
+        self.instance = None
+
 
 get_db_engine = GetDBEngine()
 
 
+def add_after_commit_callback(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Schedule callback to be awaited once the session transaction is committed."""
+
+    session.info.setdefault('after_commit_callbacks', []).append(callback)
+
+
+async def run_after_commit_callbacks(session: AsyncSession) -> None:
+    """Await callbacks scheduled for the committed session transaction."""
+
+    for callback in session.info.pop('after_commit_callbacks', []):
+        await callback()
+
+
 async def get_db_session(engine: AsyncEngine = Depends(get_db_engine)) -> AsyncSession:
-    """Create a FastAPI callable dependency for SQLAlchemy AsyncSession instance."""
+    """Create a FastAPI callable dependency for SQLAlchemy AsyncSession instance.
+
+    Callbacks scheduled with add_after_commit_callback are awaited right after the transaction is committed.
+    """
 
     session = AsyncSession(bind=engine, expire_on_commit=False)
 
     try:
         yield session
         await session.commit()
+        await run_after_commit_callbacks(session)
     finally:
         await session.close()
@@ -0,0 +1,61 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from importlib.util import find_spec
+
+import httpx
+
+from project.config import Settings
+from project.tracing import inject_trace_context
+
+
+def create_http_client(settings: Settings, max_connections: int) -> httpx.AsyncClient:
+    """Create an instance of httpx.AsyncClient which keeps connections alive between requests.
+
+    HTTP/2 is negotiated only when enabled in settings and the h2 package is installed. When tracing is enabled, the
+    trace context is propagated to upstream services.
+    """
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=settings.SERVICE_CLIENT_KEEPALIVE_EXPIRY,
+    )
+    http2 = settings.SERVICE_CLIENT_HTTP2_ENABLED and find_spec('h2') is not None
+
+    event_hooks = {'request': [inject_trace_context]} if settings.OPEN_TELEMETRY_ENABLED else None
+
+    return httpx.AsyncClient(
+        timeout=settings.SERVICE_CLIENT_TIMEOUT, limits=limits, http2=http2, event_hooks=event_hooks
+    )
+
+
+class HTTPClientRegistry:
+    """Store single httpx.AsyncClient instance per upstream service for the application lifetime."""
+
+    def __init__(self) -> None:
+        self.instances: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, upstream: str, settings: Settings, max_connections: int) -> httpx.AsyncClient:
+        """Return an instance of httpx.AsyncClient for the upstream service."""
+
+        client = self.instances.get(upstream)
+        if client is None or client.is_closed:
+            client = create_http_client(settings, max_connections)
+            self.instances[upstream] = client
+
+        return client
+
+    async def close(self) -> None:
+        """Close all httpx.AsyncClient instances with their connections."""
+
+        for client in self.instances.values():
+            await client.aclose()
+
+        self.instances.clear()
+
+
+http_client_registry = HTTPClientRegistry()
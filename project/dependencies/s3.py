@@ -4,6 +4,8 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import asyncio
+
 from fastapi import Depends
 
 from project.components.object_storage.s3 import S3Client
@@ -11,9 +13,35 @@ from project.config import Settings
 from project.config import get_settings
 
 
-async def get_s3_client(settings: Settings = Depends(get_settings)) -> S3Client:
-    s3_endpoint = f'{settings.S3_HOST}:{settings.S3_PORT}'
-    client = await S3Client.initialize(
-        s3_endpoint, settings.S3_ACCESS_KEY, settings.S3_SECRET_KEY, settings.S3_HTTPS_ENABLED
-    )
-    return client
+class GetS3Client:
+    """Create a FastAPI callable dependency for single S3Client instance with long-lived connection pool."""
+
+    def __init__(self) -> None:
+        self.instance = None
+        self.lock = asyncio.Lock()
+
+    async def __call__(self, settings: Settings = Depends(get_settings)) -> S3Client:
+        """Return an instance of S3Client class."""
+
+        async with self.lock:
+            if not self.instance:
+                s3_endpoint = f'{settings.S3_HOST}:{settings.S3_PORT}'
+                client = await S3Client.initialize(
+                    s3_endpoint, settings.S3_ACCESS_KEY, settings.S3_SECRET_KEY, settings.S3_HTTPS_ENABLED
+                )
+                await client.connect(settings.S3_MAX_POOL_CONNECTIONS)
+                self.instance = client
+
+        return self.instance
+
+    async def close(self) -> None:
+        """Close S3Client connections and drop the instance."""
+
+        if not self.instance:
+            return
+
+        await self.instance.close()
+        self.instance = None
+
+
+get_s3_client = GetS3Client()
@@ -0,0 +1,21 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from project.metrics.db import MeteredQueuePool
+from project.metrics.db import instrument_db_engine
+from project.metrics.metrics import CACHE_REQUESTS
+from project.metrics.middleware import MetricsMiddleware
+from project.metrics.upstream import observe_upstream
+from project.metrics.views import router as metrics_router
+
+__all__ = [
+    'CACHE_REQUESTS',
+    'MeteredQueuePool',
+    'MetricsMiddleware',
+    'instrument_db_engine',
+    'metrics_router',
+    'observe_upstream',
+]
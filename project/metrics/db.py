@@ -0,0 +1,79 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from project.metrics.metrics import DB_POOL_CHECKOUT_DURATION
+from project.metrics.metrics import DB_POOL_CONNECTIONS
+from project.metrics.metrics import DB_STATEMENT_DURATION
+
+STATEMENT_OPERATIONS = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH', 'BEGIN', 'COMMIT', 'ROLLBACK'})
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool that records checkout wait time and the number of connections by state."""
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_DURATION.observe(time.perf_counter() - start)
+            self.update_connections()
+
+    def _do_return_conn(self, conn: Any) -> None:
+        super()._do_return_conn(conn)
+        self.update_connections()
+
+    def dispose(self) -> None:
+        super().dispose()
+        self.update_connections()
+
+    def update_connections(self) -> None:
+        """Record the current number of pool connections by state."""
+
+        DB_POOL_CONNECTIONS.labels('size').set(self.size())
+        DB_POOL_CONNECTIONS.labels('checked_out').set(self.checkedout())
+        DB_POOL_CONNECTIONS.labels('idle').set(self.checkedin())
+        DB_POOL_CONNECTIONS.labels('overflow').set(max(self.overflow(), 0))
+
+
+def get_statement_operation(statement: str) -> str:
+    """Return the leading SQL keyword of the statement limited to a known set to keep label cardinality low."""
+
+    words = statement.lstrip()[:16].split(maxsplit=1)
+    operation = words[0].upper() if words else ''
+    return operation if operation in STATEMENT_OPERATIONS else 'OTHER'
+
+
+def before_cursor_execute(connection: Connection, cursor: Any, statement: str, *args: Any) -> None:
+    connection.info.setdefault('statement_start_time', []).append(time.perf_counter())
+
+
+def after_cursor_execute(connection: Connection, cursor: Any, statement: str, *args: Any) -> None:
+    start = connection.info['statement_start_time'].pop()
+    DB_STATEMENT_DURATION.labels(get_statement_operation(statement)).observe(time.perf_counter() - start)
+
+
+def handle_error(context: ExceptionContext) -> None:
+    start_times = context.connection.info.get('statement_start_time') if context.connection else None
+    if start_times:
+        start_times.pop()
+
+
+def instrument_db_engine(engine: Engine) -> None:
+    """Record durations of statements executed by the engine."""
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(engine, 'handle_error', handle_error)
@@ -0,0 +1,67 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import os
+
+from prometheus_client import REGISTRY
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+from prometheus_client.multiprocess import MultiProcessCollector
+
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds', 'Duration of HTTP requests.', ['method', 'route', 'status']
+)
+HTTP_REQUEST_SIZE = Histogram(
+    'http_request_size_bytes', 'Size of HTTP request bodies.', ['method', 'route'], buckets=SIZE_BUCKETS
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes', 'Size of HTTP response bodies.', ['method', 'route'], buckets=SIZE_BUCKETS
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress',
+    'Number of HTTP requests in progress.',
+    ['method', 'route'],
+    multiprocess_mode='livesum',
+)
+
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    'db_pool_checkout_duration_seconds', 'Time spent waiting for a database pool connection.', buckets=DB_BUCKETS
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'db_pool_connections', 'Number of database pool connections by state.', ['state'], multiprocess_mode='livesum'
+)
+DB_STATEMENT_DURATION = Histogram(
+    'db_statement_duration_seconds', 'Duration of database statements.', ['operation'], buckets=DB_BUCKETS
+)
+
+UPSTREAM_REQUEST_DURATION = Histogram(
+    'upstream_request_duration_seconds', 'Duration of calls to upstream services.', ['service', 'operation']
+)
+UPSTREAM_REQUEST_ERRORS = Counter(
+    'upstream_request_errors_total', 'Number of failed calls to upstream services.', ['service', 'operation']
+)
+
+CACHE_REQUESTS = Counter('cache_requests_total', 'Number of cache lookups by result.', ['cache', 'result'])
+
+
+def get_metrics_registry() -> CollectorRegistry:
+    """Return registry with metrics of the current process or metrics aggregated across all worker processes.
+
+    Aggregation is used when PROMETHEUS_MULTIPROC_DIR environment variable is set, which is required for more than one
+    worker.
+    """
+
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return registry
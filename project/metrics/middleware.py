@@ -0,0 +1,76 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from project.metrics.metrics import HTTP_REQUEST_DURATION
+from project.metrics.metrics import HTTP_REQUEST_SIZE
+from project.metrics.metrics import HTTP_REQUESTS_IN_PROGRESS
+from project.metrics.metrics import HTTP_RESPONSE_SIZE
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+def get_route_template(scope: Scope) -> str:
+    """Return path template of the route matching the request, so label values do not grow with path parameters."""
+
+    for route in scope['app'].routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Record latency, body sizes and the number of in-progress HTTP requests by route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        route = get_route_template(scope)
+        request_size = 0
+        response_size = 0
+        status = 500
+
+        async def receive_wrapper() -> Message:
+            nonlocal request_size
+            message = await receive()
+            if message['type'] == 'http.request':
+                request_size += len(message.get('body', b''))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_size, status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            elif message['type'] == 'http.response.body':
+                response_size += len(message.get('body', b''))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route, status).observe(time.perf_counter() - start)
+            HTTP_REQUEST_SIZE.labels(method, route).observe(request_size)
+            HTTP_RESPONSE_SIZE.labels(method, route).observe(response_size)
+            in_progress.dec()
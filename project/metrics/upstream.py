@@ -0,0 +1,52 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+from typing import TypeVar
+
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+
+from project.metrics.metrics import UPSTREAM_REQUEST_DURATION
+from project.metrics.metrics import UPSTREAM_REQUEST_ERRORS
+
+T = TypeVar('T')
+
+tracer = trace.get_tracer(__name__)
+
+
+def observe_upstream(
+    service: str,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Record duration and errors of the decorated upstream call using the function name as operation.
+
+    The call is also traced as a client span, which is a child of the current request span.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        span_name = f'{service} {func.__name__}'
+        duration = UPSTREAM_REQUEST_DURATION.labels(service, func.__name__)
+        errors = UPSTREAM_REQUEST_ERRORS.labels(service, func.__name__)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwds: Any) -> T:
+            start = time.perf_counter()
+            with tracer.start_as_current_span(span_name, kind=SpanKind.CLIENT, attributes={'peer.service': service}):
+                try:
+                    return await func(*args, **kwds)
+                except Exception:
+                    errors.inc()
+                    raise
+                finally:
+                    duration.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,21 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from prometheus_client import generate_latest
+
+from project.metrics.metrics import get_metrics_registry
+
+router = APIRouter(prefix='/metrics', tags=['Metrics'])
+
+
+@router.get('', summary='Metrics in Prometheus text format.', include_in_schema=False)
+async def get_metrics() -> Response:
+    """Return metrics collected by the application."""
+
+    return Response(generate_latest(get_metrics_registry()), media_type=CONTENT_TYPE_LATEST)
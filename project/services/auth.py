@@ -13,23 +13,26 @@ from project.components.exceptions import ServiceNotAvailable
 from project.components.exceptions import UnhandledException
 from project.config import Settings
 from project.config import get_settings
+from project.dependencies import http_client_registry
 from project.logger import logger
+from project.metrics import observe_upstream
 
 
 class AuthClient:
     """Client to connect with auth service."""
 
-    def __init__(self, auth_service_url: str, timeout: int) -> None:
+    def __init__(self, auth_service_url: str, timeout: int, client: httpx.AsyncClient) -> None:
         self.service_url = auth_service_url + '/v1/'
         self.timeout = timeout
+        self.client = client
 
+    @observe_upstream('auth')
     async def create_user_groups(self, project_code: str, description: str | None = None) -> None:
         """Creating user groups with auth service."""
         try:
             payload = {'group_name': project_code, 'description': description}
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.service_url + 'user/group', json=payload)
-                response.raise_for_status()
+            response = await self.client.post(self.service_url + 'user/group', json=payload)
+            response.raise_for_status()
 
         except httpx.HTTPStatusError:
             logger.error(
@@ -47,14 +50,14 @@ class AuthClient:
             logger.exception(f'Unable to to create user groups for project "{project_code}"')
             raise UnhandledException()
 
+    @observe_upstream('auth')
     async def create_user_roles(self, project_code: str) -> None:
         """Creating user roles with auth service."""
         try:
             payload = {'project_roles': ['admin', 'collaborator', 'contributor'], 'project_code': project_code}
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.service_url + 'admin/users/realm-roles', json=payload)
-                response.raise_for_status()
+            response = await self.client.post(self.service_url + 'admin/users/realm-roles', json=payload)
+            response.raise_for_status()
 
         except httpx.HTTPStatusError:
             logger.error(
@@ -70,15 +73,15 @@ class AuthClient:
             logger.exception(f'Unable to create user roles for project "{project_code}"')
             raise UnhandledException()
 
+    @observe_upstream('auth')
     async def create_default_permissions(self, project_code: str) -> None:
         """Create default RBAC roles for a project."""
 
         try:
             payload = {'project_code': project_code}
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.service_url + 'defaultroles', json=payload)
-                response.raise_for_status()
+            response = await self.client.post(self.service_url + 'defaultroles', json=payload)
+            response.raise_for_status()
         except httpx.HTTPStatusError:
             logger.error(
                 f'Auth service could not create default permissions for project "{project_code}", error {response.text}'
@@ -91,6 +94,7 @@ class AuthClient:
             logger.exception(f'Unable to create default permissions for project "{project_code}"')
             raise UnhandledException()
 
+    @observe_upstream('auth')
     async def get_platform_admins(self) -> list[dict[str, Any]]:
         """Getting a list of platform admins from auth service."""
         try:
@@ -99,9 +103,8 @@ class AuthClient:
                 'status': 'active',
                 'page_size': 1000,
             }
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.service_url + 'admin/roles/users', json=payload)
-                response.raise_for_status()
+            response = await self.client.post(self.service_url + 'admin/roles/users', json=payload)
+            response.raise_for_status()
 
             origin_users = response.json().get('result', [])
             return origin_users
@@ -121,4 +124,5 @@ class AuthClient:
 
 def get_auth_client(settings: Settings = Depends(get_settings)) -> AuthClient:
     """Create a callable dependency for AuthClient."""
-    return AuthClient(settings.AUTH_SERVICE, settings.SERVICE_CLIENT_TIMEOUT)
+    client = http_client_registry.get('auth', settings, settings.AUTH_SERVICE_MAX_CONNECTIONS)
+    return AuthClient(settings.AUTH_SERVICE, settings.SERVICE_CLIENT_TIMEOUT, client)
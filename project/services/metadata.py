@@ -15,7 +15,9 @@ from project.components.exceptions import UnhandledException
 from project.components.types import StrEnum
 from project.config import Settings
 from project.config import get_settings
+from project.dependencies import http_client_registry
 from project.logger import logger
+from project.metrics import observe_upstream
 
 
 class Zones(IntEnum):
@@ -37,9 +39,10 @@ class ItemStatus(StrEnum):
 class MetadataClient:
     """Client to connect with metadata service."""
 
-    def __init__(self, metadata_service_url: str, timeout: int) -> None:
+    def __init__(self, metadata_service_url: str, timeout: int, client: httpx.AsyncClient) -> None:
         self.service_url = metadata_service_url + '/v1/'
         self.timeout = timeout
+        self.client = client
         self.zones = Zones
 
     def generate_user_folder_payload(self, users: list[dict[str, Any]], project_code: str):
@@ -62,13 +65,13 @@ class MetadataClient:
                 )
         return folders
 
+    @observe_upstream('metadata')
     async def create_users_name_folders(self, users: list[dict[str, Any]], project_code: str) -> None:
         """Bulk create folders for project through metadata service."""
         try:
             folders = self.generate_user_folder_payload(users, project_code)
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.service_url + 'items/batch/', json={'items': folders})
-                response.raise_for_status()
+            response = await self.client.post(self.service_url + 'items/batch/', json={'items': folders})
+            response.raise_for_status()
 
         except httpx.HTTPStatusError:
             logger.error(
@@ -87,4 +90,5 @@ class MetadataClient:
 
 def get_metadata_client(settings: Settings = Depends(get_settings)) -> MetadataClient:
     """Create a callable dependency for MetadataClient."""
-    return MetadataClient(settings.METADATA_SERVICE, settings.SERVICE_CLIENT_TIMEOUT)
+    client = http_client_registry.get('metadata', settings, settings.METADATA_SERVICE_MAX_CONNECTIONS)
+    return MetadataClient(settings.METADATA_SERVICE, settings.SERVICE_CLIENT_TIMEOUT, client)
@@ -0,0 +1,64 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from typing import Any
+
+import httpx
+from opentelemetry import trace
+from opentelemetry.propagate import inject
+from opentelemetry.trace import SpanKind
+from opentelemetry.trace import Status
+from opentelemetry.trace import StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine import ExceptionContext
+
+from project.metrics.db import get_statement_operation
+
+tracer = trace.get_tracer('project')
+
+
+async def inject_trace_context(request: httpx.Request) -> None:
+    """Propagate the current trace context to upstream services through request headers."""
+
+    inject(request.headers)
+
+
+def start_statement_span(connection: Connection, cursor: Any, statement: str, *args: Any) -> None:
+    span = tracer.start_span(
+        get_statement_operation(statement),
+        kind=SpanKind.CLIENT,
+        attributes={
+            'db.system': 'postgresql',
+            'db.name': connection.engine.url.database,
+            'db.statement': statement,
+        },
+    )
+    connection.info.setdefault('statement_spans', []).append(span)
+
+
+def end_statement_span(connection: Connection, cursor: Any, statement: str, *args: Any) -> None:
+    connection.info['statement_spans'].pop().end()
+
+
+def fail_statement_span(context: ExceptionContext) -> None:
+    spans = context.connection.info.get('statement_spans') if context.connection else None
+    if not spans:
+        return
+
+    span = spans.pop()
+    span.record_exception(context.original_exception)
+    span.set_status(Status(StatusCode.ERROR))
+    span.end()
+
+
+def trace_db_engine(engine: Engine) -> None:
+    """Trace every statement executed by the engine as a child span of the current request span."""
+
+    event.listen(engine, 'before_cursor_execute', start_statement_span)
+    event.listen(engine, 'after_cursor_execute', end_statement_span)
+    event.listen(engine, 'handle_error', fail_statement_span)
@@ -4,12 +4,35 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from datetime import datetime
+from datetime import timezone
+
+import httpx
 import pytest
 from common import NotFoundError
 
+from project.components.object_storage.policy import PolicyManager
+from project.components.object_storage.policy import PolicyOperationError
+from project.components.object_storage.policy import Roles
 from project.components.object_storage.policy import get_policy_manager
 from project.dependencies import get_s3_client
 
+SIGNED_HEADERS = ['Host', 'User-Agent', 'Content-Length', 'x-amz-content-sha256', 'x-amz-date', 'Authorization']
+
+
+@pytest.fixture
+def frozen_signing_time(mocker) -> None:
+    mocker.patch('minio.time.utcnow', return_value=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+def assert_requests_are_equal(request: httpx.Request, expected_request: httpx.Request) -> None:
+    assert expected_request.headers['Authorization'].startswith('AWS4-HMAC-SHA256 ')
+    assert request.method == expected_request.method
+    assert request.url == expected_request.url
+    assert request.content == expected_request.content
+    for header in SIGNED_HEADERS:
+        assert request.headers.get(header) == expected_request.headers.get(header)
+
 
 class TestPolicyManager:
     async def test_policy_manager_creates_policies(self, minio_container, minio_client, settings):
@@ -32,3 +55,62 @@ class TestPolicyManager:
         for role in policy_manager.roles:
             with pytest.raises(NotFoundError):
                 await minio_client.get_IAM_policy(project_code + '-' + role.value)
+
+    async def test_policy_manager_rolls_back_remaining_policies_when_some_do_not_exist(
+        self, minio_container, minio_client, settings
+    ):
+        project_code = 'partial-test-code'
+        policy_manager = await get_policy_manager(settings)
+        policy_name = policy_manager.get_policy_name(project_code, Roles.ADMIN)
+        await policy_manager.create_IAM_policy(policy_name, policy_manager.templates[Roles.ADMIN.value](project_code))
+
+        await policy_manager.rollback_policies_for_project(project_code)
+
+        with pytest.raises(NotFoundError):
+            await minio_client.get_IAM_policy(policy_name)
+
+    async def test_policy_manager_raises_aggregated_error_when_policies_creation_fails(self, settings):
+        minio_policy_client = (await get_policy_manager(settings)).minio_policy_client
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(500, text='error')))
+        policy_manager = PolicyManager(minio_policy_client, settings.SERVICE_CLIENT_TIMEOUT, client)
+
+        with pytest.raises(PolicyOperationError) as exc_info:
+            await policy_manager.create_policies_for_project('failed-code')
+
+        assert set(exc_info.value.errors) == {
+            policy_manager.get_policy_name('failed-code', role) for role in policy_manager.roles
+        }
+
+
+class TestPolicyManagerSignedRequests:
+    @pytest.fixture
+    def non_mocked_hosts(self) -> list:
+        return []
+
+    async def test_create_IAM_policy_sends_the_same_signed_request_as_common_package(
+        self, settings, httpx_mock, frozen_signing_time
+    ):
+        httpx_mock.add_response(method='PUT', status_code=200)
+        minio_policy_client = (await get_policy_manager(settings)).minio_policy_client
+
+        await minio_policy_client.create_IAM_policy('test-policy', '{"Version": "2012-10-17"}')
+        async with httpx.AsyncClient() as client:
+            policy_manager = PolicyManager(minio_policy_client, settings.SERVICE_CLIENT_TIMEOUT, client)
+            await policy_manager.create_IAM_policy('test-policy', '{"Version": "2012-10-17"}')
+
+        expected_request, request = httpx_mock.get_requests()
+        assert_requests_are_equal(request, expected_request)
+
+    async def test_remove_IAM_policy_sends_the_same_signed_request_as_common_package(
+        self, settings, httpx_mock, frozen_signing_time
+    ):
+        httpx_mock.add_response(method='DELETE', status_code=200)
+        minio_policy_client = (await get_policy_manager(settings)).minio_policy_client
+
+        await minio_policy_client.delete_IAM_policy('test-policy')
+        async with httpx.AsyncClient() as client:
+            policy_manager = PolicyManager(minio_policy_client, settings.SERVICE_CLIENT_TIMEOUT, client)
+            await policy_manager.remove_IAM_policy('test-policy')
+
+        expected_request, request = httpx_mock.get_requests()
+        assert_requests_are_equal(request, expected_request)
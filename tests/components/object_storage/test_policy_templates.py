@@ -0,0 +1,44 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import json
+
+from project.components.object_storage.policy_templates import get_templates_library
+
+
+class TestPolicyTemplates:
+    def test_templates_use_resources_for_all_zone_prefixes(self):
+        templates = get_templates_library(('gr', 'core', 'extra'))
+
+        document = json.loads(templates['collaborator']('code'))
+
+        assert document['Statement'][0]['Resource'] == [
+            'arn:aws:s3:::gr-code',
+            'arn:aws:s3:::core-code',
+            'arn:aws:s3:::extra-code',
+        ]
+        assert document['Statement'][1]['Resource'] == [
+            'arn:aws:s3:::gr-code/${jwt:preferred_username}/*',
+            'arn:aws:s3:::core-code/*',
+            'arn:aws:s3:::extra-code/*',
+        ]
+
+    def test_templates_render_minified_json(self):
+        templates = get_templates_library(('gr', 'core'))
+
+        policy = templates['admin']('code')
+
+        assert ' ' not in policy
+        assert '\n' not in policy
+
+    def test_templates_cache_rendered_documents(self):
+        templates = get_templates_library(('gr', 'core'))
+
+        assert templates['contributor']('cached') is templates['contributor']('cached')
+        assert templates['contributor'].render.cache_info().hits >= 1
+
+    def test_get_templates_library_compiles_templates_once_for_zone_prefixes(self):
+        assert get_templates_library(('gr', 'core')) is get_templates_library(('gr', 'core'))
@@ -0,0 +1,147 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from prometheus_client import REGISTRY
+
+from project.components.cache import InMemoryCacheBackend
+from project.components.cache import RedisCacheBackend
+from project.components.project.cache import ProjectCache
+from project.components.project.dependencies import GetProjectCache
+
+
+def get_cache_requests(result: str) -> float:
+    return REGISTRY.get_sample_value('cache_requests_total', {'cache': 'project', 'result': result}) or 0
+
+
+class TestProjectCache:
+    async def test_get_returns_project_by_id_and_code_after_set(self, project_cache, project_factory):
+        project = await project_factory.create()
+
+        await project_cache.set(project)
+
+        assert (await project_cache.get(project.id)).id == project.id
+        assert (await project_cache.get(project.code)).id == project.id
+        assert project_cache.hits == 2
+        assert project_cache.misses == 0
+
+    async def test_get_returns_none_after_invalidation(self, project_cache, project_factory):
+        project = await project_factory.create()
+        await project_cache.set(project)
+
+        await project_cache.invalidate(project.id)
+
+        assert await project_cache.get(project.id) is None
+        assert await project_cache.get(project.code) is None
+        assert project_cache.misses == 2
+
+    async def test_get_populates_local_backend_from_shared_backend(self, settings, project_factory):
+        shared = InMemoryCacheBackend(settings.PROJECT_CACHE_SIZE, settings.PROJECT_CACHE_TTL)
+        project = await project_factory.create()
+        await ProjectCache(InMemoryCacheBackend(10, 60), shared).set(project)
+        project_cache = ProjectCache(InMemoryCacheBackend(10, 60), shared)
+
+        received_project = await project_cache.get(project.code)
+
+        assert received_project.id == project.id
+        assert await project_cache.local.get(project_cache.get_id_key(project.id)) == received_project
+
+    async def test_get_many_returns_projects_using_batch_lookups(self, settings, project_factory, mocker):
+        shared = InMemoryCacheBackend(settings.PROJECT_CACHE_SIZE, settings.PROJECT_CACHE_TTL)
+        first_project = await project_factory.create()
+        second_project = await project_factory.create()
+        await ProjectCache(InMemoryCacheBackend(10, 60), shared).set_many([first_project, second_project])
+        project_cache = ProjectCache(InMemoryCacheBackend(10, 60), shared)
+        shared_get_many = mocker.spy(shared, 'get_many')
+
+        projects = await project_cache.get_many([first_project.id, second_project.code, 'unknown'])
+
+        assert projects.keys() == {first_project.id, second_project.code}
+        assert projects[first_project.id].id == first_project.id
+        assert projects[second_project.code].id == second_project.id
+        assert shared_get_many.call_count == 2
+        assert project_cache.hits == 2
+        assert project_cache.misses == 1
+
+    async def test_get_exports_hits_and_misses_as_prometheus_counters(self, project_cache, project_factory):
+        project = await project_factory.create()
+        await project_cache.set(project)
+        hits = get_cache_requests('hit')
+        misses = get_cache_requests('miss')
+
+        await project_cache.get(project.id)
+        await project_cache.get('unknown')
+
+        assert get_cache_requests('hit') == hits + 1
+        assert get_cache_requests('miss') == misses + 1
+
+
+class TestGetProjectCache:
+    def test_local_backend_uses_short_time_to_live_when_shared_backend_is_configured(self, settings, mocker):
+        mocker.patch('project.components.project.dependencies.RedisCacheBackend')
+        settings = settings.copy(
+            update={
+                'PROJECT_CACHE_SHARED_BACKEND_URL': 'redis://127.0.0.1:6379/0',
+                'PROJECT_CACHE_TTL': 60,
+                'PROJECT_CACHE_LOCAL_TTL': 5,
+            }
+        )
+
+        project_cache = GetProjectCache()(settings)
+
+        assert project_cache.local.ttl == 5
+        assert project_cache.shared is not None
+
+    def test_local_backend_uses_cache_time_to_live_without_shared_backend(self, settings):
+        settings = settings.copy(update={'PROJECT_CACHE_SHARED_BACKEND_URL': None, 'PROJECT_CACHE_TTL': 60})
+
+        project_cache = GetProjectCache()(settings)
+
+        assert project_cache.local.ttl == 60
+        assert project_cache.shared is None
+
+
+class TestInMemoryCacheBackend:
+    async def test_get_many_returns_values_in_order_of_keys(self):
+        backend = InMemoryCacheBackend(max_size=3, ttl=60)
+        await backend.set_many({'first': 1, 'second': 2})
+
+        assert await backend.get_many(['second', 'missing', 'first']) == [2, None, 1]
+
+    async def test_set_evicts_least_recently_used_entries(self):
+        backend = InMemoryCacheBackend(max_size=2, ttl=60)
+        await backend.set('first', 1)
+        await backend.set('second', 2)
+        await backend.get('first')
+
+        await backend.set('third', 3)
+
+        assert await backend.get('second') is None
+        assert await backend.get('first') == 1
+        assert await backend.get('third') == 3
+
+    async def test_get_returns_none_when_entry_is_expired(self):
+        backend = InMemoryCacheBackend(max_size=2, ttl=0)
+        await backend.set('key', 'value')
+
+        assert await backend.get('key') is None
+
+
+class TestRedisCacheBackend:
+    async def test_get_many_fetches_all_keys_with_single_command(self, mocker):
+        backend = RedisCacheBackend('redis://127.0.0.1:6379/0', ttl=60)
+        mget = mocker.patch.object(backend.client, 'mget', new=mocker.AsyncMock(return_value=['1', None]))
+
+        values = await backend.get_many(['first', 'second'])
+
+        assert values == ['1', None]
+        mget.assert_awaited_once_with(['first', 'second'])
+
+    async def test_get_many_does_not_send_command_for_empty_keys(self, mocker):
+        backend = RedisCacheBackend('redis://127.0.0.1:6379/0', ttl=60)
+        mget = mocker.patch.object(backend.client, 'mget', new=mocker.AsyncMock())
+
+        assert await backend.get_many([]) == []
+        mget.assert_not_called()
@@ -9,6 +9,7 @@ import pytest
 
 from project.components.project.logo_uploader import LogoUploader
 from project.dependencies import get_s3_client
+from project.tracing import tracer
 
 
 @pytest.fixture(scope='session')
@@ -34,6 +35,14 @@ class TestLogoUploader:
 
         assert received_mime_type == 'image/png'
 
+    async def test_convert_traces_conversion_as_child_span_of_current_span(self, logo_uploader, fake, span_exporter):
+        with tracer.start_as_current_span('parent') as parent:
+            await logo_uploader.convert(fake.image())
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+
+        assert spans['logo convert'].parent.span_id == parent.get_span_context().span_id
+
     async def test_convert_and_upload_uploads_image_after_bucket_creation(
         self, logo_uploader, fake, s3_test_client, minio_container
     ):
@@ -0,0 +1,67 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import asyncio
+
+import pytest
+
+from project.components.project.object_storage_manager import ObjectStorageManager
+from project.dependencies import get_s3_client
+
+
+class CountingS3Client:
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+
+    async def operation(self, bucket_name: str) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+
+    create_bucket = set_bucket_versioning = create_bucket_encryption = remove_bucket = operation
+
+
+class TestObjectStorageManager:
+    @pytest.fixture
+    def zone_settings(self, settings, monkeypatch):
+        monkeypatch.setattr(settings, 'S3_BUCKET_ZONE_PREFIXES', ['gr', 'core', 'extra'])
+        yield settings
+
+    async def test_create_buckets_for_project_creates_bucket_for_each_zone(
+        self, zone_settings, minio_container, s3_test_client, fake
+    ):
+        project_code = fake.pystr(min_chars=10, max_chars=10).lower()
+        manager = ObjectStorageManager(await get_s3_client(zone_settings), zone_settings)
+
+        await manager.create_buckets_for_project(project_code)
+
+        for bucket_name in manager.get_bucket_names(project_code):
+            assert s3_test_client.check_if_bucket_exists(bucket_name)
+
+    async def test_remove_buckets_for_project_removes_remaining_buckets_when_some_do_not_exist(
+        self, zone_settings, minio_container, s3_test_client, fake
+    ):
+        project_code = fake.pystr(min_chars=10, max_chars=10).lower()
+        s3_client = await get_s3_client(zone_settings)
+        manager = ObjectStorageManager(s3_client, zone_settings)
+        bucket_names = manager.get_bucket_names(project_code)
+        await s3_client.create_bucket(bucket_names[-1])
+
+        await manager.remove_buckets_for_project(project_code)
+
+        assert not s3_test_client.check_if_bucket_exists(bucket_names[-1])
+
+    async def test_bucket_operations_do_not_exceed_concurrency_limit(self, zone_settings, monkeypatch):
+        monkeypatch.setattr(zone_settings, 'S3_BUCKET_ENCRYPTION_ENABLED', True)
+        monkeypatch.setattr(zone_settings, 'S3_BUCKET_OPERATIONS_CONCURRENCY', 2)
+        s3_client = CountingS3Client()
+        manager = ObjectStorageManager(s3_client, zone_settings)
+
+        await manager.create_buckets_for_project('code')
+
+        assert s3_client.max_running == 2
@@ -8,8 +8,10 @@ from os.path import join as urljoin
 
 import pytest
 
+from project.components.project.schemas import ProjectCreateSchema
 from project.components.project.schemas import ProjectResponseSchema
 from project.components.project.schemas import ProjectSchema
+from project.components.project.schemas import ProjectUpdateSchema
 
 
 class TestProjectSchema:
@@ -29,11 +31,34 @@ class TestProjectSchema:
         assert project.name == 'name'
 
 
+class TestProjectCreateSchema:
+    @pytest.mark.parametrize('code', ['export', 'tags'])
+    def test_code_field_raises_value_error_for_reserved_values(self, code):
+        with pytest.raises(ValueError):
+            ProjectCreateSchema(code=code, name='name')
+
+
+class TestProjectUpdateSchema:
+    @pytest.mark.parametrize('code', ['export', 'tags'])
+    def test_code_field_raises_value_error_for_reserved_values(self, code):
+        with pytest.raises(ValueError):
+            ProjectUpdateSchema(code=code)
+
+    def test_code_field_is_optional(self):
+        project = ProjectUpdateSchema(name='name')
+
+        assert project.code is None
+
+
 class TestProjectResponseSchema:
     def test_image_url_returns_none_when_logo_name_is_not_set(self, project_factory, fake):
         generated_project = project_factory.generate()
         project = ProjectResponseSchema(
-            id=fake.uuid4(), code=generated_project.code, name=generated_project.name, created_at=fake.past_datetime()
+            id=fake.uuid4(),
+            code=generated_project.code,
+            name=generated_project.name,
+            created_at=fake.past_datetime(),
+            updated_at=fake.past_datetime(),
         )
 
         assert project.image_url is None
@@ -50,6 +75,24 @@ class TestProjectResponseSchema:
             name=generated_project.name,
             logo_name=generated_project.logo_name,
             created_at=fake.past_datetime(),
+            updated_at=fake.past_datetime(),
         )
 
         assert project.image_url == expected_image_url
+
+    async def test_dump_returns_the_same_values_as_validated_schema(self, project_factory):
+        created_project = await project_factory.create()
+
+        values = ProjectResponseSchema.dump(created_project)
+
+        assert values == ProjectResponseSchema.from_orm(created_project).dict()
+
+    async def test_dump_returns_only_specified_fields(self, project_factory):
+        created_project = await project_factory.create()
+
+        values = ProjectResponseSchema.dump(created_project, ['code', 'image_url'])
+
+        assert values == {
+            'code': created_project.code,
+            'image_url': ProjectResponseSchema.from_orm(created_project).image_url,
+        }
@@ -4,6 +4,9 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import csv
+import io
+import json
 from datetime import datetime
 from datetime import timedelta
 from itertools import islice
@@ -14,6 +17,7 @@ from project.components.exceptions import NotFound
 from project.components.object_storage.policy import Roles
 from project.components.project.parameters import ProjectSortByFields
 from project.components.sorting import SortingOrder
+from project.config import get_settings
 
 
 class TestProjectViews:
@@ -51,6 +55,119 @@ class TestProjectViews:
         assert received_values == expected_values
         assert received_total == 3
 
+    @pytest.mark.parametrize('sort_by', [None, *ProjectSortByFields.values()])
+    @pytest.mark.parametrize('sort_order', SortingOrder.values())
+    async def test_list_projects_returns_next_cursor_that_continues_listing_after_last_entry(
+        self, sort_by, sort_order, client, jq, project_factory
+    ):
+        created_projects = await project_factory.bulk_create(5)
+        expected_ids = set(created_projects.map_by_field('id', str).keys())
+        params = {'page_size': 2, 'sort_order': sort_order}
+        if sort_by:
+            params['sort_by'] = sort_by
+
+        response = await client.get('/v1/projects/', params=params)
+        body = jq(response)
+        received_ids = body('.result[].id').all()
+        next_cursor = body('.next_cursor').first()
+
+        while next_cursor:
+            response = await client.get('/v1/projects/', params=params | {'cursor': next_cursor})
+
+            assert response.status_code == 200
+
+            body = jq(response)
+            received_ids += body('.result[].id').all()
+            next_cursor = body('.next_cursor').first()
+
+        assert len(received_ids) == len(expected_ids)
+        assert set(received_ids) == expected_ids
+
+    async def test_list_projects_returns_same_entries_for_cursor_and_page_offset(self, client, jq, project_factory):
+        await project_factory.bulk_create(4)
+        params = {'page_size': 2, 'sort_by': 'code'}
+
+        first_page = jq(await client.get('/v1/projects/', params=params))
+        next_cursor = first_page('.next_cursor').first()
+
+        response_by_cursor = await client.get('/v1/projects/', params=params | {'cursor': next_cursor})
+        response_by_offset = await client.get('/v1/projects/', params=params | {'page': 1})
+
+        assert jq(response_by_cursor)('.result[].id').all() == jq(response_by_offset)('.result[].id').all()
+
+    async def test_list_projects_returns_empty_next_cursor_on_last_page(self, client, jq, project_factory):
+        await project_factory.bulk_create(2)
+
+        response = await client.get('/v1/projects/', params={'page_size': 3})
+
+        assert jq(response)('.next_cursor').first() is None
+
+    async def test_list_projects_returns_422_when_cursor_is_invalid(self, client):
+        response = await client.get('/v1/projects/', params={'cursor': 'invalid'})
+
+        assert response.status_code == 422
+        assert response.json()['error'][0]['source'] == ['cursor']
+
+    async def test_list_projects_returns_422_when_cursor_does_not_match_sorting(self, client, jq, project_factory):
+        await project_factory.bulk_create(2)
+
+        response = await client.get('/v1/projects/', params={'page_size': 1, 'sort_by': 'code'})
+        next_cursor = jq(response)('.next_cursor').first()
+
+        response = await client.get('/v1/projects/', params={'page_size': 1, 'sort_by': 'name', 'cursor': next_cursor})
+
+        assert response.status_code == 422
+        assert response.json()['error'][0]['source'] == ['cursor']
+
+    async def test_list_projects_returns_exact_total_for_page_beyond_last_one(self, client, jq, project_factory):
+        await project_factory.bulk_create(3)
+
+        response = await client.get('/v1/projects/', params={'page': 5, 'page_size': 2})
+
+        body = jq(response)
+
+        assert body('.result').first() == []
+        assert body('.total').first() == 3
+        assert body('.num_of_pages').first() == 2
+
+    async def test_list_projects_returns_exact_total_when_cursor_is_used(self, client, jq, project_factory):
+        await project_factory.bulk_create(3)
+
+        response = await client.get('/v1/projects/', params={'page_size': 2})
+        next_cursor = jq(response)('.next_cursor').first()
+
+        response = await client.get('/v1/projects/', params={'page_size': 2, 'cursor': next_cursor})
+
+        body = jq(response)
+
+        assert len(body('.result').first()) == 1
+        assert body('.total').first() == 3
+
+    async def test_list_projects_returns_estimated_total_when_total_parameter_is_estimate(
+        self, client, jq, project_factory
+    ):
+        await project_factory.bulk_create(2)
+
+        response = await client.get('/v1/projects/', params={'total': 'estimate'})
+
+        body = jq(response)
+
+        assert response.status_code == 200
+        assert len(body('.result').first()) == 2
+        assert isinstance(body('.total').first(), int)
+
+    async def test_list_projects_does_not_return_total_when_total_parameter_is_none(self, client, jq, project_factory):
+        await project_factory.bulk_create(2)
+
+        response = await client.get('/v1/projects/', params={'total': 'none'})
+
+        body = jq(response)
+
+        assert response.status_code == 200
+        assert len(body('.result').first()) == 2
+        assert body('.total').first() is None
+        assert body('.num_of_pages').first() is None
+
     @pytest.mark.parametrize('parameter', ['name', 'code', 'description'])
     async def test_list_projects_returns_project_filtered_by_parameter_full_match(
         self, parameter, client, jq, project_factory
@@ -261,10 +378,36 @@ class TestProjectViews:
         with pytest.raises(NotFound):
             await project_crud.retrieve_by_id_or_code(project.code)
 
+    async def test_create_project_does_not_create_auth_entities_and_folders_if_buckets_creation_fails(
+        self, client, project_factory, settings, minio_container, monkeypatch, httpx_mock
+    ):
+        project = project_factory.generate()
+        monkeypatch.setattr(settings, 'S3_BUCKET_ZONE_PREFIXES', ['_test'])
+
+        response = await client.post('/v1/projects/', json=project.to_payload())
+
+        assert response.status_code == 500
+
+        requested_urls = {str(request.url) for request in httpx_mock.get_requests()}
+        assert requested_urls.isdisjoint(
+            {
+                settings.AUTH_SERVICE + '/v1/user/group',
+                settings.AUTH_SERVICE + '/v1/admin/users/realm-roles',
+                settings.AUTH_SERVICE + '/v1/defaultroles',
+                settings.METADATA_SERVICE + '/v1/items/batch/',
+            }
+        )
+
     async def test_create_project_does_not_create_new_project_if_user_groups_creation_fails(
         self, client, jq, project_factory, s3_test_client, project_crud, settings, minio_container, httpx_mock
     ):
         httpx_mock.add_response(method='POST', url=settings.AUTH_SERVICE + '/v1/user/group', status_code=500)
+        httpx_mock.add_response(
+            method='POST',
+            url=settings.AUTH_SERVICE + '/v1/admin/roles/users',
+            status_code=200,
+            json={'result': [{'name': 'test'}]},
+        )
 
         project = project_factory.generate()
 
@@ -323,6 +466,22 @@ class TestProjectViews:
         body = jq(response)
         assert body('.detail[].loc').first() == ['body', 'code']
 
+    @pytest.mark.parametrize('code', ['export', 'tags'])
+    async def test_create_project_does_not_create_new_project_with_reserved_code(
+        self, client, project_factory, project_crud, jq, code
+    ):
+        project = project_factory.generate(code=code)
+
+        payload = project.to_payload()
+        response = await client.post('/v1/projects/', json=payload)
+
+        assert response.status_code == 422
+        body = jq(response)
+        assert body('.detail[].loc').first() == ['body', 'code']
+
+        with pytest.raises(NotFound):
+            await project_crud.retrieve_by_id_or_code(code)
+
     async def test_create_project_does_not_create_new_project_with_empty_name(
         self, client, minio_container, project_factory, settings, s3_test_client, project_crud, jq
     ):
@@ -379,6 +538,28 @@ class TestProjectViews:
         with pytest.raises(NotFound):
             await project_crud.retrieve_by_id(created_project.id)
 
+    async def test_delete_project_removes_related_resource_requests_and_workbenches(
+        self,
+        client,
+        project_factory,
+        resource_request_factory,
+        workbench_factory,
+        resource_request_crud,
+        workbench_crud,
+    ):
+        created_project = await project_factory.create()
+        created_resource_request = await resource_request_factory.create(project_id=created_project.id)
+        created_workbench = await workbench_factory.create(project_id=created_project.id)
+
+        response = await client.delete(f'/v1/projects/{created_project.id}')
+
+        assert response.status_code == 204
+
+        with pytest.raises(NotFound):
+            await resource_request_crud.retrieve_by_id(created_resource_request.id)
+        with pytest.raises(NotFound):
+            await workbench_crud.retrieve_by_id(created_workbench.id)
+
     async def test_upload_project_logo_calls_put_object_method_and_updates_project_logo_name(
         self, client, jq, s3_test_client, project_factory, fake, settings, project_crud, minio_container
     ):
@@ -443,3 +624,394 @@ class TestProjectViews:
         assert response.json() == {
             'error': [{'code': 'validation_error', 'detail': 'badly formed hexadecimal UUID string', 'source': ['ids']}]
         }
+
+    @pytest.fixture
+    def mock_provisioning_services(self, settings, httpx_mock):
+        def mock(metadata_status_code=200):
+            httpx_mock.add_response(method='POST', url=settings.AUTH_SERVICE + '/v1/user/group', status_code=200)
+            httpx_mock.add_response(
+                method='POST', url=settings.AUTH_SERVICE + '/v1/admin/users/realm-roles', status_code=200
+            )
+            httpx_mock.add_response(method='POST', url=settings.AUTH_SERVICE + '/v1/defaultroles', status_code=200)
+            httpx_mock.add_response(
+                method='POST',
+                url=settings.AUTH_SERVICE + '/v1/admin/roles/users',
+                status_code=200,
+                json={'result': [{'name': 'test'}]},
+            )
+            httpx_mock.add_response(
+                method='POST', url=settings.METADATA_SERVICE + '/v1/items/batch/', status_code=metadata_status_code
+            )
+
+        return mock
+
+    async def test_create_projects_batch_creates_new_projects_and_reports_existing_ones_as_failed(
+        self,
+        client,
+        jq,
+        project_factory,
+        project_crud,
+        s3_test_client,
+        settings,
+        minio_container,
+        minio_client,
+        mock_provisioning_services,
+    ):
+        mock_provisioning_services()
+        existing_project = project_factory.generate(code=(await project_factory.create()).code)
+        new_projects = [project_factory.generate() for _ in range(2)]
+        payload = {'projects': [project.to_payload() for project in [*new_projects, existing_project]]}
+
+        response = await client.post('/v1/projects/batch', json=payload)
+
+        assert response.status_code == 200
+
+        body = jq(response)
+        assert body('.result[].code').all() == [project.code for project in [*new_projects, existing_project]]
+        assert body('.result[].status').all() == ['created', 'created', 'failed']
+        assert body('.result[2].error.code').first() == 'global.already_exists'
+
+        for project in new_projects:
+            await project_crud.retrieve_by_code(project.code)
+            for prefix in settings.S3_BUCKET_ZONE_PREFIXES:
+                assert s3_test_client.check_if_bucket_exists(prefix + '-' + project.code)
+            for role in Roles:
+                assert await minio_client.get_IAM_policy(project.code + '-' + role.value)
+
+    async def test_create_projects_batch_removes_projects_when_provisioning_fails(
+        self,
+        client,
+        jq,
+        project_factory,
+        project_crud,
+        s3_test_client,
+        settings,
+        minio_container,
+        mock_provisioning_services,
+    ):
+        mock_provisioning_services(metadata_status_code=500)
+        projects = [project_factory.generate() for _ in range(2)]
+        payload = {'projects': [project.to_payload() for project in projects]}
+
+        response = await client.post('/v1/projects/batch', json=payload)
+
+        assert response.status_code == 200
+
+        body = jq(response)
+        assert body('.result[].status').all() == ['failed', 'failed']
+        assert body('.result[].error.code').all() == ['global.unhandled_exception'] * 2
+
+        for project in projects:
+            with pytest.raises(NotFound):
+                await project_crud.retrieve_by_code(project.code)
+            for prefix in settings.S3_BUCKET_ZONE_PREFIXES:
+                assert not s3_test_client.check_if_bucket_exists(prefix + '-' + project.code)
+
+    async def test_create_projects_batch_returns_validation_error_when_codes_are_duplicated(
+        self, client, project_factory
+    ):
+        project = project_factory.generate()
+        payload = {'projects': [project.to_payload(), project.to_payload()]}
+
+        response = await client.post('/v1/projects/batch', json=payload)
+
+        assert response.status_code == 422
+
+    async def test_get_project_returns_cached_project_by_code_after_request_by_id(
+        self, client, jq, project_factory, project_cache
+    ):
+        created_project = await project_factory.create()
+        await client.get(f'/v1/projects/{created_project.id}')
+
+        response = await client.get(f'/v1/projects/{created_project.code}')
+
+        assert response.status_code == 200
+        assert jq(response)('.id').first() == str(created_project.id)
+        assert project_cache.misses == 1
+        assert project_cache.hits == 1
+
+    async def test_update_project_invalidates_cached_project(self, client, jq, project_factory, fake):
+        created_project = await project_factory.create()
+        await client.get(f'/v1/projects/{created_project.id}')
+        name = fake.pystr(min_chars=3)
+
+        await client.patch(f'/v1/projects/{created_project.id}', json={'name': name})
+        response = await client.get(f'/v1/projects/{created_project.id}')
+
+        assert jq(response)('.name').first() == name
+
+    async def test_delete_project_invalidates_cached_project(self, client, project_factory):
+        created_project = await project_factory.create()
+        await client.get(f'/v1/projects/{created_project.id}')
+
+        await client.delete(f'/v1/projects/{created_project.id}')
+        response = await client.get(f'/v1/projects/{created_project.id}')
+
+        assert response.status_code == 404
+
+    async def test_resolve_projects_returns_projects_by_ids_and_codes(
+        self, client, jq, project_factory, project_cache, fake
+    ):
+        cached_project, project_by_id, project_by_code = await project_factory.bulk_create(3)
+        await project_cache.set(cached_project)
+        missing_id = str(fake.uuid4())
+        ids_or_codes = [cached_project.code, str(project_by_id.id), project_by_code.code, missing_id, 'missing']
+
+        response = await client.post('/v1/projects/resolve', json={'ids_or_codes': ids_or_codes})
+
+        assert response.status_code == 200
+
+        result = response.json()['result']
+        assert list(result) == ids_or_codes
+        assert result[cached_project.code]['id'] == str(cached_project.id)
+        assert result[str(project_by_id.id)]['code'] == project_by_id.code
+        assert result[project_by_code.code]['id'] == str(project_by_code.id)
+        assert result[missing_id] is None
+        assert result['missing'] is None
+        assert project_cache.hits == 1
+
+    async def test_resolve_projects_returns_results_keyed_by_received_values(self, client, project_factory):
+        project = await project_factory.create()
+        project_id = str(project.id).upper()
+
+        response = await client.post('/v1/projects/resolve', json={'ids_or_codes': [project_id, project_id]})
+
+        assert response.status_code == 200
+        result = response.json()['result']
+        assert list(result) == [project_id]
+        assert result[project_id]['id'] == str(project.id)
+
+    async def test_resolve_projects_returns_validation_error_when_list_is_empty(self, client):
+        response = await client.post('/v1/projects/resolve', json={'ids_or_codes': []})
+
+        assert response.status_code == 422
+
+    async def test_get_project_returns_not_modified_when_etag_matches(self, client, project_factory):
+        created_project = await project_factory.create()
+        response = await client.get(f'/v1/projects/{created_project.id}')
+        etag = response.headers['ETag']
+
+        response = await client.get(f'/v1/projects/{created_project.id}', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+        assert response.content == b''
+
+    async def test_get_project_returns_project_when_etag_does_not_match_after_update(
+        self, client, jq, project_factory, fake
+    ):
+        created_project = await project_factory.create()
+        response = await client.get(f'/v1/projects/{created_project.id}')
+        etag = response.headers['ETag']
+        name = fake.pystr(min_chars=3)
+        await client.patch(f'/v1/projects/{created_project.id}', json={'name': name})
+
+        response = await client.get(f'/v1/projects/{created_project.id}', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert jq(response)('.name').first() == name
+
+    async def test_get_project_returns_not_modified_when_not_modified_since(self, client, project_factory):
+        created_project = await project_factory.create()
+        response = await client.get(f'/v1/projects/{created_project.id}')
+        last_modified = response.headers['Last-Modified']
+
+        response = await client.get(f'/v1/projects/{created_project.id}', headers={'If-Modified-Since': last_modified})
+
+        assert response.status_code == 304
+
+    async def test_list_projects_returns_not_modified_when_etag_matches(self, client, project_factory):
+        await project_factory.bulk_create(3)
+        response = await client.get('/v1/projects/')
+        etag = response.headers['ETag']
+
+        response = await client.get('/v1/projects/', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+
+    async def test_list_projects_ignores_if_modified_since_and_does_not_return_last_modified(
+        self, client, project_factory
+    ):
+        await project_factory.bulk_create(3)
+
+        response = await client.get('/v1/projects/', headers={'If-Modified-Since': 'Fri, 31 Dec 9999 23:59:59 GMT'})
+
+        assert response.status_code == 200
+        assert 'Last-Modified' not in response.headers
+        assert 'ETag' in response.headers
+
+    async def test_list_projects_returns_projects_when_etag_does_not_match_after_deletion(
+        self, client, project_factory
+    ):
+        projects = await project_factory.bulk_create(3)
+        response = await client.get('/v1/projects/')
+        etag = response.headers['ETag']
+        await client.delete(f'/v1/projects/{projects[0].id}')
+
+        response = await client.get('/v1/projects/', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+
+    async def test_list_projects_returns_only_specified_fields(self, client, project_factory):
+        created_project = await project_factory.create(logo_name='logo.png')
+
+        response = await client.get('/v1/projects/', params={'fields': 'code,image_url'})
+
+        assert response.status_code == 200
+        assert 'ETag' in response.headers
+
+        body = response.json()
+        assert body['total'] == 1
+        assert body['result'] == [{'code': created_project.code, 'image_url': body['result'][0]['image_url']}]
+        assert body['result'][0]['image_url'].endswith('/logo.png')
+
+    async def test_list_projects_returns_422_when_fields_are_unknown(self, client):
+        response = await client.get('/v1/projects/', params={'fields': 'code,unknown'})
+
+        assert response.status_code == 422
+
+    async def test_get_project_returns_only_specified_fields_with_etag_differing_from_full_representation(
+        self, client, project_factory
+    ):
+        created_project = await project_factory.create()
+        response = await client.get(f'/v1/projects/{created_project.id}')
+        etag = response.headers['ETag']
+
+        response = await client.get(
+            f'/v1/projects/{created_project.id}', params={'fields': 'name'}, headers={'If-None-Match': etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {'name': created_project.name}
+        assert response.headers['ETag'] != etag
+
+    async def test_export_projects_streams_filtered_projects_as_ndjson(self, client, project_factory):
+        created_project, _ = await project_factory.bulk_create(2)
+
+        response = await client.get('/v1/projects/export', params={'code': created_project.code})
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'] == 'application/x-ndjson'
+
+        lines = response.text.splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])['id'] == str(created_project.id)
+
+    async def test_export_projects_streams_projects_in_chunks_as_csv(
+        self, client, project_factory, override_dependencies, settings
+    ):
+        created_projects = await project_factory.bulk_create(3)
+        chunked_settings = settings.copy(update={'EXPORT_CHUNK_SIZE': 2})
+
+        with override_dependencies({get_settings: lambda: chunked_settings}):
+            response = await client.get('/v1/projects/export', params={'format': 'csv'})
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/csv')
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row['code'] for row in rows] == [
+            project.code for project in sorted(created_projects, key=lambda project: project.id)
+        ]
+
+    async def test_list_projects_caps_page_size_and_returns_link_to_the_next_page(
+        self, client, jq, project_factory, override_dependencies, settings
+    ):
+        created_projects = await project_factory.bulk_create(5)
+        capped_settings = settings.copy(update={'PAGE_SIZE_MAX': 3, 'PAGE_FETCH_CHUNK_SIZE': 2})
+
+        with override_dependencies({get_settings: lambda: capped_settings}):
+            response = await client.get('/v1/projects/', params={'page_size': 100})
+            received_ids = jq(response)('.result[].id').all()
+            link = response.links['next']['url']
+
+            response = await client.get(link)
+            received_ids += jq(response)('.result[].id').all()
+
+        assert response.status_code == 200
+        assert 'next' not in response.links
+        assert sorted(received_ids) == sorted(str(project.id) for project in created_projects)
+
+    async def test_list_projects_returns_projects_matching_search_ranked_by_relevance(
+        self, client, jq, project_factory
+    ):
+        described_project = await project_factory.create(code='other', name='other', description='about genomics')
+        named_project = await project_factory.create(code='genomics', name='Genomics Study', description='')
+        await project_factory.create(code='unrelated', name='unrelated', description='')
+
+        response = await client.get('/v1/projects/', params={'q': 'genom', 'page_size': 2})
+
+        assert response.status_code == 200
+
+        body = jq(response)
+        assert body('.result[].id').all() == [str(named_project.id), str(described_project.id)]
+        assert body('.total').first() == 2
+        assert body('.next_cursor').first() is None
+
+    async def test_list_projects_returns_all_projects_matching_search_on_capped_pages(
+        self, client, jq, project_factory, override_dependencies, settings
+    ):
+        created_projects = [
+            await project_factory.create(code=f'genomics{index}', name='Genomics Study', description='')
+            for index in range(3)
+        ]
+        capped_settings = settings.copy(update={'PAGE_SIZE_MAX': 2})
+
+        with override_dependencies({get_settings: lambda: capped_settings}):
+            first_response = await client.get('/v1/projects/', params={'q': 'genom', 'page_size': 100})
+            second_response = await client.get('/v1/projects/', params={'q': 'genom', 'page_size': 100, 'page': 1})
+
+        first_body = jq(first_response)
+        second_body = jq(second_response)
+        assert first_body('.num_of_pages').first() == 2
+        assert first_body('.next_cursor').first() is None
+        received_ids = first_body('.result[].id').all() + second_body('.result[].id').all()
+        assert sorted(received_ids) == sorted(str(project.id) for project in created_projects)
+
+    async def test_list_projects_returns_projects_matching_all_search_terms(self, client, jq, project_factory):
+        created_project = await project_factory.create(name='Brain imaging study', description='')
+        await project_factory.create(name='Brain atlas', description='')
+
+        response = await client.get('/v1/projects/', params={'q': 'brain, imag'})
+
+        assert jq(response)('.result[].id').all() == [str(created_project.id)]
+
+    async def test_list_projects_returns_projects_with_any_of_tags_specified_in_tags_any_parameter(
+        self, client, jq, project_factory
+    ):
+        first_project = await project_factory.create(tags=['a', 'b'])
+        second_project = await project_factory.create(tags=['c'])
+        await project_factory.create(tags=['d'])
+
+        response = await client.get('/v1/projects/', params={'tags_any': 'b,c', 'sort_by': 'created_at'})
+
+        assert jq(response)('.result[].id').all() == [str(first_project.id), str(second_project.id)]
+
+    @pytest.mark.parametrize('parameter,expected_indexes', [('system_tags_all', [0]), ('system_tags_any', [0, 1])])
+    async def test_list_projects_returns_projects_filtered_by_system_tags(
+        self, parameter, expected_indexes, client, jq, project_factory
+    ):
+        projects = [
+            await project_factory.create(system_tags=['a', 'b']),
+            await project_factory.create(system_tags=['b']),
+            await project_factory.create(system_tags=['c']),
+        ]
+
+        response = await client.get('/v1/projects/', params={parameter: 'a,b', 'sort_by': 'created_at'})
+
+        assert jq(response)('.result[].id').all() == [str(projects[index].id) for index in expected_indexes]
+
+    async def test_count_project_tags_returns_number_of_filtered_projects_per_tag(self, client, project_factory):
+        await project_factory.create(tags=['a', 'b'], system_tags=['s'], is_discoverable=True)
+        await project_factory.create(tags=['b'], system_tags=['s'], is_discoverable=True)
+        await project_factory.create(tags=['c'], system_tags=[], is_discoverable=False)
+
+        response = await client.get('/v1/projects/tags', params={'is_discoverable': True})
+
+        assert response.status_code == 200
+        assert response.json()['result'] == [{'tag': 'b', 'count': 2}, {'tag': 'a', 'count': 1}]
+
+        response = await client.get('/v1/projects/tags', params={'field': 'system_tags'})
+
+        assert response.json()['result'] == [{'tag': 's', 'count': 2}]
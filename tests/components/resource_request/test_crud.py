@@ -0,0 +1,146 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy import text
+
+from project.components.exceptions import NotFound
+from project.components.explain import Explain
+from project.components.pagination import Pagination
+from project.components.resource_request.filtering import ResourceRequestFiltering
+from project.components.resource_request.models import ResourceRequest
+from project.components.resource_request.schemas import ResourceRequestUpdateSchema
+
+
+@pytest.fixture
+def executed_statements(db_engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(db_engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@pytest.fixture
+async def populated_tables(db_session) -> None:
+    """Insert generated projects and resource requests within the test transaction and refresh planner statistics.
+
+    Planner choices on nearly empty tables depend on the statistics left by other tests, so the generated rows make the
+    selective indexes the cheapest option regardless of them.
+    """
+
+    await db_session.execute(
+        text(
+            "INSERT INTO project.projects (id, code, name, description, created_at, updated_at, tags, system_tags, "
+            "is_discoverable) SELECT gen_random_uuid(), 'populated' || n, 'Populated ' || n, '', now(), now(), '{}', "
+            "'{}', true FROM generate_series(1, 1000) AS n"
+        )
+    )
+    await db_session.execute(
+        text(
+            'INSERT INTO project.resource_requests (id, project_id, user_id, username, email, requested_for, '
+            "requested_at, updated_at) SELECT gen_random_uuid(), project.id, 'user' || n, 'user' || n, "
+            "'user' || n || '@example.com', 'SuperSet', now() - n * interval '1 minute', now() "
+            'FROM generate_series(1, 10000) AS n JOIN LATERAL ('
+            "SELECT id FROM project.projects WHERE code = 'populated' || (n % 1000 + 1)"
+            ') AS project ON true'
+        )
+    )
+    await db_session.execute(text('ANALYZE project.projects, project.resource_requests'))
+
+
+def get_plan_values(plan: dict[str, Any], key: str) -> Iterator[Any]:
+    """Yield values of the key from the plan node and all its sub plans."""
+
+    if key in plan:
+        yield plan[key]
+
+    for sub_plan in plan.get('Plans', []):
+        yield from get_plan_values(sub_plan, key)
+
+
+class TestResourceRequestCRUD:
+    async def test_create_returns_entry_with_project_using_single_statement(
+        self, resource_request_crud, resource_request_factory, project_factory, executed_statements
+    ):
+        project = await project_factory.create()
+        resource_request_create = resource_request_factory.generate(project_id=project.id)
+        executed_statements.clear()
+
+        async with resource_request_crud:
+            resource_request = await resource_request_crud.create(resource_request_create)
+
+        assert len([statement for statement in executed_statements if 'resource_requests' in statement]) == 1
+        assert resource_request.project.code == project.code
+
+    async def test_update_returns_updated_entry_with_project_using_single_statement(
+        self, resource_request_crud, resource_request_factory, project_factory, executed_statements, fake
+    ):
+        project = await project_factory.create()
+        created_resource_request = await resource_request_factory.create(project_id=project.id)
+        message = fake.pystr()
+        executed_statements.clear()
+
+        async with resource_request_crud:
+            resource_request = await resource_request_crud.update(
+                created_resource_request.id, ResourceRequestUpdateSchema(message=message)
+            )
+
+        assert len([statement for statement in executed_statements if 'resource_requests' in statement]) == 1
+        assert resource_request.message == message
+        assert resource_request.project.id == created_resource_request.project_id
+
+    async def test_update_raises_not_found_when_entry_does_not_exist(self, resource_request_crud, fake):
+        with pytest.raises(NotFound):
+            await resource_request_crud.update(fake.uuid4(cast_to=None), ResourceRequestUpdateSchema(message='text'))
+
+    async def test_paginate_filtered_by_project_code_counts_entries_within_join(
+        self, resource_request_crud, resource_request_factory, project_factory
+    ):
+        project, other_project = await project_factory.bulk_create(2)
+        await resource_request_factory.create(project_id=project.id)
+        await resource_request_factory.create(project_id=other_project.id)
+        filtering = ResourceRequestFiltering(project_code=project.code)
+
+        page = await resource_request_crud.paginate(Pagination(), filtering=filtering)
+        count = await resource_request_crud.count(filtering)
+
+        assert [entry.project_id for entry in page.entries] == [project.id]
+        assert page.count == count == 1
+
+    async def test_filtering_by_project_code_uses_project_id_requested_at_index(
+        self, resource_request_crud, db_session, populated_tables, fake
+    ):
+        filtering = ResourceRequestFiltering(project_code=fake.pystr())
+        statement = filtering.apply(resource_request_crud.select_query, ResourceRequest)
+        statement = statement.order_by(ResourceRequest.requested_at)
+
+        await db_session.execute(text('SET LOCAL enable_seqscan = off'))
+        result = await resource_request_crud.execute(Explain(statement))
+
+        index_names = set(get_plan_values(result.scalar_one()[0]['Plan'], 'Index Name'))
+        assert 'ix_project_resource_requests_project_id_requested_at' in index_names
+        assert 'ix_project_projects_code' in index_names
+
+    @pytest.mark.parametrize('field', ['username', 'email'])
+    async def test_filtering_by_value_without_wildcards_uses_lowercase_index(
+        self, field, resource_request_crud, db_session, populated_tables, fake
+    ):
+        filtering = ResourceRequestFiltering(**{field: fake.pystr()})
+        statement = filtering.apply(resource_request_crud.select_query, ResourceRequest)
+
+        await db_session.execute(text('SET LOCAL enable_seqscan = off'))
+        result = await resource_request_crud.execute(Explain(statement))
+
+        index_names = set(get_plan_values(result.scalar_one()[0]['Plan'], 'Index Name'))
+        assert f'ix_project_resource_requests_lower_{field}' in index_names
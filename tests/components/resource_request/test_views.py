@@ -4,6 +4,9 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+import csv
+import io
+
 import pytest
 
 from project.components.exceptions import NotFound
@@ -122,6 +125,31 @@ class TestResourceRequestViews:
         assert received_values == expected_values
         assert received_total == 3
 
+    @pytest.mark.parametrize('sort_by', ['completed_at', 'project.name'])
+    @pytest.mark.parametrize('sort_order', SortingOrder.values())
+    async def test_list_resource_requests_returns_next_cursor_that_continues_listing_after_last_entry(
+        self, sort_by, sort_order, client, jq, project_factory, resource_request_factory
+    ):
+        created_resource_requests = []
+        for _ in range(3):
+            created_project = await project_factory.create()
+            created_resource_requests += await resource_request_factory.bulk_create(2, project_id=created_project.id)
+        await resource_request_factory.create(project_id=created_project.id, completed_at=None)
+        params = {'page_size': 2, 'sort_by': sort_by, 'sort_order': sort_order}
+
+        response = await client.get('/v1/resource-requests/', params=params)
+        body = jq(response)
+        received_ids = body('.result[].id').all()
+        next_cursor = body('.next_cursor').first()
+
+        while next_cursor:
+            response = await client.get('/v1/resource-requests/', params=params | {'cursor': next_cursor})
+            body = jq(response)
+            received_ids += body('.result[].id').all()
+            next_cursor = body('.next_cursor').first()
+
+        assert len(received_ids) == len(set(received_ids)) == 7
+
     async def test_create_resource_request_returns_conflict_when_resource_from_same_user_to_same_project_exists(
         self, client, project_factory, resource_request_factory
     ):
@@ -241,3 +269,61 @@ class TestResourceRequestViews:
         response = await client.post('/v1/resource-requests/', json=payload)
 
         assert response.status_code == 200
+
+    async def test_get_resource_request_returns_not_modified_when_etag_matches(
+        self, client, project_factory, resource_request_factory
+    ):
+        created_project = await project_factory.create()
+        created_resource_request = await resource_request_factory.create(project_id=created_project.id)
+        response = await client.get(f'/v1/resource-requests/{created_resource_request.id}')
+        etag = response.headers['ETag']
+
+        response = await client.get(
+            f'/v1/resource-requests/{created_resource_request.id}', headers={'If-None-Match': etag}
+        )
+
+        assert response.status_code == 304
+
+    async def test_get_resource_request_returns_resource_request_when_embedded_project_is_updated(
+        self, client, project_factory, resource_request_factory, fake
+    ):
+        created_project = await project_factory.create()
+        created_resource_request = await resource_request_factory.create(project_id=created_project.id)
+        response = await client.get(f'/v1/resource-requests/{created_resource_request.id}')
+        etag = response.headers['ETag']
+        await client.patch(f'/v1/projects/{created_project.id}', json={'name': fake.pystr(min_chars=3)})
+
+        response = await client.get(
+            f'/v1/resource-requests/{created_resource_request.id}', headers={'If-None-Match': etag}
+        )
+
+        assert response.status_code == 200
+
+    async def test_list_resource_requests_returns_only_specified_fields(
+        self, client, project_factory, resource_request_factory
+    ):
+        created_project = await project_factory.create()
+        created_resource_request = await resource_request_factory.create(project_id=created_project.id)
+
+        response = await client.get('/v1/resource-requests/', params={'fields': 'id,project'})
+
+        assert response.status_code == 200
+
+        (received_resource_request,) = response.json()['result']
+        assert set(received_resource_request) == {'id', 'project'}
+        assert received_resource_request['id'] == str(created_resource_request.id)
+        assert received_resource_request['project']['code'] == created_project.code
+
+    async def test_export_resource_requests_streams_resource_requests_with_flattened_project_as_csv(
+        self, client, project_factory, resource_request_factory
+    ):
+        created_project = await project_factory.create()
+        created_resource_request = await resource_request_factory.create(project_id=created_project.id)
+
+        response = await client.get('/v1/resource-requests/export', params={'format': 'csv'})
+
+        assert response.status_code == 200
+
+        (row,) = csv.DictReader(io.StringIO(response.text))
+        assert row['id'] == str(created_resource_request.id)
+        assert row['project.code'] == created_project.code
@@ -0,0 +1,54 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from project.components.export import export_csv
+from project.components.export import export_ndjson
+from project.components.schemas import BaseSchema
+
+
+class NestedSchema(BaseSchema):
+    code: str
+
+
+class Schema(BaseSchema):
+    name: str
+    tags: list[str]
+    nested: NestedSchema | None
+
+
+async def iterate_chunks(*chunks: list[Any]) -> AsyncIterator[list[Any]]:
+    for chunk in chunks:
+        yield chunk
+
+
+class TestExport:
+    async def test_export_ndjson_yields_one_block_of_lines_per_chunk(self):
+        chunks = iterate_chunks(
+            [Schema(name='a', tags=[], nested=None), Schema(name='b', tags=['t'], nested=None)],
+            [Schema(name='c', tags=[], nested=NestedSchema(code='n'))],
+        )
+
+        blocks = [block async for block in export_ndjson(chunks, Schema)]
+
+        assert blocks == [
+            b'{"name":"a","tags":[],"nested":null}\n{"name":"b","tags":["t"],"nested":null}\n',
+            b'{"name":"c","tags":[],"nested":{"code":"n"}}\n',
+        ]
+
+    async def test_export_csv_yields_header_with_flattened_nested_fields(self):
+        chunks = iterate_chunks([Schema(name='a', tags=['t'], nested=NestedSchema(code='n'))])
+
+        blocks = [block async for block in export_csv(chunks, Schema)]
+
+        assert b''.join(blocks).decode().splitlines() == ['name,tags,nested.code', 'a,"[""t""]",n']
+
+    async def test_export_csv_yields_only_header_when_there_are_no_entries(self):
+        blocks = [block async for block in export_csv(iterate_chunks(), Schema)]
+
+        assert blocks == [b'name,tags,nested.code\r\n']
@@ -0,0 +1,47 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from starlette.datastructures import URL
+
+from project.components.pagination import Page
+from project.components.pagination import Pagination
+from project.components.pagination import get_next_page_link
+
+
+class TestPagination:
+    def test_limit_and_offset_are_capped_by_max_page_size(self):
+        pagination = Pagination(page=2, page_size=100, max_page_size=10)
+
+        assert pagination.limit == 10
+        assert pagination.offset == 20
+        assert pagination.is_capped is True
+
+    def test_fetch_chunk_size_is_set_only_when_limit_exceeds_chunk_size(self):
+        assert Pagination(page_size=10, chunk_size=10).fetch_chunk_size is None
+        assert Pagination(page_size=11, chunk_size=10).fetch_chunk_size == 10
+        assert Pagination(page_size=11).fetch_chunk_size is None
+
+
+class TestPage:
+    def test_total_pages_is_calculated_using_capped_page_size(self):
+        page = Page(pagination=Pagination(page_size=100, max_page_size=10), count=25, entries=[])
+
+        assert page.total_pages == 3
+
+
+class TestGetNextPageLink:
+    def test_returns_link_with_cursor_replacing_page_parameter(self):
+        page = Page(pagination=Pagination(), count=None, entries=[], next_cursor='next')
+        url = URL('https://project/v1/projects/?page=3&page_size=5000')
+
+        link = get_next_page_link(url, page)
+
+        assert link == '<https://project/v1/projects/?page_size=5000&cursor=next>; rel="next"'
+
+    def test_returns_none_when_there_is_no_next_cursor(self):
+        page = Page(pagination=Pagination(), count=None, entries=[])
+
+        assert get_next_page_link(URL('https://project/v1/projects/'), page) is None
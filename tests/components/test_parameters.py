@@ -6,7 +6,13 @@
 
 import inspect
 
+import pytest
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+from project.components.pagination import Cursor
 from project.components.pagination import Pagination
+from project.components.parameters import FieldsParameters
 from project.components.parameters import PageParameters
 from project.components.parameters import SortByFields
 from project.components.parameters import SortParameters
@@ -24,6 +30,18 @@ class TestPageParameters:
         assert pagination.page == page
         assert pagination.page_size == page_size
 
+    def test_to_pagination_returns_instance_of_pagination_with_decoded_cursor(self, fake):
+        cursor = Cursor(field='code', key=fake.pystr(), id=fake.uuid4())
+        page_parameters = PageParameters(cursor=cursor.encode())
+
+        pagination = page_parameters.to_pagination()
+
+        assert pagination.cursor == cursor
+
+    def test_cursor_raises_validation_error_for_invalid_value(self):
+        with pytest.raises(ValidationError):
+            PageParameters(cursor='invalid')
+
 
 class TestSortParameters:
     def test_with_sort_by_fields_returns_a_class_with_overridden_type_annotation_for_sort_by_field(self):
@@ -45,3 +63,29 @@ class TestSortParameters:
         annotations = inspect.get_annotations(SortParameters)
 
         assert annotations['sort_by'] == str | None
+
+
+class TestFieldsParameters:
+    def test_to_fields_returns_unique_fields_available_in_schema(self):
+        class Schema(BaseModel):
+            id: str
+            name: str
+
+        fields_parameters = FieldsParameters.with_schema(Schema)(fields='name, id,name')
+
+        assert fields_parameters.to_fields() == ['name', 'id']
+
+    def test_to_fields_returns_none_when_fields_are_not_specified(self):
+        class Schema(BaseModel):
+            id: str
+
+        fields_parameters = FieldsParameters.with_schema(Schema)()
+
+        assert fields_parameters.to_fields() is None
+
+    def test_fields_raises_validation_error_for_field_missing_in_schema(self):
+        class Schema(BaseModel):
+            id: str
+
+        with pytest.raises(ValidationError):
+            FieldsParameters.with_schema(Schema)(fields='id,unknown')
@@ -0,0 +1,83 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import asyncio
+
+import pytest
+
+from project.components.pipeline import Pipeline
+
+
+class TestPipeline:
+    def test_add_step_raises_error_when_dependency_is_unknown(self):
+        pipeline = Pipeline()
+
+        with pytest.raises(ValueError):
+            pipeline.add_step('second', asyncio.sleep, depends_on=['first'])
+
+    async def test_run_starts_independent_steps_concurrently(self):
+        started = []
+        both_started = asyncio.Event()
+
+        async def step(name):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return name
+
+        pipeline = Pipeline()
+        pipeline.add_step('first', lambda: step('first'))
+        pipeline.add_step('second', lambda: step('second'))
+
+        results = await pipeline.run()
+
+        assert results == {'first': 'first', 'second': 'second'}
+
+    async def test_run_starts_step_after_its_dependencies_with_their_results(self):
+        calls = []
+
+        async def first():
+            await asyncio.sleep(0.01)
+            calls.append('first')
+            return 1
+
+        async def second():
+            calls.append('second')
+            return pipeline.results['first'] + 1
+
+        pipeline = Pipeline()
+        pipeline.add_step('first', first)
+        pipeline.add_step('second', second, depends_on=['first'])
+
+        results = await pipeline.run()
+
+        assert calls == ['first', 'second']
+        assert results['second'] == 2
+
+    async def test_run_skips_not_started_steps_and_waits_for_running_ones_when_step_fails(self):
+        calls = []
+
+        async def failing():
+            await asyncio.sleep(0)
+            raise RuntimeError('failure')
+
+        async def running():
+            await asyncio.sleep(0.01)
+            calls.append('running')
+
+        async def dependent():
+            calls.append('dependent')
+
+        pipeline = Pipeline()
+        pipeline.add_step('failing', failing)
+        pipeline.add_step('running', running)
+        pipeline.add_step('dependent', dependent, depends_on=['running'])
+
+        with pytest.raises(RuntimeError, match='failure'):
+            await pipeline.run()
+
+        assert calls == ['running']
@@ -0,0 +1,32 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import json
+from uuid import UUID
+
+from project.components.responses import FastJSONResponse
+from project.components.sorting import SortingOrder
+
+
+class DriverUUID(UUID):
+    """UUID subclass similar to the one returned by database driver."""
+
+
+class TestFastJSONResponse:
+    def test_render_encodes_uuids_datetimes_and_enums(self, fake):
+        id_ = DriverUUID(fake.uuid4())
+        created_at = fake.past_datetime()
+        content = {'id': id_, 'created_at': created_at, 'order': SortingOrder.ASC, 'tags': ['a'], 'name': 'ñ'}
+
+        response = FastJSONResponse(content)
+
+        assert json.loads(response.body) == {
+            'id': str(id_),
+            'created_at': created_at.isoformat(),
+            'order': 'asc',
+            'tags': ['a'],
+            'name': 'ñ',
+        }
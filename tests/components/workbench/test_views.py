@@ -103,3 +103,36 @@ class TestWorkbenchViews:
 
         with pytest.raises(NotFound):
             await workbench_crud.retrieve_by_id(created_workbench.id)
+
+    async def test_get_workbench_returns_not_modified_when_etag_matches(
+        self, client, project_factory, workbench_factory
+    ):
+        created_project = await project_factory.create()
+        created_workbench = await workbench_factory.create(project_id=created_project.id)
+        response = await client.get(f'/v1/workbenches/{created_workbench.id}')
+        etag = response.headers['ETag']
+
+        response = await client.get(f'/v1/workbenches/{created_workbench.id}', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+
+    async def test_list_workbenches_returns_not_modified_when_etag_matches(
+        self, client, project_factory, workbench_factory
+    ):
+        created_project = await project_factory.create()
+        await workbench_factory.create(project_id=created_project.id)
+        response = await client.get('/v1/workbenches/')
+        etag = response.headers['ETag']
+
+        response = await client.get('/v1/workbenches/', headers={'If-None-Match': f'"other", {etag}'})
+
+        assert response.status_code == 304
+
+    async def test_get_workbench_returns_only_specified_fields(self, client, project_factory, workbench_factory):
+        created_project = await project_factory.create()
+        created_workbench = await workbench_factory.create(project_id=created_project.id)
+
+        response = await client.get(f'/v1/workbenches/{created_workbench.id}', params={'fields': 'id,resource'})
+
+        assert response.status_code == 200
+        assert response.json() == {'id': str(created_workbench.id), 'resource': created_workbench.resource}
@@ -14,4 +14,5 @@ pytest_plugins = [
     'tests.fixtures.jq',
     'tests.fixtures.s3',
     'tests.fixtures.policy',
+    'tests.fixtures.tracing',
 ]
@@ -5,10 +5,13 @@
 # You may not use this file except in compliance with the License.
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from project.config import get_settings
 from project.dependencies.db import GetDBEngine
+from project.dependencies.db import add_after_commit_callback
+from project.dependencies.db import get_db_session
 
 
 @pytest.fixture
@@ -24,3 +27,58 @@ class TestGetDBEngine:
         db_engine = await get_db_engine(settings=get_settings())
         assert db_engine is get_db_engine.instance
         assert isinstance(db_engine, AsyncEngine)
+
+    async def test_call_returns_an_instance_of_async_engine_with_pool_configured_from_settings(self, get_db_engine):
+        settings = get_settings().copy(update={'RDS_POOL_SIZE': 3, 'RDS_POOL_MAX_OVERFLOW': 4, 'RDS_POOL_TIMEOUT': 7})
+
+        db_engine = await get_db_engine(settings=settings)
+
+        assert db_engine.pool.size() == 3
+        assert db_engine.pool._max_overflow == 4
+        assert db_engine.pool._timeout == 7
+
+    async def test_warm_up_opens_pool_connections_in_advance(self, get_db_engine, settings):
+        db_engine = await get_db_engine(settings=settings)
+
+        await get_db_engine.warm_up(2)
+
+        assert db_engine.pool.checkedin() == 2
+        assert db_engine.pool.checkedout() == 0
+
+        await get_db_engine.dispose()
+
+    async def test_warm_up_does_not_open_more_connections_than_pool_size(self, get_db_engine, settings):
+        db_engine = await get_db_engine(settings=settings.copy(update={'RDS_POOL_SIZE': 1}))
+
+        await get_db_engine.warm_up(3)
+
+        assert db_engine.pool.checkedin() == 1
+
+        await get_db_engine.dispose()
+
+    async def test_dispose_drops_an_instance_of_async_engine(self, get_db_engine):
+        await get_db_engine(settings=get_settings())
+
+        await get_db_engine.dispose()
+
+        assert get_db_engine.instance is None
+
+
+class TestGetDBSession:
+    async def test_after_commit_callbacks_are_awaited_once_transaction_is_committed(self, db_engine):
+        in_transaction = []
+
+        async def callback():
+            in_transaction.append(session.in_transaction())
+
+        db_session = get_db_session(db_engine)
+        session = await db_session.__anext__()
+        await session.execute(text('SELECT 1'))
+        add_after_commit_callback(session, callback)
+
+        assert in_transaction == []
+
+        with pytest.raises(StopAsyncIteration):
+            await db_session.__anext__()
+
+        assert in_transaction == [False]
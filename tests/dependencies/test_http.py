@@ -0,0 +1,56 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import pytest
+
+from project.dependencies.http import HTTPClientRegistry
+from project.tracing import inject_trace_context
+
+
+@pytest.fixture
+def http_client_registry() -> HTTPClientRegistry:
+    yield HTTPClientRegistry()
+
+
+class TestHTTPClientRegistry:
+    async def test_get_returns_the_same_client_for_the_same_upstream(self, http_client_registry, settings):
+        client = http_client_registry.get('auth', settings, 10)
+
+        assert http_client_registry.get('auth', settings, 10) is client
+
+        await http_client_registry.close()
+
+    async def test_get_returns_separate_clients_for_different_upstreams(self, http_client_registry, settings):
+        auth_client = http_client_registry.get('auth', settings, 10)
+        metadata_client = http_client_registry.get('metadata', settings, 10)
+
+        assert auth_client is not metadata_client
+
+        await http_client_registry.close()
+
+    async def test_get_returns_client_with_timeout_from_settings(self, http_client_registry, settings):
+        client = http_client_registry.get('auth', settings, 10)
+
+        assert client.timeout.read == settings.SERVICE_CLIENT_TIMEOUT
+
+        await http_client_registry.close()
+
+    async def test_get_returns_client_propagating_trace_context_when_tracing_is_enabled(
+        self, http_client_registry, settings
+    ):
+        client = http_client_registry.get('auth', settings.copy(update={'OPEN_TELEMETRY_ENABLED': True}), 10)
+
+        assert client.event_hooks['request'] == [inject_trace_context]
+
+        await http_client_registry.close()
+
+    async def test_close_closes_all_clients(self, http_client_registry, settings):
+        client = http_client_registry.get('auth', settings, 10)
+
+        await http_client_registry.close()
+
+        assert client.is_closed
+        assert http_client_registry.instances == {}
@@ -4,7 +4,9 @@
 # Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
 # You may not use this file except in compliance with the License.
 
+from project.components.object_storage.s3 import S3Client
 from project.dependencies import get_s3_client
+from project.dependencies.s3 import GetS3Client
 
 
 class TestS3Client:
@@ -27,3 +29,50 @@ class TestS3Client:
         filename = fake.file_name(extension='png')
         await s3_client.put_object('file-bucket', filename, image)
         assert s3_test_client.check_if_file_exists('file-bucket', filename)
+
+    async def test_s3_client_creates_bucket_without_long_lived_connection(
+        self, settings, minio_container, s3_test_client
+    ):
+        s3_client = await S3Client.initialize(
+            f'{settings.S3_HOST}:{settings.S3_PORT}', settings.S3_ACCESS_KEY, settings.S3_SECRET_KEY
+        )
+        await s3_client.create_bucket('short-lived-bucket')
+        assert s3_client.client is None
+        assert s3_test_client.check_if_bucket_exists('short-lived-bucket')
+
+    async def test_connect_opens_long_lived_client_for_each_boto_client(self, settings):
+        s3_client = await S3Client.initialize(
+            f'{settings.S3_HOST}:{settings.S3_PORT}', settings.S3_ACCESS_KEY, settings.S3_SECRET_KEY, https=True
+        )
+
+        await s3_client.connect(max_pool_connections=5)
+
+        assert s3_client.client.meta.endpoint_url == s3_client.boto_client.endpoint
+        assert s3_client.client.meta.endpoint_url.startswith('https://')
+        assert s3_client.admin_client.meta.endpoint_url == s3_client.boto_admin_client.endpoint
+        assert s3_client.client.meta.config.max_pool_connections == 5
+
+        await s3_client.close()
+
+
+class TestGetS3Client:
+    async def test_call_returns_the_same_connected_instance_of_s3_client(self, settings):
+        get_s3_client = GetS3Client()
+
+        s3_client = await get_s3_client(settings)
+
+        assert s3_client is await get_s3_client(settings)
+        assert s3_client.client is not None
+        assert s3_client.admin_client is not None
+
+        await get_s3_client.close()
+
+    async def test_close_closes_connections_and_drops_instance_of_s3_client(self, settings):
+        get_s3_client = GetS3Client()
+        s3_client = await get_s3_client(settings)
+
+        await get_s3_client.close()
+
+        assert s3_client.client is None
+        assert s3_client.admin_client is None
+        assert get_s3_client.instance is None
@@ -15,9 +15,11 @@ from fastapi import FastAPI
 from httpx import AsyncClient
 
 from project.app import create_app
+from project.components.project.dependencies import get_project_cache
 from project.config import Settings
 from project.config import get_settings
 from project.dependencies import get_db_session
+from project.dependencies import run_after_commit_callbacks
 
 
 class OverrideDependencies(AbstractContextManager):
@@ -70,10 +72,16 @@ def settings(db_port) -> Settings:
 
 
 @pytest.fixture
-def app(event_loop, settings, db_session) -> FastAPI:
+def app(event_loop, settings, db_session, project_cache) -> FastAPI:
     app = create_app()
     app.dependency_overrides[get_settings] = lambda: settings
-    app.dependency_overrides[get_db_session] = lambda: db_session
+
+    async def get_test_db_session():
+        yield db_session
+        await run_after_commit_callbacks(db_session)
+
+    app.dependency_overrides[get_db_session] = get_test_db_session
+    app.dependency_overrides[get_project_cache] = lambda: project_cache
     yield app
 
 
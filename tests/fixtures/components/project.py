@@ -10,6 +10,8 @@ import pytest
 
 from project.components import ModelList
 from project.components import Project
+from project.components.cache import InMemoryCacheBackend
+from project.components.project.cache import ProjectCache
 from project.components.project.crud import ProjectCRUD
 from project.components.project.schemas import ProjectSchema
 from tests.fixtures.components._base_factory import BaseFactory
@@ -103,3 +105,8 @@ def project_crud(db_session) -> ProjectCRUD:
 @pytest.fixture
 def project_factory(project_crud, fake) -> ProjectFactory:
     yield ProjectFactory(project_crud, fake)
+
+
+@pytest.fixture
+def project_cache(settings) -> ProjectCache:
+    yield ProjectCache(InMemoryCacheBackend(settings.PROJECT_CACHE_SIZE, settings.PROJECT_CACHE_TTL))
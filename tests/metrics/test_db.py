@@ -0,0 +1,45 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from project.dependencies.db import create_db_engine
+from project.metrics.db import get_statement_operation
+
+
+class TestDBMetrics:
+    @pytest.mark.parametrize(
+        'statement,expected_operation',
+        [
+            ('SELECT 1', 'SELECT'),
+            ('\n  insert into projects values (1)', 'INSERT'),
+            ('VACUUM projects', 'OTHER'),
+            ('', 'OTHER'),
+        ],
+    )
+    def test_get_statement_operation_returns_leading_keyword(self, statement, expected_operation):
+        assert get_statement_operation(statement) == expected_operation
+
+    async def test_engine_records_statement_durations_and_pool_connections(self, settings):
+        engine = create_db_engine(settings)
+        statements = REGISTRY.get_sample_value('db_statement_duration_seconds_count', {'operation': 'SELECT'}) or 0
+        checkouts = REGISTRY.get_sample_value('db_pool_checkout_duration_seconds_count') or 0
+
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text('SELECT 1'))
+
+                assert REGISTRY.get_sample_value('db_pool_connections', {'state': 'checked_out'}) == 1
+
+            assert REGISTRY.get_sample_value('db_pool_connections', {'state': 'checked_out'}) == 0
+            assert REGISTRY.get_sample_value('db_pool_connections', {'state': 'idle'}) == 1
+        finally:
+            await engine.dispose()
+
+        assert REGISTRY.get_sample_value('db_statement_duration_seconds_count', {'operation': 'SELECT'}) > statements
+        assert REGISTRY.get_sample_value('db_pool_checkout_duration_seconds_count') == checkouts + 1
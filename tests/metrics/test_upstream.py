@@ -0,0 +1,55 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import pytest
+from opentelemetry.trace import SpanKind
+from prometheus_client import REGISTRY
+
+from project.metrics import observe_upstream
+
+
+def get_sample_value(name: str, operation: str) -> float:
+    return REGISTRY.get_sample_value(name, {'service': 'test', 'operation': operation}) or 0
+
+
+class TestObserveUpstream:
+    async def test_decorator_records_duration_of_successful_call(self):
+        @observe_upstream('test')
+        async def succeeding_call() -> str:
+            return 'result'
+
+        count = get_sample_value('upstream_request_duration_seconds_count', 'succeeding_call')
+
+        result = await succeeding_call()
+
+        assert result == 'result'
+        assert get_sample_value('upstream_request_duration_seconds_count', 'succeeding_call') == count + 1
+        assert get_sample_value('upstream_request_errors_total', 'succeeding_call') == 0
+
+    async def test_decorator_records_duration_and_error_of_failed_call(self):
+        @observe_upstream('test')
+        async def failing_call() -> None:
+            raise ValueError
+
+        count = get_sample_value('upstream_request_duration_seconds_count', 'failing_call')
+        errors = get_sample_value('upstream_request_errors_total', 'failing_call')
+
+        with pytest.raises(ValueError):
+            await failing_call()
+
+        assert get_sample_value('upstream_request_duration_seconds_count', 'failing_call') == count + 1
+        assert get_sample_value('upstream_request_errors_total', 'failing_call') == errors + 1
+
+    async def test_decorator_traces_call_as_client_span(self, span_exporter):
+        @observe_upstream('test')
+        async def traced_call() -> None:
+            return None
+
+        await traced_call()
+
+        [span] = span_exporter.get_finished_spans()
+        assert span.name == 'test traced_call'
+        assert span.kind == SpanKind.CLIENT
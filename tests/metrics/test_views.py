@@ -0,0 +1,37 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+from prometheus_client import REGISTRY
+
+
+class TestMetricsViews:
+    async def test_get_metrics_returns_metrics_in_prometheus_text_format(self, client):
+        response = await client.get('/v1/metrics')
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/plain')
+        assert 'http_request_duration_seconds' in response.text
+
+    async def test_requests_are_recorded_by_route_template(self, client, project_factory):
+        project = await project_factory.create()
+        labels = {'method': 'GET', 'route': '/v1/projects/{project_id}', 'status': '200'}
+        count = REGISTRY.get_sample_value('http_request_duration_seconds_count', labels) or 0
+
+        response = await client.get(f'/v1/projects/{project.id}')
+
+        assert response.status_code == 200
+        assert REGISTRY.get_sample_value('http_request_duration_seconds_count', labels) == count + 1
+        response_size = REGISTRY.get_sample_value(
+            'http_response_size_bytes_sum', {'method': 'GET', 'route': '/v1/projects/{project_id}'}
+        )
+        assert response_size >= len(response.content)
+
+    async def test_requests_for_unknown_paths_are_recorded_without_path(self, client):
+        await client.get('/v1/unknown/path')
+
+        labels = {'method': 'GET', 'route': '<unmatched>', 'status': '404'}
+        assert REGISTRY.get_sample_value('http_request_duration_seconds_count', labels) >= 1
+        assert REGISTRY.get_sample_value('http_requests_in_progress', {'method': 'GET', 'route': '<unmatched>'}) == 0
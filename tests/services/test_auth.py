@@ -5,18 +5,22 @@
 # You may not use this file except in compliance with the License.
 
 import json
+from collections.abc import AsyncIterator
 
+import httpx
 import pytest
 
 from project.components.exceptions import ServiceNotAvailable
 from project.components.exceptions import UnhandledException
 from project.config import Settings
 from project.services.auth import AuthClient
+from project.services.auth import get_auth_client
 
 
 @pytest.fixture
-def auth_client(settings: Settings) -> AuthClient:
-    return AuthClient(settings.AUTH_SERVICE, settings.SERVICE_CLIENT_TIMEOUT)
+async def auth_client(settings: Settings) -> AsyncIterator[AuthClient]:
+    async with httpx.AsyncClient(timeout=settings.SERVICE_CLIENT_TIMEOUT) as client:
+        yield AuthClient(settings.AUTH_SERVICE, settings.SERVICE_CLIENT_TIMEOUT, client)
 
 
 class TestAuthClient:
@@ -95,3 +99,6 @@ class TestAuthClient:
         project_code = 'test_project'
         with pytest.raises(ServiceNotAvailable):
             await auth_client.create_default_permissions(project_code)
+
+    async def test_get_auth_client_returns_clients_sharing_the_same_http_client(self, settings):
+        assert get_auth_client(settings).client is get_auth_client(settings).client
@@ -5,18 +5,22 @@
 # You may not use this file except in compliance with the License.
 
 import json
+from collections.abc import AsyncIterator
 
+import httpx
 import pytest
 
 from project.components.exceptions import ServiceNotAvailable
 from project.components.exceptions import UnhandledException
 from project.config import Settings
 from project.services.metadata import MetadataClient
+from project.services.metadata import get_metadata_client
 
 
 @pytest.fixture
-def metadata_client(settings: Settings) -> MetadataClient:
-    return MetadataClient(settings.METADATA_SERVICE, settings.SERVICE_CLIENT_TIMEOUT)
+async def metadata_client(settings: Settings) -> AsyncIterator[MetadataClient]:
+    async with httpx.AsyncClient(timeout=settings.SERVICE_CLIENT_TIMEOUT) as client:
+        yield MetadataClient(settings.METADATA_SERVICE, settings.SERVICE_CLIENT_TIMEOUT, client)
 
 
 class TestMetadataClient:
@@ -38,3 +42,6 @@ class TestMetadataClient:
     async def test_create_users_name_folders_raises_exception_on_timeout_from_metadata(self, metadata_client):
         with pytest.raises(ServiceNotAvailable):
             await metadata_client.create_users_name_folders([{'name': 'test'}], 'test_code')
+
+    async def test_get_metadata_client_returns_clients_sharing_the_same_http_client(self, settings):
+        assert get_metadata_client(settings).client is get_metadata_client(settings).client
@@ -0,0 +1,56 @@
+# Copyright (C) 2022-Present Indoc Systems
+#
+# Licensed under the GNU AFFERO GENERAL PUBLIC LICENSE,
+# Version 3.0 (the "License") available at https://www.gnu.org/licenses/agpl-3.0.en.html.
+# You may not use this file except in compliance with the License.
+
+import httpx
+import pytest
+from opentelemetry.trace import StatusCode
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from project.tracing import inject_trace_context
+from project.tracing import trace_db_engine
+from project.tracing import tracer
+
+
+@pytest.fixture
+async def traced_db_engine(settings):
+    engine = create_async_engine(settings.RDS_DB_URI)
+    trace_db_engine(engine.sync_engine)
+
+    yield engine
+
+    await engine.dispose()
+
+
+class TestTracing:
+    async def test_inject_trace_context_adds_traceparent_header_of_current_span(self, span_exporter):
+        request = httpx.Request('GET', 'http://auth.utility/v1/')
+
+        with tracer.start_as_current_span('parent') as span:
+            await inject_trace_context(request)
+
+        trace_id = format(span.get_span_context().trace_id, '032x')
+        assert request.headers['traceparent'].split('-')[1] == trace_id
+
+    async def test_trace_db_engine_traces_statements_as_child_spans(self, traced_db_engine, span_exporter):
+        with tracer.start_as_current_span('parent') as parent:
+            async with traced_db_engine.connect() as connection:
+                await connection.execute(text('SELECT 1'))
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+
+        assert spans['SELECT'].parent.span_id == parent.get_span_context().span_id
+        assert spans['SELECT'].attributes['db.statement'] == 'SELECT 1'
+
+    async def test_trace_db_engine_marks_failed_statement_spans(self, traced_db_engine, span_exporter):
+        with pytest.raises(ProgrammingError):
+            async with traced_db_engine.connect() as connection:
+                await connection.execute(text('SELECT * FROM unknown_table'))
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+
+        assert spans['SELECT'].status.status_code == StatusCode.ERROR